@@ -38,13 +38,13 @@ cdef extern from "fff_vector.h":
 
     fff_vector* fff_vector_new(size_t n)
     void fff_vector_delete(fff_vector* x)
-    fff_vector fff_vector_view(double* data, size_t size, size_t stride)
+    fff_vector fff_vector_view(double* data, size_t size, size_t stride) nogil
     double fff_vector_get(fff_vector * x, size_t i)
     void fff_vector_set(fff_vector * x, size_t i, double a)
     void fff_vector_set_all(fff_vector * x, double a) 
     void fff_vector_scale(fff_vector * x, double a) 
     void fff_vector_add_constant(fff_vector * x, double a)
-    void fff_vector_memcpy(fff_vector* x, fff_vector* y)
+    void fff_vector_memcpy(fff_vector* x, fff_vector* y) nogil
     void fff_vector_fetch(fff_vector* x, void* data, fff_datatype datatype, size_t stride) 
     void fff_vector_add(fff_vector * x, fff_vector * y)
     void fff_vector_sub(fff_vector * x, fff_vector * y)
@@ -168,7 +168,7 @@ cdef extern from "fffpy.h":
     void fff_vector_fetch_using_NumPy(fff_vector* y, char* data, npy_intp stride, int type, int itemsize)
     fffpy_multi_iterator* fffpy_multi_iterator_new(int narr, int axis, ...) 
     void fffpy_multi_iterator_delete(fffpy_multi_iterator* thisone)
-    void fffpy_multi_iterator_update(fffpy_multi_iterator* thisone)
+    void fffpy_multi_iterator_update(fffpy_multi_iterator* thisone) nogil
     void fffpy_multi_iterator_reset(fffpy_multi_iterator* thisone)
 
     
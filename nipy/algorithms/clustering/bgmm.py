@@ -20,8 +20,8 @@ from scipy.linalg import inv, cholesky, eigvalsh
 from scipy.special import gammaln
 import math
 
-from .clustering import kmeans
-from gmm import GMM
+from .clustering import kmeans, _cluster_sums
+from gmm import GMM, log_normal_density, logsumexp, _weighted_scatter
 
 ##################################################################
 # ancillary functions ############################################
@@ -511,8 +511,8 @@ class BGMM(GMM):
         -------
         hist : array shape (self.k) count variable
         """
-        hist = np.array([np.sum(z == k) for k in range(self.k)])
-        return hist
+        return _cluster_sums(np.zeros((np.size(z), 0)), z,
+                             self.k)[1].astype(np.int)
 
     def update_weights(self, z):
         """
@@ -542,13 +542,10 @@ class BGMM(GMM):
         """
         pop = self.pop(z)
         self.shrinkage = self.prior_shrinkage + pop
-        empmeans = np.zeros(np.shape(self.means))
+        empmeans, _ = _cluster_sums(x, z, self.k)
         prior_shrinkage = np.reshape(self.prior_shrinkage, (self.k, 1))
         shrinkage = np.reshape(self.shrinkage, (self.k, 1))
 
-        for k in range(self.k):
-            empmeans[k] = np.sum(x[z == k], 0)
-
         means = empmeans + self.prior_means * prior_shrinkage
         means /= shrinkage
         for k in range(self.k):
@@ -573,14 +570,20 @@ class BGMM(GMM):
         rpop = pop + (pop == 0)
         self._detp = np.zeros(self.k)
 
-        for k in range(self.k):
-            # empirical means
-            empmeans = np.sum(x[z == k], 0) / rpop[k]
-            dm = np.reshape(empmeans - self.prior_means[k], (1, self.dim))
+        # empirical means
+        sums, counts = _cluster_sums(x, z, self.k)
+        empmeans = sums / np.reshape(rpop, (self.k, 1))
 
-            # scatter
-            dx = np.reshape(x[z == k] - empmeans, (pop[k], self.dim))
+        # the samples are sorted by cluster once, so that the scatter
+        # matrix of each cluster is computed from its own samples
+        valid = np.nonzero((z > - 1) & (z < self.k))[0]
+        order = valid[np.argsort(z[valid], kind='mergesort')]
+        bounds = np.concatenate(([0], np.cumsum(counts))).astype(np.int)
+
+        for k in range(self.k):
+            dx = x[order[bounds[k]:bounds[k + 1]]] - empmeans[k]
             scatter = np.dot(dx.T, dx)
+            dm = np.reshape(empmeans[k] - self.prior_means[k], (1, self.dim))
 
             # bias
             addcov = np.dot(dm.T, dm) * self.prior_shrinkage[k]
@@ -608,21 +611,22 @@ class BGMM(GMM):
         self.update_precisions(x, z)
         self.update_means(x, z)
 
-    def sample_indicator(self, like):
+    def sample_indicator(self, log_like):
         """
         sample the indicator from the likelihood
 
         Parameters
         ----------
-        like: array of shape (nb_samples,self.k)
-           component-wise likelihood
+        log_like: array of shape (nb_samples,self.k)
+           component-wise log-likelihood, as returned by
+           self.log_likelihood
 
         Returns
         -------
         z: array of shape(nb_samples): a draw of the membership variable
         """
         tiny = 1 + 1.e-15
-        like = (like.T / like.sum(1)).T
+        like = np.exp(log_like - logsumexp(log_like)[:, np.newaxis])
         like /= tiny
         z = multinomial(like)
         return z
@@ -656,8 +660,8 @@ class BGMM(GMM):
         bpz = - np.infty
 
         for i in range(niter):
-            like = self.likelihood(x)
-            sll = np.mean(np.log(np.sum(like, 1)))
+            log_like = self.log_likelihood(x)
+            sll = np.mean(logsumexp(log_like))
             sll += np.log(self.probability_under_prior())
             if sll > score:
                 score = sll
@@ -665,7 +669,7 @@ class BGMM(GMM):
                 best_means = self.means.copy()
                 best_precisions = self.precisions.copy()
 
-            z = self.sample_indicator(like)
+            z = self.sample_indicator(log_like)
             if mem:
                 possibleZ[:, i] = z
             puz = sll # to save time
@@ -710,8 +714,7 @@ class BGMM(GMM):
         ameans = np.zeros(np.shape(self.means))
 
         for i in range(niter):
-            like = self.likelihood(x)
-            z = self.sample_indicator(like)
+            z = self.sample_indicator(self.log_likelihood(x))
             self.update(x, z)
             aprec += self.precisions
             aweights += self.weights
@@ -857,11 +860,11 @@ class BGMM(GMM):
         p = np.array(p)
         mp = np.mean(p)
         p0 = self.probability_under_prior()
-        like = self.likelihood(x)
-        bf = np.log(p0) + np.sum(np.log(np.sum(like, 1))) - np.log(mp)
+        sll = np.sum(logsumexp(self.log_likelihood(x)))
+        bf = np.log(p0) + sll - np.log(mp)
 
         if verbose:
-            print np.log(p0), np.sum(np.log(np.sum(like, 1))), np.log(mp)
+            print np.log(p0), sll, np.log(mp)
         return bf
 
 
@@ -894,29 +897,38 @@ class VBGMM(BGMM):
         like: array of shape(nb_samples,self.k),
               component-wise likelihood
         """
-        n = x.shape[0]
-        like = np.zeros((n, self.k))
-        from scipy.special import psi
+        return np.exp(self.log_likelihood(x))
 
-        spsi = psi(np.sum(self.weights))
-        for k in range(self.k):
-            # compute the data-independent factor first
-            w0 = psi(self.weights[k]) - spsi
-            w0 += 0.5 * np.log(detsh(self.scale[k]))
-            w0 -= self.dim * 0.5 / self.shrinkage[k]
-            w0 += 0.5 * np.log(2) * self.dim
-            for i in range(self.dim):
-                w0 += 0.5 * psi((self.dof[k] - i) / 2)
-            m = np.reshape(self.means[k], (1, self.dim))
-            b = self.dof[k] * self.scale[k]
-            q = np.sum(np.dot(m - x, b) * (m - x), 1)
-            w = w0 - q / 2
-            w -= 0.5 * np.log(2 * np.pi) * self.dim
-            like[:, k] = np.exp(w)
-
-        if like.min() < 0:
-            raise ValueError('Likelihood cannot be negative')
-        return like
+    def log_likelihood(self, x, n_jobs=1):
+        """VB-E step, in the log domain
+
+        Parameters
+        ----------
+        x array of shape (nb_samples,dim)
+          the data used in the estimation process
+        n_jobs: int, optional,
+                number of threads used in the computation
+
+        Returns
+        -------
+        log_like: array of shape(nb_samples,self.k),
+                  component-wise log-likelihood
+        """
+        from scipy.special import psi
+        x = self.check_x(x)
+        dof = np.reshape(self.dof, (self.k, 1, 1))
+        # log-density under the expected precisions dof * scale, which
+        # accounts for 0.5 * log(det(scale)) + 0.5 * dim * log(dof)
+        log_like = log_normal_density(x, self.means, dof * self.scale,
+                                      'full', n_jobs)
+        # then the data-independent factors
+        w0 = psi(self.weights) - psi(np.sum(self.weights))
+        w0 -= 0.5 * self.dim * np.log(self.dof)
+        w0 -= self.dim * 0.5 / self.shrinkage
+        w0 += 0.5 * np.log(2) * self.dim
+        w0 += 0.5 * psi((np.reshape(self.dof, (self.k, 1)) -
+                         np.arange(self.dim)) / 2).sum(1)
+        return log_like + w0
 
     def evidence(self, x, like=None, verbose=0):
         """computation of evidence bound aka free energy
@@ -938,14 +950,15 @@ class VBGMM(BGMM):
         from numpy.linalg import inv
         tiny = 1.e-15
         if like == None:
-            like = self._Estep(x)
-            like = (like.T / np.maximum(like.sum(1), tiny)).T
+            log_like = self.log_likelihood(x)
+            like = np.exp(log_like - logsumexp(log_like)[:, np.newaxis])
 
         pop = like.sum(0)[:self.k]
         pop = np.reshape(pop, (self.k, 1))
         spsi = psi(np.sum(self.weights))
         empmeans = np.dot(like.T[:self.k], x) / np.maximum(pop, tiny)
 
+        empcov = _weighted_scatter(x, like[:, :self.k], empmeans)
         F = 0
         # start with the average likelihood term
         for k in range(self.k):
@@ -960,10 +973,8 @@ class VBGMM(BGMM):
                 Lav += 0.5 * psi((self.dof[k] - i) / 2)
             Lav -= self.dim * 0.5 / self.shrinkage[k]
             Lav *= pop[k]
-            empcov = np.zeros((self.dim, self.dim))
-            dx = x - empmeans[k]
-            empcov = np.dot(dx.T, like[:, k:k + 1] * dx)
-            Lav -= 0.5 * np.trace(np.dot(empcov, self.scale[k] * self.dof[k]))
+            Lav -= 0.5 * np.trace(np.dot(empcov[k],
+                                         self.scale[k] * self.dof[k]))
             F += Lav
 
         #then the KL divergences
@@ -1016,11 +1027,8 @@ class VBGMM(BGMM):
 
         #precisions
         empmeans = np.dot(like.T, x) / np.maximum(pop, tiny)
-        empcov = np.zeros(np.shape(self.prior_scale))
-        for k in range(self.k):
-            dx = x - empmeans[k]
-            empcov[k] = np.dot(dx.T, like[:, k:k + 1] * dx)
-            covariance = np.array(self._inv_prior_scale) + empcov
+        empcov = _weighted_scatter(x, like, empmeans)
+        covariance = np.array(self._inv_prior_scale) + empcov
 
         dx = np.reshape(empmeans - self.prior_means, (self.k, self.dim, 1))
         addcov = np.array([np.dot(dx[k], dx[k].T) for k in range(self.k)])
@@ -1065,11 +1073,11 @@ class VBGMM(BGMM):
            of the rows of x
         """
         if like == None:
-            like = self.likelihood(x)
+            like = self.log_likelihood(x)
         z = np.argmax(like, 1)
         return z
 
-    def estimate(self, x, niter=100, delta=1.e-4, verbose=0):
+    def estimate(self, x, niter=100, delta=1.e-4, verbose=0, n_jobs=1):
         """estimation of self given x
 
         Parameters
@@ -1083,13 +1091,15 @@ class VBGMM(BGMM):
               convergence is declared
         verbose=0:
                 verbosity mode
+        n_jobs=1: number of threads used to compute the likelihood
         """
         # alternation of E/M step until convergence
-        tiny = 1.e-15
         av_ll_old = - np.infty
         for i in range(niter):
-            like = self._Estep(x)
-            av_ll = np.mean(np.log(np.maximum(np.sum(like, 1), tiny)))
+            # VB-E step, in the log domain
+            log_like = self.log_likelihood(x, n_jobs)
+            lse = logsumexp(log_like)
+            av_ll = np.mean(lse)
             if av_ll < av_ll_old + delta:
                 if verbose:
                     print 'iteration:', i, 'log-likelihood:', av_ll,\
@@ -1098,9 +1108,8 @@ class VBGMM(BGMM):
             else:
                 av_ll_old = av_ll
             if verbose:
-                print i, av_ll, self.bic(like)
-            like = (like.T / np.maximum(like.sum(1), tiny)).T
-            self._Mstep(x, like)
+                print i, av_ll, self._bic(np.sum(lse), x.shape[0])
+            self._Mstep(x, np.exp(log_like - lse[:, np.newaxis]))
 
     def likelihood(self, x):
         """
@@ -5,6 +5,12 @@
 
 import numpy as np
 
+# number of (item, center) distances computed at once in the assignment step
+BLOCKSIZE = 2 ** 20
+
+# number of kmeans iterations on the seeding sample of minibatch_kmeans
+NINIT_ITER = 10
+
 
 def kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=0.0001, verbose=0,
               ninit=1):
@@ -105,15 +111,37 @@ def _MStep(x, z, k):
     """
     dim = x.shape[1]
     centers = np.repeat(np.reshape(x.mean(0), (1, dim)), k, 0)
-    for q in range(k):
-        if np.sum(z == q) == 0:
-            pass
-        else:
-            centers[q] = np.mean(x[z == q], 0)
+    sums, counts = _cluster_sums(x, z, k)
+    nonempty = counts > 0
+    centers[nonempty] = sums[nonempty] / counts[nonempty, np.newaxis]
     return centers
 
 
-def _EStep(x, centers):
+def _cluster_sums(x, z, k):
+    """ Per-cluster sums and sizes of the data, computed with bincount
+
+    Returns
+    -------
+    sums, array of shape (k,p)
+    counts, array of shape (k)
+    """
+    counts = np.zeros(k)
+    sums = np.zeros((k, x.shape[1]))
+    # labels outside [0, k) are ignored
+    z = np.asarray(z).astype(np.int)
+    valid = (z > - 1) & (z < k)
+    if not valid.all():
+        x, z = x[valid], z[valid]
+    if z.size == 0:
+        return sums, counts
+    m = z.max() + 1
+    counts[:m] = np.bincount(z)
+    for d in range(x.shape[1]):
+        sums[:m, d] = np.bincount(z, x[:, d])
+    return sums, counts
+
+
+def _EStep(x, centers, blocksize=BLOCKSIZE):
     """ Computation of the input-to-cluster assignment
 
     Parameters
@@ -121,19 +149,30 @@ def _EStep(x, centers):
     x array of shape (n,p)
       n = number of items, p = data dimension
     centers, array of shape (k,p) the cluster centers
+    blocksize: int, optional,
+               the number of items*centers distances
+               held in memory at once
 
     Returns
     -------
     z vector of shape(n), the resulting assignment
+    J, float, the inertia, i.e. the sum of squared distances of the
+       items to their centers
     """
     nbitem = x.shape[0]
-    z = - np.ones(nbitem).astype(np.int)
-    mindist = np.infty * np.ones(nbitem)
-    k = centers.shape[0]
-    for q in range(k):
-        dist = np.sum((x - centers[q]) ** 2, 1)
-        z[dist < mindist] = q
-        mindist = np.minimum(dist, mindist)
+    z = np.zeros(nbitem, np.int)
+    mindist = np.zeros(nbitem)
+    norm_centers = np.sum(centers ** 2, 1)
+    step = max(1, blocksize // max(centers.shape[0], 1))
+    for start in range(0, nbitem, step):
+        # squared distances of a block of items to all the centers,
+        # up to the norm of the items
+        xb = x[start:start + step]
+        dist = norm_centers - 2 * np.dot(xb, centers.T)
+        zb = np.argmin(dist, 1)
+        z[start:start + step] = zb
+        mindist[start:start + step] = np.maximum(
+            dist[np.arange(xb.shape[0]), zb] + np.sum(xb ** 2, 1), 0)
     J = mindist.sum()
     return z, J
 
@@ -220,3 +259,164 @@ def _kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=1.e-4,
         z_output = z
 
     return centers_output, z_output, bJ
+
+
+def _kmeans_plusplus(X, nbclusters):
+    """ k-means++ seeding: the centers are drawn among the items, with a
+    probability proportional to the squared distance to the nearest
+    center already chosen (Arthur and Vassilvitskii, 2007)
+
+    Parameters
+    ----------
+    X: array of shape (n,p), the data
+    nbclusters: int, the number of centers, at most n
+
+    Returns
+    -------
+    centers: array of shape (nbclusters, p)
+    """
+    nbitem = X.shape[0]
+    centers = np.zeros((nbclusters, X.shape[1]))
+    centers[0] = X[np.random.randint(nbitem)]
+    mindist = np.sum((X - centers[0]) ** 2, 1)
+    for q in range(1, nbclusters):
+        total = mindist.sum()
+        if total > 0:
+            i = np.searchsorted(np.cumsum(mindist), np.random.rand() * total)
+        else:
+            i = np.random.randint(nbitem)
+        centers[q] = X[min(i, nbitem - 1)]
+        mindist = np.minimum(mindist, np.sum((X - centers[q]) ** 2, 1))
+    return centers
+
+
+def _as_items(x):
+    """ Returns x as a 2D float array, without copy when possible
+    """
+    x = np.asarray(x, np.float)
+    if np.size(x.shape) == 1:
+        x = np.reshape(x, (x.shape[0], 1))
+    return x
+
+
+def _batches(chunks, batch_size):
+    """ Split an array (in random order) or an iterable of arrays
+    into batches of at most batch_size items
+    """
+    if isinstance(chunks, np.ndarray):
+        order = np.argsort(np.random.rand(chunks.shape[0]))
+        for start in range(0, chunks.shape[0], batch_size):
+            yield chunks[np.sort(order[start:start + batch_size])]
+    else:
+        for chunk in chunks:
+            chunk = _as_items(chunk)
+            for start in range(0, chunk.shape[0], batch_size):
+                yield chunk[start:start + batch_size]
+
+
+def minibatch_kmeans(X, nbclusters=2, batch_size=1000, maxiter=100,
+                     delta=1.e-4, init_size=None, verbose=0):
+    """ Mini-batch kmeans clustering algorithm
+
+    The centers are seeded with the k-means++ procedure and refined on a
+    sample of the data, then updated
+    batch after batch, each center being the running mean of the items
+    assigned to it so far (Sculley, 2010). The data need not be held in
+    memory at once.
+
+    Parameters
+    ----------
+    X: array of shape (n,p), or iterable of arrays of shape (n_i,p)
+       the data, possibly given as chunks (e.g. memory-mapped arrays).
+       A one-shot iterator (such as a generator) is streamed once,
+       other iterables are traversed at each iteration.
+    nbclusters: int, optional,
+                the number of desired clusters
+    batch_size: int, optional,
+                the number of items in each batch
+    maxiter: int, optional,
+             the maximum number of passes over the data
+    delta: float, optional,
+           the relative increment in the centers
+           before declaring convergence.
+    init_size: int, optional,
+               the number of items used for seeding,
+               defaults to max(3 * nbclusters, batch_size)
+    verbose: verbosity mode, optional
+
+    Returns
+    -------
+    Centers: array of shape (nbclusters, p),
+             the centroids of  the resulting clusters
+    Labels : array of size n, the discrete labels of the input items
+    J (float):  the final value of the inertia criterion
+
+    Note
+    ----
+    When X is a one-shot iterator, the labels and inertia are those
+    obtained when the items were streamed, not with the final centers.
+    """
+    from itertools import chain
+    if init_size is None:
+        init_size = max(3 * nbclusters, batch_size)
+    one_shot = False
+
+    # get the seeding sample
+    if isinstance(X, np.ndarray):
+        X = _as_items(X)
+        sample = X[np.argsort(np.random.rand(X.shape[0]))[:init_size]]
+    else:
+        chunks = iter(X)
+        one_shot = chunks is X
+        head, size = [], 0
+        for chunk in chunks:
+            head.append(_as_items(chunk))
+            size += head[-1].shape[0]
+            if size >= init_size:
+                break
+        if len(head) == 0:
+            raise ValueError("I need at least one item to cluster")
+        sample = np.vstack(head)[:init_size]
+        if one_shot:
+            X = chain(head, chunks)
+    if sample.shape[0] < 1:
+        raise ValueError("I need at least one item to cluster")
+    nbclusters = max(1, min(int(nbclusters), sample.shape[0]))
+
+    # seed, then refine on the sample
+    centers = _kmeans_plusplus(sample, nbclusters)
+    for i in range(NINIT_ITER):
+        centers = _MStep(sample, _EStep(sample, centers)[0], nbclusters)
+    vdata = np.mean(np.var(sample, 0))
+    counts = np.zeros(nbclusters)
+    labels = []
+    for i in range(maxiter):
+        centers_old = centers.copy()
+        J = 0
+        for xb in _batches(X, batch_size):
+            z, Jb = _EStep(xb, centers)
+            J += Jb
+            if one_shot:
+                labels.append(z)
+            sums, nb = _cluster_sums(xb, z, nbclusters)
+            counts += nb
+            upd = nb > 0
+            centers[upd] += (sums[upd] - nb[upd, np.newaxis] * centers[upd]
+                             ) / counts[upd, np.newaxis]
+        if verbose:
+            print i, J
+        if one_shot or np.sum((centers_old - centers) ** 2) < delta * vdata:
+            break
+
+    # final assignment
+    if isinstance(X, np.ndarray):
+        labels, J = _EStep(X, centers)
+    elif not one_shot:
+        J = 0
+        for chunk in X:
+            z, Jb = _EStep(_as_items(chunk), centers)
+            labels.append(z)
+            J += Jb
+    if not isinstance(labels, np.ndarray):
+        labels = np.concatenate(labels) if labels else np.array([], np.int)
+    return centers, labels, J
@@ -12,6 +12,145 @@ Author : Bertrand Thirion, 2006-2009
 import numpy as np
 from scipy.linalg import eigvalsh
 
+# number of (sample, component, dimension) terms evaluated at once
+# in the computation of the log-densities
+CHUNKSIZE = 2 ** 20
+
+
+def logsumexp(a):
+    """ Computes log(np.sum(np.exp(a), 1)) without overflow or underflow
+
+    Parameters
+    ----------
+    a: array of shape (n_samples, k)
+
+    Returns
+    -------
+    lse: array of shape (n_samples)
+    """
+    amax = a.max(1)
+    amax[np.isinf(amax)] = 0
+    return amax + np.log(np.sum(np.exp(a - amax[:, np.newaxis]), 1))
+
+
+def _precision_factors(precisions):
+    """ Factors L of the precision matrices, such that P = L L^T, and
+    the log-determinants of the precision matrices
+
+    Parameters
+    ----------
+    precisions: array of shape (k, dim, dim)
+
+    Returns
+    -------
+    factors: array of shape (k, dim, dim)
+    logdet: array of shape (k)
+    """
+    from numpy.linalg import cholesky, eigh, LinAlgError
+    factors = np.zeros(np.shape(precisions))
+    logdet = np.zeros(precisions.shape[0])
+    for k, prec in enumerate(precisions):
+        try:
+            factors[k] = cholesky(prec)
+            logdet[k] = 2 * np.sum(np.log(np.diag(factors[k])))
+        except LinAlgError:
+            # not positive definite: this yields nan, as the eigenvalues
+            # of the precision matrix are not all positive
+            ev, evec = eigh(prec)
+            factors[k] = evec * np.sqrt(ev)
+            logdet[k] = np.sum(np.log(ev))
+    return factors, logdet
+
+
+def log_normal_density(x, means, precisions, prec_type='full', n_jobs=1):
+    """ Log-density of the rows of x under several normal distributions
+
+    Parameters
+    ----------
+    x: array of shape (n_samples, dim)
+    means: array of shape (k, dim)
+    precisions: array of shape (k, dim, dim) or (k, dim),
+                the precision matrices, or their diagonals
+    prec_type: string (to be chosen within 'full','diag'), optional,
+               the precision parameterization
+    n_jobs: int, optional,
+            the number of threads among which the chunks of samples are
+            distributed
+
+    Returns
+    -------
+    log_like: array of shape (n_samples, k)
+
+    Note
+    ----
+    With full precisions, all the components are evaluated at once
+    for a chunk of samples, using a single matrix product with the
+    Cholesky factors of the precisions.
+    """
+    from nipy.utils.parallel import parallel_map
+    k, dim = means.shape
+    if prec_type == 'full':
+        factors, logdet = _precision_factors(precisions)
+        # projections x L_k for all k: (dim, k * dim)
+        lmat = np.reshape(np.transpose(factors, (1, 0, 2)), (dim, k * dim))
+        mproj = np.array([np.dot(means[j], factors[j]) for j in range(k)])
+    else:
+        logdet = np.sum(np.log(precisions), 1)
+    const = 0.5 * (logdet - dim * np.log(2 * np.pi))
+
+    def chunk_log_density(chunk):
+        if prec_type == 'full':
+            y = np.reshape(np.dot(chunk, lmat), (chunk.shape[0], k, dim))
+            y -= mproj
+            y **= 2
+        else:
+            y = (chunk[:, np.newaxis] - means) ** 2
+            y *= precisions
+        return const - 0.5 * np.sum(y, 2)
+
+    step = max(1, CHUNKSIZE // max(k * dim, 1))
+    chunks = [x[i:i + step] for i in range(0, x.shape[0], step)]
+    if len(chunks) == 0:
+        return np.zeros((0, k))
+    return np.vstack(parallel_map(chunk_log_density, chunks, n_jobs))
+
+
+def _weighted_scatter(x, like, means, prec_type='full'):
+    """ Weighted scatter matrices of the data around several means
+
+    Parameters
+    ----------
+    x: array of shape (n_samples, dim)
+    like: array of shape (n_samples, k), the weights
+    means: array of shape (k, dim)
+    prec_type: string (to be chosen within 'full','diag'), optional,
+               whether the full matrices or their diagonals are needed
+
+    Returns
+    -------
+    scatter: array of shape (k, dim, dim) or (k, dim),
+             sum_i like[i, k] (x[i] - means[k]) (x[i] - means[k])^T
+
+    Note
+    ----
+    This loops over the dimensions rather than the components; the data
+    are centered beforehand to avoid cancellation errors.
+    """
+    mx = x.mean(0)
+    x = x - mx
+    means = means - mx
+    pop = like.sum(0)
+    s = np.dot(like.T, x)
+    if prec_type == 'full':
+        moment = np.array([np.dot(like.T, x * x[:, d:d + 1])
+                           for d in range(x.shape[1])]).transpose(1, 0, 2)
+        cross = s[:, :, np.newaxis] * means[:, np.newaxis]
+        return moment - cross - cross.transpose(0, 2, 1) + \
+            pop[:, np.newaxis, np.newaxis] * \
+            means[:, :, np.newaxis] * means[:, np.newaxis]
+    return np.dot(like.T, x ** 2) - 2 * s * means + \
+        pop[:, np.newaxis] * means ** 2
+
 
 class GridDescriptor(object):
     """
@@ -99,7 +238,7 @@ class GridDescriptor(object):
 
 
 def best_fitting_GMM(x, krange, prec_type='full', niter=100, delta=1.e-4,
-                     ninit=1, verbose=0):
+                     ninit=1, verbose=0, n_jobs=1):
     """
     Given a certain dataset x, find the best-fitting GMM
     with a number k of classes in a certain range defined by krange
@@ -119,6 +258,8 @@ def best_fitting_GMM(x, krange, prec_type='full', niter=100, delta=1.e-4,
     ninit: int
            number of initialization performed
     verbose=0: verbosity mode
+    n_jobs: int, optional,
+            number of threads used to compute the likelihood
 
     Returns
     -------
@@ -132,7 +273,7 @@ def best_fitting_GMM(x, krange, prec_type='full', niter=100, delta=1.e-4,
     for k in krange:
         lgmm = GMM(k, dim, prec_type)
         gmmk = lgmm.initialize_and_estimate(x, None, niter, delta, ninit,
-                                            verbose)
+                                            verbose, n_jobs)
         bic = gmmk.evidence(x)
         if bic > bestbic:
             bestbic = bic
@@ -471,29 +612,34 @@ class GMM(object):
         ----
         Hopefully faster
         """
-        xt = x.T.copy()
-        n = x.shape[0]
-        like = np.zeros((n, self.k))
+        return np.exp(log_normal_density(x, self.means, self.precisions,
+                                         self.prec_type))
 
-        for k in range(self.k):
-            # compute the data-independent factor first
-            w = - np.log(2 * np.pi) * self.dim
-            m = np.reshape(self.means[k], (self.dim, 1))
-            b = self.precisions[k]
-            if self.prec_type == 'full':
-                w += np.log(eigvalsh(b)).sum()
-                dx = xt - m
-                sqx = dx * np.dot(b, dx)
-                q = np.zeros(n)
-                for d in range(self.dim):
-                    q += sqx[d]
-            else:
-                w += np.sum(np.log(b))
-                q = np.dot(b, (m - xt) ** 2)
-            w -= q
-            w /= 2
-            like[:, k] = np.exp(w)
-        return like
+    def log_likelihood(self, x, n_jobs=1):
+        """
+        return the log-likelihood of the model for the data x
+        the values are weighted by the components weights
+
+        Parameters
+        ----------
+        x array of shape (n_samples,self.dim)
+           the data used in the estimation process
+        n_jobs: int, optional,
+                number of threads used in the computation
+
+        Returns
+        -------
+        log_like, array of shape(n_samples,self.k)
+          component-wise log-likelihood
+
+        Note
+        ----
+        Unlike np.log(self.likelihood(x)), this does not underflow
+        when the data are far from all the components
+        """
+        return log_normal_density(x, self.means, self.precisions,
+                                  self.prec_type, n_jobs) + \
+                                  np.log(self.weights)
 
     def mixture_likelihood(self, x):
         """Returns the likelihood of the mixture for x
@@ -515,13 +661,12 @@ class GMM(object):
         ----------
         x:  array of shape (n_samples,self.dim)
             the data used in the estimation process
-        tiny = 1.e-15: a small constant to avoid numerical singularities
+        tiny: unused, kept for backward compatibility; the
+              log-likelihood is computed in the log domain and does not
+              underflow
         """
         x = self.check_x(x)
-        like = self.likelihood(x)
-        sl = np.sum(like, 1)
-        sl = np.maximum(sl, tiny)
-        return np.mean(np.log(sl))
+        return np.mean(logsumexp(self.log_likelihood(x)))
 
     def evidence(self, x):
         """Computation of bic approximation of evidence
@@ -536,29 +681,37 @@ class GMM(object):
         the bic value
         """
         x = self.check_x(x)
-        tiny = 1.e-15
-        like = self.likelihood(x)
-        return self.bic(like, tiny)
+        return self.bic(self.log_likelihood(x), log_domain=True)
 
-    def bic(self, like, tiny=1.e-15):
+    def bic(self, like, tiny=1.e-15, log_domain=False):
         """Computation of bic approximation of evidence
 
         Parameters
         ----------
         like, array of shape (n_samples, self.k)
-           component-wise likelihood
-        tiny=1.e-15, a small constant to avoid numerical singularities
+           component-wise likelihood, or log-likelihood if log_domain
+        tiny=1.e-15, a small constant to avoid numerical singularities,
+           only used with likelihoods
+        log_domain: bool, optional,
+           whether like holds log-likelihoods, as returned by
+           self.log_likelihood; these are summed with logsumexp, and
+           do not underflow in high dimension
 
         Returns
         -------
         the bic value, float
         """
+        if log_domain:
+            return self._bic(np.sum(logsumexp(like)), like.shape[0])
         sl = np.sum(like, 1)
         sl = np.maximum(sl, tiny)
-        bicc = np.sum(np.log(sl))
+        return self._bic(np.sum(np.log(sl)), like.shape[0])
 
+    def _bic(self, bicc, n):
+        """bic value given the data log-likelihood bicc and the
+        number of samples n
+        """
         # number of parameters
-        n = like.shape[0]
         if self.prec_type == 'full':
             eta = self.k * (1 + self.dim + (self.dim * self.dim + 1) / 2) - 1
         else:
@@ -609,7 +762,10 @@ class GMM(object):
         self.prior_means = np.repeat(mx, self.k, 0)
         self.prior_weights = np.ones(self.k) / self.k
         self.prior_scale = np.repeat(px, self.k, 0)
-        self.prior_dof = self.dim + 2
+        if self.prec_type == 'full':
+            self.prior_dof = self.dim + 2
+        else:
+            self.prior_dof = 3
         self.prior_shrinkage = small
         self.weights = np.ones(self.k) * 1.0 / self.k
         if bcheck:
@@ -648,12 +804,9 @@ class GMM(object):
 
         #precisions
         empmeans = np.dot(like.T, x) / np.maximum(pop, tiny)
-        empcov = np.zeros(np.shape(self.precisions))
+        empcov = _weighted_scatter(x, like, empmeans, self.prec_type)
 
         if self.prec_type == 'full':
-            for k in range(self.k):
-                dx = x - empmeans[k]
-                empcov[k] = np.dot(dx.T, like[:, k:k + 1] * dx)
             #covariance
             covariance = np.array([pinv(self.prior_scale[k])
                                    for k in range(self.k)])
@@ -670,9 +823,6 @@ class GMM(object):
             self.precisions = np.array([pinv(covariance[k]) \
                                        for k in range(self.k)])
         else:
-            for k in range(self.k):
-                dx = x - empmeans[k]
-                empcov[k] = np.sum(dx ** 2 * like[:, k:k + 1], 0)
             # covariance
             covariance = np.array([1.0 / self.prior_scale[k]
                                    for k in range(self.k)])
@@ -681,7 +831,8 @@ class GMM(object):
             addcov = np.array([np.sum(dx[k] ** 2, 0) for k in range(self.k)])
             apms = np.reshape(prior_shrinkage * pop / shrinkage, (self.k, 1))
             covariance += addcov * apms
-            dof = self.prior_dof + pop + self.dim + 2
+            # the coordinates are independent: univariate update
+            dof = self.prior_dof + pop + 3
             covariance /= np.reshape(dof, (self.k, 1))
 
             # precision
@@ -705,11 +856,11 @@ class GMM(object):
            of the rows of x
         """
         if like == None:
-            like = self.likelihood(x)
+            like = self.log_likelihood(x)
         z = np.argmax(like, 1)
         return z
 
-    def estimate(self, x, niter=100, delta=1.e-4, verbose=0):
+    def estimate(self, x, niter=100, delta=1.e-4, verbose=0, n_jobs=1):
         """ Estimation of the model given a dataset x
 
         Parameters
@@ -720,6 +871,7 @@ class GMM(object):
         delta = 1.e-4: increment of data likelihood at which
               convergence is declared
         verbose=0: verbosity mode
+        n_jobs=1: number of threads used to compute the likelihood
 
         Returns
         -------
@@ -729,11 +881,12 @@ class GMM(object):
         x = self.check_x(x)
 
         # alternation of E/M step until convergence
-        tiny = 1.e-15
         av_ll_old = - np.infty
         for i in range(niter):
-            l = self._Estep(x)
-            av_ll = np.mean(np.log(np.maximum(np.sum(l, 1), tiny)))
+            # E step, in the log domain
+            log_like = self.log_likelihood(x, n_jobs)
+            ll = logsumexp(log_like)
+            av_ll = np.mean(ll)
             if av_ll < av_ll_old + delta:
                 if verbose:
                     print 'iteration:', i, 'log-likelihood:', av_ll,\
@@ -742,13 +895,13 @@ class GMM(object):
             else:
                 av_ll_old = av_ll
             if verbose:
-                print i, av_ll, self.bic(l)
-            self._Mstep(x, l)
+                print i, av_ll, self._bic(np.sum(ll), x.shape[0])
+            self._Mstep(x, np.exp(log_like - ll[:, np.newaxis]))
 
-        return self.bic(l)
+        return self._bic(np.sum(ll), x.shape[0])
 
     def initialize_and_estimate(self, x, z=None, niter=100, delta=1.e-4,\
-                                ninit=1, verbose=0):
+                                ninit=1, verbose=0, n_jobs=1):
         """Estimation of self given x
 
         Parameters
@@ -763,6 +916,7 @@ class GMM(object):
         ninit=1: number of initialization performed
                  to reach a good solution
         verbose=0: verbosity mode
+        n_jobs=1: number of threads used to compute the likelihood
 
         Returns
         -------
@@ -777,7 +931,8 @@ class GMM(object):
             self.initialize(x)
 
             # alternation of E/M step until convergence
-            bic = self.estimate(x, niter=niter, delta=delta, verbose=0)
+            bic = self.estimate(x, niter=niter, delta=delta, verbose=0,
+                                n_jobs=n_jobs)
             if bic > bestbic:
                 bestbic = bic
                 bestgmm.plugin(self.means, self.precisions, self.weights)
@@ -796,13 +951,15 @@ class GMM(object):
         ----------
         x array of shape (n_samples,self.dim)
           the data used in the estimation process
+        tiny: unused, kept for backward compatibility
 
         Returns
         -------
         ll: array of shape(n_samples)
             the log-likelihood of the rows of x
         """
-        return np.log(np.maximum(self.mixture_likelihood(x), tiny))
+        x = self.check_x(x)
+        return logsumexp(self.log_likelihood(x))
 
     def show_components(self, x, gd, density=None, mpaxes=None):
         """Function to plot a GMM -- Currently, works only in 1D
@@ -4,6 +4,7 @@ with an unspecified number of classes
 """
 import numpy as np
 from bgmm import BGMM, detsh
+from gmm import log_normal_density, logsumexp
 from scipy.special import gammaln
 
 
@@ -155,8 +156,7 @@ class IMM(BGMM):
             z = np.zeros(x.shape[0])
             self.update(x, z)
 
-        like = self.likelihood(x, plike)
-        z = self.sample_indicator(like)
+        z = self.sample_indicator(self.log_likelihood(x, plike=plike))
 
         for i in range(niter):
             if  kfold == None:
@@ -192,16 +192,16 @@ class IMM(BGMM):
         like: array od shape(n_samples),
               the likelihood of the data
         """
-        like = self.likelihood(x, plike)
+        log_like = self.log_likelihood(x, plike=plike)
         # standard + likelihood under the prior
-        # like has shape (x.shape[0], self.k+1)
+        # log_like has shape (x.shape[0], self.k+1)
 
-        z = self.sample_indicator(like)
+        z = self.sample_indicator(log_like)
         # almost standard, but many new components can be created
 
         self.reduce(z)
         self.update(x, z)
-        return like.sum(1)
+        return np.exp(logsumexp(log_like))
 
     def cross_validated_update(self, x, z, plike, kfold=10):
         """
@@ -255,10 +255,10 @@ class IMM(BGMM):
             self.update(x[train], z[train])
 
             # draw the membership for the left-out datas
-            alike = self.likelihood(x[test], plike[test])
-            slike[test] = alike.sum(1)
+            alike = self.log_likelihood(x[test], plike=plike[test])
+            slike[test] = np.exp(logsumexp(alike))
             # standard + likelihood under the prior
-            # like has shape (x.shape[0], self.k+1)
+            # alike has shape (x.shape[0], self.k+1)
 
             z[test] = self.sample_indicator(alike)
             # almost standard, but many new components can be created
@@ -320,13 +320,13 @@ class IMM(BGMM):
         self.weights = pop + self.prior_weights
         self.weights /= self.weights.sum()
 
-    def sample_indicator(self, like):
+    def sample_indicator(self, log_like):
         """ Sample the indicator from the likelihood
 
         Parameters
         ----------
-        like: array of shape (nbitem,self.k)
-           component-wise likelihood
+        log_like: array of shape (nbitem,self.k)
+           component-wise log-likelihood
 
         Returns
         -------
@@ -337,7 +337,7 @@ class IMM(BGMM):
         The behaviour is different from standard bgmm
         in that z can take arbitrary values
         """
-        z = BGMM.sample_indicator(self, like)
+        z = BGMM.sample_indicator(self, log_like)
         z[z == self.k] = self.k + np.arange(np.sum(z == self.k))
         return z
 
@@ -405,6 +405,40 @@ class IMM(BGMM):
         like *= self.weights
         return like
 
+    def log_likelihood(self, x, n_jobs=1, plike=None):
+        """
+        return the log-likelihood of the model for the data x,
+        i.e. the log of self.likelihood(x, plike)
+
+        Parameters
+        ----------
+        x: array of shape (n_samples, self.dim),
+           the data used in the estimation process
+        n_jobs: int, optional,
+                number of threads used in the computation
+        plike: array os shape (n_samples), optional,
+               the density of each point under the prior
+
+        Returns
+        -------
+        log_like, array of shape(nbitem,self.k + 1)
+        component-wise log-likelihood
+
+        Note
+        ----
+        The component densities are computed in the log domain, so that
+        they do not underflow when the data are far from the components
+        """
+        if plike is None:
+            plike = self.likelihood_under_the_prior(x)
+
+        log_like = np.log(np.reshape(plike, (x.shape[0], 1)))
+        if self.k > 0:
+            log_like = np.hstack((
+                    log_normal_density(x, self.means, self.precisions,
+                                       self.prec_type, n_jobs), log_like))
+        return log_like + np.log(self.weights)
+
 
 class MixedIMM(IMM):
     """
@@ -494,8 +528,8 @@ class MixedIMM(IMM):
             z = np.zeros(x.shape[0])
             self.update(x, z)
 
-        like = self.likelihood(x, plike)
-        z = self.sample_indicator(like, null_class_proba)
+        z = self.sample_indicator(self.log_likelihood(x, plike=plike),
+                                  null_class_proba)
 
         if co_clustering:
             from scipy.sparse import coo_matrix
@@ -508,7 +542,7 @@ class MixedIMM(IMM):
                 like, z = self.cross_validated_update(x, z, plike,
                                                       null_class_proba, kfold)
 
-            llike = self.likelihood(x, plike)
+            llike = self.log_likelihood(x, plike=plike)
             z = self.sample_indicator(llike, null_class_proba)
             pproba += (z == - 1)
 
@@ -547,16 +581,16 @@ class MixedIMM(IMM):
         like: array od shape(n_samples),
               the likelihood of the data under the H1 hypothesis
         """
-        like = self.likelihood(x, plike)
+        log_like = self.log_likelihood(x, plike=plike)
         # standard + likelihood under the prior
-        # like has shape (x.shape[0], self.k+1)
+        # log_like has shape (x.shape[0], self.k+1)
 
-        z = self.sample_indicator(like, null_class_proba)
+        z = self.sample_indicator(log_like, null_class_proba)
         # almost standard, but many new components can be created
 
         self.reduce(z)
         self.update(x, z)
-        return like.sum(1)
+        return np.exp(logsumexp(log_like))
 
     def cross_validated_update(self, x, z, plike, null_class_proba, kfold=10):
         """
@@ -621,24 +655,24 @@ class MixedIMM(IMM):
             self.update(x[train], z[train])
 
             # draw the membership for the left-out data
-            alike = self.likelihood(x[test], plike[test])
-            slike[test] = alike.sum(1)
+            alike = self.log_likelihood(x[test], plike=plike[test])
+            slike[test] = np.exp(logsumexp(alike))
             # standard + likelihood under the prior
-            # like has shape (x.shape[0], self.k+1)
+            # alike has shape (x.shape[0], self.k+1)
 
             z[test] = self.sample_indicator(alike, null_class_proba[test])
             # almost standard, but many new components can be created
 
         return slike, z
 
-    def sample_indicator(self, like, null_class_proba):
+    def sample_indicator(self, log_like, null_class_proba):
         """
         sample the indicator from the likelihood
 
         Parameters
         ----------
-        like: array of shape (nbitem,self.k)
-           component-wise likelihood
+        log_like: array of shape (nbitem,self.k)
+           component-wise log-likelihood
         null_class_proba: array of shape(n_samples),
                           prior probability to be under the null
 
@@ -650,10 +684,13 @@ class MixedIMM(IMM):
         ----
         Here z=-1 encodes for the null class
         """
-        n = like.shape[0]
-        conditional_like_1 = ((1 - null_class_proba) * like.T).T
-        conditional_like_0 = np.reshape(null_class_proba *
-                                        self.null_dens, (n, 1))
+        n = log_like.shape[0]
+        with np.errstate(divide='ignore'):
+            # null_class_proba may be 0 or 1
+            conditional_like_1 = (np.log(1 - null_class_proba) +
+                                  log_like.T).T
+            conditional_like_0 = np.reshape(np.log(null_class_proba *
+                                                   self.null_dens), (n, 1))
         conditional_like = np.hstack((conditional_like_0, conditional_like_1))
         z = BGMM.sample_indicator(self, conditional_like) - 1
         z[z == self.k] = self.k + np.arange(np.sum(z == self.k))
@@ -89,6 +89,17 @@ def test_bgmm_gibbs():
     assert(z.max() + 1 == b.k)
 
 
+def test_sample_indicator_underflow():
+    """ Sample the indicator from log-likelihoods whose exponential
+    underflows
+    """
+    b = BGMM(2, 1)
+    log_like = np.tile([[-2000., -2000.], [-1000., -3000.]], (50, 1))
+    z = b.sample_indicator(log_like)
+    assert((z[1::2] == 0).all())
+    assert((z[::2] == 0).any() and (z[::2] == 1).any())
+
+
 def test_gmm_bf(kmax=4, seed=1):
     """ Perform a model selection procedure on a  gmm
     with Bayes factor estimations
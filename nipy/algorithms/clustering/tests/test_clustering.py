@@ -3,7 +3,7 @@
 # to run only the simple tests:
 # python testClustering.py Test_Clustering
 
-from ..clustering import kmeans
+from ..clustering import kmeans, minibatch_kmeans, _EStep, _cluster_sums
 import nose
 import numpy as np
 import numpy.random as nr
@@ -28,6 +28,40 @@ class TestClustering(TestCase):
         l = L[:7000].astype(np.float)
         self.assert_(np.mean(l) > 0.9)
 
+    def testestep(self):
+        X = nr.randn(100, 3)
+        C = nr.randn(7, 3)
+        dist = ((X[:, np.newaxis] - C) ** 2).sum(2)
+        z, J = _EStep(X, C, blocksize=20)
+        self.assert_((z == dist.argmin(1)).all())
+        self.assert_(np.absolute(J - dist.min(1).sum()) < 1.e-8)
+
+    def testcluster_sums(self):
+        X = nr.randn(10, 2)
+        z = np.array([0, 1, 1, 2, -1, 0, 3, 1, 2, 0])
+        sums, counts = _cluster_sums(X, z, 3)
+        self.assert_((counts == [3, 3, 2]).all())
+        for j in range(3):
+            self.assert_(np.absolute(sums[j] - X[z == j].sum(0)).max()
+                         < 1.e-12)
+        sums, counts = _cluster_sums(X, - np.ones(10), 3)
+        self.assert_((counts == 0).all())
+
+    def testminibatch_kmeans(self):
+        X = nr.randn(10000, 2)
+        A = np.concatenate([np.ones((7000, 2)), np.zeros((3000, 2))])
+        X = X + 5 * A
+        C, L, J = minibatch_kmeans(X, 2, batch_size=500)
+        self.assert_(np.absolute(np.sort(C[:, 0]) - [0, 5]).max() < .3)
+        z, J_ = _EStep(X, C)
+        self.assert_((z == L).all())
+        # clustering a stream of chunks
+        X = X[nr.permutation(10000)]
+        chunks = (X[i:i + 1000] for i in range(0, 10000, 1000))
+        C, L, J = minibatch_kmeans(chunks, 2, batch_size=500)
+        self.assert_(L.shape == (10000,))
+        self.assert_(np.absolute(np.sort(C[:, 0]) - [0, 5]).max() < .3)
+
 
 if __name__ == '__main__':
     nose.run(argv=['', __file__])
@@ -260,6 +260,55 @@ def test_em_gmm_cv():
     assert_true(ll[4] < ll[1])
 
 
+def test_log_likelihood():
+    # the log-likelihood should match the likelihood where the latter
+    # does not underflow, whatever the chunking and number of threads
+    dim, k = 3, 4
+    x = nr.randn(200, dim)
+    for prec_type in ['full', 'diag']:
+        lgmm = GMM(k, dim, prec_type)
+        lgmm.initialize(x)
+        ll = lgmm.log_likelihood(x, n_jobs=2)
+        assert_true(np.allclose(ll, np.log(lgmm.likelihood(x))))
+    # far from the components, the likelihood underflows
+    ll = lgmm.log_likelihood(100 + x)
+    assert_true(np.isfinite(ll).all())
+    assert_true((lgmm.likelihood(100 + x) == 0).all())
+
+
+def test_em_gmm_underflow():
+    # EM should still work when the likelihood of the data underflows
+    dim = 50
+    x = 30 * nr.randn(200, dim)
+    x[:100] += 100
+    lgmm = GMM(2, dim)
+    lgmm.initialize(x)
+    lgmm.estimate(x)
+    z = lgmm.map_label(x)
+    assert_true(np.isfinite(lgmm.means).all())
+    assert_true(np.unique(z[:100]).size == 1)
+    assert_true(np.unique(z[100:]).size == 1)
+    assert_true(z[0] != z[-1])
+
+
+
+def test_em_selection_largedim():
+    # Model selection should not be affected by the underflow of the
+    # likelihood in high dimension
+    dim, n = 300, 300
+    x = nr.randn(n, dim)
+    x[:n / 2] += 3
+    bgmm = best_fitting_GMM(x, [1, 2, 3], prec_type='diag', niter=50)
+    assert_true(bgmm.k == 2)
+    ll = bgmm.test(x)
+    assert_true(np.isfinite(ll).all())
+    assert_true(ll.max() < np.log(1.e-15))
+    assert_true(np.allclose(bgmm.average_log_like(x), ll.mean()))
+    assert_true(np.allclose(bgmm.evidence(x),
+                            bgmm.bic(bgmm.log_likelihood(x),
+                                     log_domain=True)))
+
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
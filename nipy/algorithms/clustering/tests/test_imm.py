@@ -48,6 +48,25 @@ def test_imm_loglike_1D():
     print theoretical_ll, empirical_ll
     assert np.absolute(theoretical_ll-empirical_ll)<0.25*dim
 
+def test_imm_log_likelihood():
+    """
+    Check that log_likelihood is the log of likelihood, and does not
+    underflow far from the components
+    """
+    n = 20
+    dim = 2
+    x = np.random.randn(n, dim)
+    igmm = IMM(.5, dim)
+    igmm.set_priors(x)
+    igmm.sample(x, niter=10)
+    plike = igmm.likelihood_under_the_prior(x)
+    log_like = igmm.log_likelihood(x, plike=plike)
+    assert log_like.shape == (n, igmm.k + 1)
+    assert np.allclose(log_like, np.log(igmm.likelihood(x, plike)))
+    assert np.allclose(igmm.log_likelihood(x, 2, plike), log_like)
+    far = np.isfinite(igmm.log_likelihood(100 * x, plike=plike))
+    assert far.all()
+
 def test_imm_loglike_known_groups():
     """
     Chek that the log-likelihood of the data under the
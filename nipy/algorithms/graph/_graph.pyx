@@ -1,6 +1,9 @@
 import numpy as np
 cimport numpy as np
 cimport cython
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memcpy
+from libc.math cimport INFINITY
 ctypedef np.float64_t DOUBLE
 ctypedef np.int_t INT
 
@@ -27,3 +30,402 @@ def dilation(np.ndarray[DOUBLE, ndim=2] field,\
         for i in range(size_max):
             field[i, d] = res[i]
     return res
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def cc_label(np.ndarray[INT, ndim=1] idx,\
+             np.ndarray[INT, ndim=1] neighb,\
+             np.ndarray[INT, ndim=1] valid):
+    """ Connected components of the subgraph of the graph given by its
+    compact neighbor representation (idx, neighb) that is induced by
+    the vertices such that valid > 0, computed by union-find.
+
+    Components are labelled in increasing order of their smallest
+    vertex; non-valid vertices are labelled -1.
+    """
+    cdef int V = idx.shape[0] - 1
+    cdef int i, j, k, ri, rj
+    cdef int nlabels = 0
+    cdef np.ndarray[INT, ndim=1] parent = np.arange(V)
+    cdef np.ndarray[INT, ndim=1] label = - np.ones(V, np.int)
+    for i in range(V):
+        if valid[i] <= 0:
+            continue
+        for k in range(idx[i], idx[i + 1]):
+            j = neighb[k]
+            if valid[j] <= 0:
+                continue
+            # find the roots, with path halving
+            ri = i
+            while parent[ri] != ri:
+                parent[ri] = parent[parent[ri]]
+                ri = parent[ri]
+            rj = j
+            while parent[rj] != rj:
+                parent[rj] = parent[parent[rj]]
+                rj = parent[rj]
+            # the root of a tree is its smallest vertex
+            if ri < rj:
+                parent[rj] = ri
+            elif rj < ri:
+                parent[ri] = rj
+    for i in range(V):
+        if valid[i] <= 0:
+            continue
+        ri = i
+        while parent[ri] != ri:
+            ri = parent[ri]
+        if ri == i:
+            label[i] = nlabels
+            nlabels += 1
+        else:
+            label[i] = label[ri]
+    return label
+
+
+# Binary min-heap of (key, vertex, label) triples stored in three
+# parallel arrays, used by the shortest path engine below. Stale
+# entries are not removed but skipped when popped.
+
+cdef inline void _heap_push(DOUBLE* key, INT* vert, INT* lab, INT n,
+                            DOUBLE k, INT v, INT l) nogil:
+    cdef INT i = n, p
+    while i > 0:
+        p = (i - 1) / 2
+        if key[p] <= k:
+            break
+        key[i], vert[i], lab[i] = key[p], vert[p], lab[p]
+        i = p
+    key[i], vert[i], lab[i] = k, v, l
+
+
+cdef inline void _heap_pop(DOUBLE* key, INT* vert, INT* lab, INT n) nogil:
+    # remove the root of a heap of size n, n > 0
+    cdef INT i = 0, c
+    cdef DOUBLE k = key[n - 1]
+    cdef INT v = vert[n - 1], l = lab[n - 1]
+    n -= 1
+    while True:
+        c = 2 * i + 1
+        if c >= n:
+            break
+        if c + 1 < n and key[c + 1] < key[c]:
+            c += 1
+        if k <= key[c]:
+            break
+        key[i], vert[i], lab[i] = key[c], vert[c], lab[c]
+        i = c
+    key[i], vert[i], lab[i] = k, v, l
+
+
+cdef inline int _grow(DOUBLE** a, INT** b, INT** c, INT size) nogil:
+    """ Reallocate three buffers to size entries. A buffer that cannot
+    be reallocated is left untouched, so that all three can still be
+    used and freed. Returns -1 if any reallocation failed.
+    """
+    cdef DOUBLE* na = <DOUBLE*>realloc(a[0], size * sizeof(DOUBLE))
+    cdef INT* nb = <INT*>realloc(b[0], size * sizeof(INT))
+    cdef INT* nc = <INT*>realloc(c[0], size * sizeof(INT))
+    if na != NULL:
+        a[0] = na
+    if nb != NULL:
+        b[0] = nb
+    if nc != NULL:
+        c[0] = nc
+    if na == NULL or nb == NULL or nc == NULL:
+        return -1
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef int _dijkstra(INT V, INT* idx, INT* neighb, DOUBLE* weight,
+                   INT* seeds, INT nseeds, INT k, DOUBLE cutoff,
+                   DOUBLE* dist, INT* label, INT* count,
+                   DOUBLE* tent) nogil:
+    """ Multi-source Dijkstra core. dist and label have shape (V, k)
+    and must be initialized to inf and -1, count to 0 and tent to inf.
+    Returns -1 if memory could not be allocated.
+    """
+    cdef INT size = 2 * nseeds + 16, n = 0
+    cdef INT i, e, u, v, l, m
+    cdef DOUBLE d, nd
+    cdef bint seen
+    cdef DOUBLE* key = <DOUBLE*>malloc(size * sizeof(DOUBLE))
+    cdef INT* vert = <INT*>malloc(size * sizeof(INT))
+    cdef INT* lab = <INT*>malloc(size * sizeof(INT))
+    if key == NULL or vert == NULL or lab == NULL:
+        free(key)
+        free(vert)
+        free(lab)
+        return -1
+
+    for i in range(nseeds):
+        _heap_push(key, vert, lab, n, 0, seeds[i], i)
+        n += 1
+        tent[seeds[i]] = 0
+
+    while n > 0:
+        d, v, l = key[0], vert[0], lab[0]
+        _heap_pop(key, vert, lab, n)
+        n -= 1
+        if count[v] >= k:
+            continue
+        seen = False
+        for m in range(count[v]):
+            if label[v * k + m] == l:
+                seen = True
+                break
+        if seen:
+            continue
+        dist[v * k + count[v]] = d
+        label[v * k + count[v]] = l
+        count[v] += 1
+
+        for e in range(idx[v], idx[v + 1]):
+            u = neighb[e]
+            nd = d + weight[e]
+            if nd > cutoff or count[u] >= k:
+                continue
+            # with a single label per vertex, only improvements of the
+            # tentative distance need be queued
+            if k == 1:
+                if nd >= tent[u]:
+                    continue
+                tent[u] = nd
+            if n == size:
+                size *= 2
+                if _grow(&key, &vert, &lab, size) < 0:
+                    free(key)
+                    free(vert)
+                    free(lab)
+                    return -1
+            _heap_push(key, vert, lab, n, nd, u, l)
+            n += 1
+
+    free(key)
+    free(vert)
+    free(lab)
+    return 0
+
+
+def dijkstra(np.ndarray[INT, ndim=1] idx,\
+             np.ndarray[INT, ndim=1] neighb,\
+             np.ndarray[DOUBLE, ndim=1] weight,\
+             np.ndarray[INT, ndim=1] seeds,\
+             int k=1, double cutoff=np.inf):
+    """ Multi-source shortest paths on the graph given by its compact
+    neighbor representation (idx, neighb, weight), with non-negative
+    weights.
+
+    For each vertex, find the k nearest seeds and their distances,
+    ignoring paths longer than cutoff. With k=1, this gives the
+    distance to the nearest seed and the Voronoi labelling.
+
+    Returns
+    -------
+    dist: array of shape (V, k), sorted distances to the nearest
+          seeds, inf if less than k seeds are within cutoff
+    label: array of shape (V, k), positions of the nearest seeds
+           within seeds, -1 if undefined
+    """
+    cdef INT V = idx.shape[0] - 1
+    cdef int ret
+    if k < 1:
+        raise ValueError('k should be positive')
+    if seeds.shape[0] > 0 and (seeds.min() < 0 or seeds.max() >= V):
+        raise ValueError('seeds should be vertices of the graph')
+    idx = np.ascontiguousarray(idx)
+    neighb = np.ascontiguousarray(neighb)
+    weight = np.ascontiguousarray(weight)
+    seeds = np.ascontiguousarray(seeds)
+    cdef np.ndarray[DOUBLE, ndim=2] dist = np.inf * np.ones((V, k))
+    cdef np.ndarray[INT, ndim=2] label = - np.ones((V, k), np.int)
+    cdef np.ndarray[INT, ndim=1] count = np.zeros(V, np.int)
+    cdef np.ndarray[DOUBLE, ndim=1] tent = np.inf * np.ones(V)
+    with nogil:
+        ret = _dijkstra(V, <INT*>idx.data, <INT*>neighb.data,
+                        <DOUBLE*>weight.data, <INT*>seeds.data,
+                        seeds.shape[0], k, cutoff, <DOUBLE*>dist.data,
+                        <INT*>label.data, <INT*>count.data,
+                        <DOUBLE*>tent.data)
+    if ret < 0:
+        raise MemoryError('could not allocate the Dijkstra heap')
+    return dist, label
+
+
+def geodesic_distances(np.ndarray[INT, ndim=1] idx,\
+                       np.ndarray[INT, ndim=1] neighb,\
+                       np.ndarray[DOUBLE, ndim=1] weight,\
+                       np.ndarray[INT, ndim=1] seeds,\
+                       double cutoff=np.inf):
+    """ Shortest path distances from each seed to all the vertices
+    of the graph given by its compact neighbor representation (idx,
+    neighb, weight), with non-negative weights.
+
+    Returns
+    -------
+    dg: array of shape (nseeds, V), inf beyond cutoff
+    """
+    cdef INT V = idx.shape[0] - 1
+    cdef INT nseeds = seeds.shape[0]
+    cdef INT i
+    cdef int ret = 0
+    if nseeds > 0 and (seeds.min() < 0 or seeds.max() >= V):
+        raise ValueError('seeds should be vertices of the graph')
+    idx = np.ascontiguousarray(idx)
+    neighb = np.ascontiguousarray(neighb)
+    weight = np.ascontiguousarray(weight)
+    seeds = np.ascontiguousarray(seeds)
+    cdef np.ndarray[DOUBLE, ndim=2] dg = np.inf * np.ones((nseeds, V))
+    cdef np.ndarray[INT, ndim=1] label = np.empty(V, np.int)
+    cdef np.ndarray[INT, ndim=1] count = np.empty(V, np.int)
+    cdef np.ndarray[DOUBLE, ndim=1] tent = np.empty(V)
+    for i in range(nseeds):
+        label.fill(-1)
+        count.fill(0)
+        tent.fill(np.inf)
+        with nogil:
+            ret = _dijkstra(V, <INT*>idx.data, <INT*>neighb.data,
+                            <DOUBLE*>weight.data, <INT*>seeds.data + i,
+                            1, 1, cutoff, <DOUBLE*>dg.data + i * V,
+                            <INT*>label.data, <INT*>count.data,
+                            <DOUBLE*>tent.data)
+        if ret < 0:
+            raise MemoryError('could not allocate the Dijkstra heap')
+    return dg
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef INT _geodesic_ball(INT V, INT* idx, INT* neighb, DOUBLE* weight,
+                        INT* seeds, INT nseeds, DOUBLE radius,
+                        DOUBLE* tent, INT** out_seed, INT** out_vert,
+                        DOUBLE** out_dist) nogil:
+    """ Bounded single-source Dijkstra from each seed in turn. The
+    vertices within radius are appended to the output buffers, which
+    are reallocated as needed. tent must be initialized to inf and is
+    restored on exit, so that the cost of each search only depends on
+    the size of the ball. Returns the number of triples, -1 if memory
+    could not be allocated.
+    """
+    cdef INT size = 16, n, nout = 0, osize = 16, start
+    cdef INT i, j, e, u, v
+    cdef DOUBLE d, nd
+    cdef DOUBLE* key = <DOUBLE*>malloc(size * sizeof(DOUBLE))
+    cdef INT* vert = <INT*>malloc(size * sizeof(INT))
+    cdef INT* lab = <INT*>malloc(size * sizeof(INT))
+    cdef INT* oseed = <INT*>malloc(osize * sizeof(INT))
+    cdef INT* overt = <INT*>malloc(osize * sizeof(INT))
+    cdef DOUBLE* odist = <DOUBLE*>malloc(osize * sizeof(DOUBLE))
+    cdef bint failed = (key == NULL or vert == NULL or lab == NULL or
+                        oseed == NULL or overt == NULL or odist == NULL)
+
+    for i in range(nseeds):
+        if failed:
+            break
+        start = nout
+        n = 1
+        key[0], vert[0], lab[0] = 0, seeds[i], i
+        tent[seeds[i]] = 0
+        while n > 0:
+            d, v = key[0], vert[0]
+            _heap_pop(key, vert, lab, n)
+            n -= 1
+            # stale entry: v has been reached with a smaller distance
+            if d > tent[v]:
+                continue
+            if nout == osize:
+                osize *= 2
+                # on failure, overt still holds the ball for the reset
+                # of tent below
+                if _grow(&odist, &oseed, &overt, osize) < 0:
+                    failed = True
+                    break
+            oseed[nout], overt[nout], odist[nout] = i, v, d
+            nout += 1
+
+            for e in range(idx[v], idx[v + 1]):
+                u = neighb[e]
+                nd = d + weight[e]
+                if nd > radius or nd >= tent[u]:
+                    continue
+                tent[u] = nd
+                if n == size:
+                    size *= 2
+                    if _grow(&key, &vert, &lab, size) < 0:
+                        failed = True
+                        break
+                _heap_push(key, vert, lab, n, nd, u, i)
+                n += 1
+            if failed:
+                break
+
+        # every vertex with a finite tentative distance lies in the ball
+        for j in range(start, nout):
+            tent[overt[j]] = INFINITY
+
+    free(key)
+    free(vert)
+    free(lab)
+    if failed:
+        free(oseed)
+        free(overt)
+        free(odist)
+        return -1
+    out_seed[0], out_vert[0], out_dist[0] = oseed, overt, odist
+    return nout
+
+
+def geodesic_ball(np.ndarray[INT, ndim=1] idx,\
+                  np.ndarray[INT, ndim=1] neighb,\
+                  np.ndarray[DOUBLE, ndim=1] weight,\
+                  np.ndarray[INT, ndim=1] seeds,\
+                  double radius):
+    """ Vertices lying within radius of each seed in the graph given
+    by its compact neighbor representation (idx, neighb, weight), with
+    non-negative weights.
+
+    Each search stops expanding at radius, so that the cost scales with
+    the size of the balls rather than with the size of the graph.
+
+    Returns
+    -------
+    seed: array of shape (n,), positions of the seeds within seeds
+    vertex: array of shape (n,), vertices within radius of the seeds
+    dist: array of shape (n,), the corresponding geodesic distances
+
+    The triples are grouped by seed, by increasing distance.
+    """
+    cdef INT V = idx.shape[0] - 1
+    cdef INT nout
+    cdef INT* oseed
+    cdef INT* overt
+    cdef DOUBLE* odist
+    if seeds.shape[0] > 0 and (seeds.min() < 0 or seeds.max() >= V):
+        raise ValueError('seeds should be vertices of the graph')
+    idx = np.ascontiguousarray(idx)
+    neighb = np.ascontiguousarray(neighb)
+    weight = np.ascontiguousarray(weight)
+    seeds = np.ascontiguousarray(seeds)
+    cdef np.ndarray[DOUBLE, ndim=1] tent = np.inf * np.ones(V)
+    with nogil:
+        nout = _geodesic_ball(V, <INT*>idx.data, <INT*>neighb.data,
+                              <DOUBLE*>weight.data, <INT*>seeds.data,
+                              seeds.shape[0], radius, <DOUBLE*>tent.data,
+                              &oseed, &overt, &odist)
+    if nout < 0:
+        raise MemoryError('could not allocate the Dijkstra heap')
+    cdef np.ndarray[INT, ndim=1] seed = np.empty(nout, np.int)
+    cdef np.ndarray[INT, ndim=1] vertex = np.empty(nout, np.int)
+    cdef np.ndarray[DOUBLE, ndim=1] dist = np.empty(nout)
+    memcpy(seed.data, oseed, nout * sizeof(INT))
+    memcpy(vertex.data, overt, nout * sizeof(INT))
+    memcpy(dist.data, odist, nout * sizeof(DOUBLE))
+    free(oseed)
+    free(overt)
+    free(odist)
+    return seed, vertex, dist
@@ -82,6 +82,7 @@ def cross_eps(X, Y, eps=1.):
     matrices X and Y.
     """
     from scipy.sparse import coo_matrix
+    from ..utils.fast_distance import euclidean_eps
     check_feature_matrices(X, Y)
     try:
         eps = float(eps)
@@ -91,17 +92,10 @@ def cross_eps(X, Y, eps=1.):
         raise ValueError('eps is nan')
     if np.isinf(eps):
         raise ValueError('eps is inf')
-    ij = np.zeros((0, 2))
-    data = np.zeros(0)
-    for i, x in enumerate(X):
-        dist = np.sum((Y - x) ** 2, 1)
-        idx = np.asanyarray(np.where(dist < eps))
-        data = np.hstack((data, dist[idx.ravel()]))
-        ij = np.vstack((ij, np.hstack((
-                        i * np.ones((idx.size, 1)), idx.T)))).astype(np.int)
-
-    data = np.maximum(data, 1.e-15)
-    adj = coo_matrix((data, ij.T), shape=(X.shape[0], Y.shape[0]))
+    # note that eps is compared with the squared distances
+    i, j, dist = euclidean_eps(X, Y, np.sqrt(max(eps, 0)))
+    data = np.maximum(dist ** 2, 1.e-15)
+    adj = coo_matrix((data, (i, j)), shape=(X.shape[0], Y.shape[0]))
     return bipartite_graph_from_coo_matrix(adj)
 
 
@@ -124,6 +118,7 @@ def cross_knn(X, Y, k=1):
     PCA-transformed matrices X and Y.
     """
     from scipy.sparse import coo_matrix
+    from ..utils.fast_distance import euclidean_knn
     check_feature_matrices(X, Y)
     try:
         k = int(k)
@@ -135,17 +130,11 @@ def cross_knn(X, Y, k=1):
         raise ValueError('k is inf')
     k = min(k, Y.shape[0] -1)
 
-    ij = np.zeros((0, 2))
-    data = np.zeros(0)
-    for i, x in enumerate(X):
-        dist = np.sum((Y - x) ** 2, 1)
-        idx = np.argsort(dist)[:k]
-        data = np.hstack((data, dist[idx]))
-        ij = np.vstack((ij, np.hstack((
-                        i * np.ones((k, 1)), np.reshape(idx, (k, 1))))))
-
-    data = np.maximum(data, 1.e-15)
-    adj = coo_matrix((data, ij.T), shape=(X.shape[0], Y.shape[0]))
+    idx, dist = euclidean_knn(X, Y, k)
+    i = np.repeat(np.arange(X.shape[0]), k)
+    data = np.maximum(np.ravel(dist) ** 2, 1.e-15)
+    adj = coo_matrix((data, (i, np.ravel(idx))),
+                     shape=(X.shape[0], Y.shape[0]))
     return bipartite_graph_from_coo_matrix(adj)
 
 
@@ -443,11 +443,16 @@ class Field(WeightedGraph):
         if np.size(self.field) == 0:
             raise ValueError('No field has been defined so far')
         seed = seed.astype(np.int)
+        label = self._field_distance_graph().voronoi_labelling(seed)
+        return label
+
+    def _field_distance_graph(self):
+        """ Weighted graph with the same topology as self, weighted by
+        the distances between the field values of the vertices
+        """
         weights = np.sqrt(np.sum((self.field[self.edges[:, 0]] -
                                   self.field[self.edges[:, 1]]) ** 2, 1))
-        g = WeightedGraph(self.V, self.edges, weights)
-        label = g.voronoi_labelling(seed)
-        return label
+        return WeightedGraph(self.V, self.edges, weights)
 
     def geodesic_kmeans(self, seeds=None, label=None, maxiter=100, eps=1.e-4,
                         verbose=0):
@@ -497,8 +502,13 @@ class Field(WeightedGraph):
         else:
             k = np.size(seeds)
 
+        # the graph does not change across iterations
+        from _graph import dijkstra
+        idx, neighb, weights = \
+            self._field_distance_graph()._geodesic_neighb()
         for i in range(maxiter):
-            label = self.constrained_voronoi(seeds)
+            label = dijkstra(idx, neighb, weights,
+                             np.asarray(seeds, np.int))[1][:, 0]
             #update the seeds
             inertia = 0
             pinteria = 0
@@ -348,7 +348,7 @@ def knn(X, k=1):
     The knn system is symmeterized: if (ab) is one of the edges
     then (ba) is also included
     """
-    from ..utils.fast_distance import euclidean_distance
+    from ..utils.fast_distance import euclidean_knn
 
     if np.size(X) == X.shape[0]:
         X = np.reshape(X, (np.size(X), 1))
@@ -360,19 +360,22 @@ def knn(X, k=1):
         raise ValueError('k is nan')
     if np.isinf(k):
         raise ValueError('k is inf')
-    k = min(k, X.shape[0] - 1)
-
-    # create the distance matrix
-    dist = euclidean_distance(X)
-    sorted_dist = dist.copy()
-    sorted_dist.sort(0)
-
-    # neighbour system
-    bool_knn = dist < sorted_dist[k + 1]
-    bool_knn += bool_knn.T
-    bool_knn -= np.diag(np.diag(bool_knn))
-    dist *= (bool_knn > 0)
-    return wgraph_from_adjacency(dist)
+    n = X.shape[0]
+    k = min(k, n - 1)
+
+    # neighbour system: the points closer than the (k + 1)th nearest
+    # one, including the point itself
+    idx, dist = euclidean_knn(X, k=k + 2)
+    if dist.shape[1] > k + 1:
+        threshold = dist[:, k + 1:k + 2]
+    else:
+        threshold = np.infty
+    bool_knn = dist[:, :k + 1] < threshold
+    i = np.repeat(np.arange(n), k + 1)[bool_knn.ravel()]
+    j = idx[:, :k + 1][bool_knn]
+    dist = dist[:, :k + 1][bool_knn]
+    return _wgraph_from_pairs(n, np.hstack((i, j)), np.hstack((j, i)),
+                              np.hstack((dist, dist)))
 
 
 def eps_nn(X, eps=1.):
@@ -387,7 +390,7 @@ def eps_nn(X, eps=1.):
     -------
     the resulting graph instance
     """
-    from ..utils.fast_distance import euclidean_distance
+    from ..utils.fast_distance import euclidean_eps
     if np.size(X) == X.shape[0]:
         X = np.reshape(X, (np.size(X), 1))
     try:
@@ -398,13 +401,27 @@ def eps_nn(X, eps=1.):
         raise ValueError('eps is nan')
     if np.isinf(eps):
         raise ValueError('eps is inf')
-    dist = euclidean_distance(X)
-    dist = np.maximum(dist, 1.e-16)
-    dist[dist >= eps] = 0
+    i, j, dist = euclidean_eps(X, eps=eps)
+    valid = np.maximum(dist, 1.e-16) < eps
+    return _wgraph_from_pairs(X.shape[0], i[valid], j[valid],
+                              np.maximum(dist[valid], 1.e-16))
 
-    # this would is just for numerical reasons
-    dist -= np.diag(np.diag(dist))
-    return wgraph_from_adjacency(dist)
+
+def _wgraph_from_pairs(V, i, j, weights):
+    """ Instantiates a weighted graph from a list of (i, j, weight)
+    triples, with the same edges as wgraph_from_adjacency would yield:
+    self-loops, null weights and duplicate pairs are removed, and the
+    edges are sorted by row, then column
+    """
+    valid = (i != j) & (weights != 0)
+    i, j, weights = i[valid], j[valid], weights[valid]
+    key = i * V + j
+    order = np.argsort(key, kind='mergesort')
+    key, weights = key[order], weights[order]
+    unique = np.hstack((True, np.diff(key) != 0))
+    key, weights = key[unique], weights[unique]
+    edges = np.vstack((key // V, key % V)).T.astype(np.int)
+    return WeightedGraph(V, edges, weights)
 
 
 def lil_cc(lil):
@@ -439,6 +456,35 @@ def lil_cc(lil):
     return label
 
 
+def subgraph_cc(idx, neighb, valid):
+    """ Returns the connected components of a subgraph, given the
+    compact neighbor representation of the whole graph
+
+    Parameters
+    ----------
+    idx: array of shape(V + 1), neighb: array of shape(E),
+         compact representation of the graph,
+         as returned by WeightedGraph.compact_neighb
+    valid: array of shape(V), nonzero for vertices of the subgraph
+
+    Returns
+    -------
+    label: array of shape(V): connected components labelling of the
+           subgraph, in increasing order of the smallest vertex of each
+           component (as in Graph.subgraph(valid).cc()), and -1 for the
+           vertices that are not in the subgraph
+
+    Note
+    ----
+    The compact representation only needs to be computed once, so that
+    many subgraphs of a given graph, e.g. supra-threshold regions of
+    many maps, can be labelled at the cost of a union-find pass
+    """
+    from ._graph import cc_label
+    return cc_label(np.asarray(idx, np.int), np.asarray(neighb, np.int),
+                    (np.asarray(valid) > 0).astype(np.int))
+
+
 def graph_3d_grid(xyz, k=18):
     """ Utility that computes the six neighbors on a 3d grid
 
@@ -647,57 +693,106 @@ class WeightedGraph(Graph):
         A = self.to_coo_matrix().tocsr().tocoo()
         return wgraph_from_coo_matrix(A)
 
-    def dijkstra(self, seed=0):
+    def _geodesic_neighb(self):
+        """ Compact representation of self for shortest path
+        computations, checking that the weights are non-negative
+        """
+        try:
+            if (self.weights < 0).any():
+                raise ValueError('some weights are non-positive')
+        except:
+            raise ValueError('undefined weights')
+        idx, neighb, weights = self.compact_neighb()
+        return idx, neighb, weights.astype(np.float)
+
+    def dijkstra(self, seed=0, cutoff=np.infty):
         """ Returns all the [graph] geodesic distances starting from seed
 x
         Parameters
         ----------
         seed (int, >-1, <self.V) or array of shape(p)
              edge(s) from which the distances are computed
+        cutoff: float, optional,
+                distances larger than cutoff are not computed
 
         Returns
         -------
         dg: array of shape (self.V),
-            the graph distance dg from ant vertex to the nearest seed
+            the graph distance dg from ant vertex to the nearest seed,
+            np.infty beyond cutoff
 
         Note
         ----
         it is mandatory that the graph weights are non-negative
         """
-        import heapq
-        if hasattr(seed, '__iter__') == False:
-            seed = [seed]
-        try:
-            if (self.weights < 0).any():
-                raise ValueError('some weights are non-positive')
-        except:
-            raise ValueError('undefined weights')
-        dist, active = np.infty * np.ones(self.V), np.ones(self.V)
-        idx, neighb, weight = self.compact_neighb()
-        dist[seed] = 0
-        dg = zip(np.zeros_like(seed), seed)
-        heapq.heapify(dg)
-        for j in range(self.V):
-            end = False
-            while True:
-                if len(dg) == 0:
-                    end = True
-                    break
-                node = heapq.heappop(dg)
-                if active[node[1]]:
-                    break
-            if end:
-                break
-            dwin, win = node
-            active[win] = False
-            # the folllowing loop might be vectorized
-            l = neighb[idx[win]: idx[win + 1]]
-            newdist = dwin + weight[idx[win]: idx[win + 1]]
-            who = newdist < dist[l]
-            for  z in zip(newdist[who], l[who]):
-                heapq.heappush(dg, z)
-            dist[l[who]] = newdist[who]
-        return dist
+        return self.nearest_seeds(seed, 1, cutoff)[0][:, 0]
+
+    def nearest_seeds(self, seeds, k=1, cutoff=np.infty):
+        """ Find the k nearest seeds of each vertex in the graph sense
+
+        Parameters
+        ----------
+        seeds: int or array of shape(p), type np.int
+               vertices from which the distances are computed
+        k: int, optional,
+           number of seeds sought for each vertex
+        cutoff: float, optional,
+                seeds further than cutoff are ignored
+
+        Returns
+        -------
+        dist: array of shape (self.V, k),
+              the sorted distances to the k nearest seeds, np.infty
+              when less than k seeds lie within cutoff
+        label: array of shape (self.V, k), type np.int
+               the positions of the k nearest seeds in seeds,
+               -1 when undefined
+
+        Note
+        ----
+        it is mandatory that the graph weights are non-negative
+        """
+        from ._graph import dijkstra
+        if hasattr(seeds, '__iter__') == False:
+            seeds = [seeds]
+        idx, neighb, weights = self._geodesic_neighb()
+        return dijkstra(idx, neighb, weights, np.asarray(seeds, np.int),
+                        k, cutoff)
+
+    def geodesic_ball(self, seeds, radius):
+        """ Find the vertices that lie within radius of each seed
+        in the graph sense
+
+        Parameters
+        ----------
+        seeds: int or array of shape(p), type np.int
+               vertices from which the distances are computed
+        radius: float,
+                the radius of the balls
+
+        Returns
+        -------
+        seed: array of shape(n), type np.int
+              the positions of the seeds in seeds
+        vertex: array of shape(n), type np.int
+                the vertices within radius of the corresponding seeds
+        dist: array of shape(n),
+              the corresponding geodesic distances
+
+        Note
+        ----
+        it is mandatory that the graph weights are non-negative.
+        Unlike floyd, the search stops at radius, so that the cost
+        scales with the size of the balls rather than with self.V.
+        The result can be turned into a (p, self.V) sparse matrix with
+        scipy.sparse.coo_matrix((dist, (seed, vertex)))
+        """
+        from ._graph import geodesic_ball
+        if hasattr(seeds, '__iter__') == False:
+            seeds = [seeds]
+        idx, neighb, weights = self._geodesic_neighb()
+        return geodesic_ball(idx, neighb, weights,
+                             np.asarray(seeds, np.int).ravel(), radius)
 
     def compact_neighb(self):
         """ returns a compact representation of self
@@ -710,6 +805,9 @@ x
         neighb: array of shape(self.E), concatenated list of neighbors
         weights: array of shape(self.E), concatenated list of weights
         """
+        if self.E == 0:
+            return (np.zeros(self.V + 1, np.int), np.array([], np.int), 
+                    np.array([]))
         order = np.argsort(self.edges[:, 0] * float(self.V) + self.edges[:, 1])
         neighb = self.edges[order, 1].astype(np.int)
         weights = self.weights[order]
@@ -717,7 +815,7 @@ x
         idx = np.hstack((0, np.cumsum(degree))).astype(np.int)
         return idx, neighb, weights
 
-    def floyd(self, seed=None):
+    def floyd(self, seed=None, cutoff=np.infty):
         """ Compute all the geodesic distances starting from seeds
 
         Parameters
@@ -725,11 +823,14 @@ x
         seed= None: array of shape (nbseed), type np.int
              vertex indexes from which the distances are computed
              if seed==None, then every edge is a seed point
+        cutoff: float, optional,
+                distances larger than cutoff are not computed
 
         Returns
         -------
         dg array of shape (nbseed, self.V)
-                the graph distance dg from each seed to any vertex
+                the graph distance dg from each seed to any vertex,
+                np.infty beyond cutoff
 
         Note
         ----
@@ -737,14 +838,15 @@ x
         The algorithm  proceeds byr epeating dijkstra's algo for each
             seed. floyd's algo is not used (O(self.V)^3 complexity...)
         """
-        if seed == None:
+        from ._graph import geodesic_distances
+        if seed is None:
             seed = np.arange(self.V)
-        dg = None
-        for s in seed:
-            if dg == None:
-                dg = self.dijkstra(s)
-            else:
-                dg = np.vstack((dg, self.dijkstra(s)))
+        idx, neighb, weights = self._geodesic_neighb()
+        dg = geodesic_distances(idx, neighb, weights,
+                                np.asarray(seed, np.int).ravel(), cutoff)
+        # a single seed yields a one-dimensional array
+        if dg.shape[0] == 1:
+            dg = dg[0]
         return dg
 
     def normalize(self, c=0):
@@ -867,54 +969,23 @@ x
         self.weights = symg.weights
         return self.E
 
-    def voronoi_labelling(self, seed):
+    def voronoi_labelling(self, seed, cutoff=np.infty):
         """ Performs a voronoi labelling of the graph
 
         Parameters
         ----------
         seed: array of shape (nseeds), type (np.int),
               vertices from which the cells are built
+        cutoff: float, optional,
+                vertices further than cutoff from all seeds are not
+                labelled
 
         Returns
         -------
-        labels: array of shape (self.V) the labelling of the vertices
+        labels: array of shape (self.V) the labelling of the vertices,
+                -1 for unreached vertices
         """
-        import heapq
-        if hasattr(seed, '__iter__') == False:
-            seed = [seed]
-        try:
-            if (self.weights < 0).any():
-                raise ValueError('some weights are non-positive')
-        except:
-            raise ValueError('undefined weights')
-        dist, active = np.infty * np.ones(self.V), np.ones(self.V)
-        label = - np.ones(self.V, np.int)
-        idx, neighb, weight = self.compact_neighb()
-        dist[seed] = 0
-        label[seed] = np.arange(len(seed))
-        dg = zip(np.zeros_like(seed), seed)
-        heapq.heapify(dg)
-        for j in range(self.V):
-            end = False
-            while True:
-                if len(dg) == 0:
-                    end = True
-                    break
-                node = heapq.heappop(dg)
-                if active[node[1]]:
-                    break
-            if end:
-                break
-            dwin, win = node
-            active[win] = False
-            # the folllowing loop might be vectorized
-            for i in range(idx[win], idx[win + 1]):
-                l, newdist = neighb[i], dwin + weight[i]
-                if  newdist < dist[l]:
-                    heapq.heappush(dg, (newdist, l))
-                    dist[l] = newdist
-                    label[l] = label[win]
-        return label
+        return self.nearest_seeds(seed, 1, cutoff)[1][:, 0]
 
     def cliques(self):
         """ Extraction of the graphe cliques
@@ -6,7 +6,7 @@ from unittest import TestCase
 
 from ..graph import (WeightedGraph, complete_graph, mst, knn, eps_nn, 
                      wgraph_from_adjacency, wgraph_from_coo_matrix, 
-                     concatenate_graphs, wgraph_from_3d_grid)
+                     concatenate_graphs, wgraph_from_3d_grid, subgraph_cc)
 
 
 def basicdata():
@@ -275,6 +275,42 @@ class test_Graph(TestCase):
         l = G.dijkstra()
         assert (np.absolute(l[10] - 20 * np.sin(np.pi / 20)) < 1.e-7)
         
+    def test_dijkstra_cutoff(self):
+        """ Test dijkstra's algorithm with a distance cutoff
+        """
+        G = basic_graph()
+        l = G.dijkstra(0)
+        lc = G.dijkstra(0, cutoff=1.)
+        assert (lc[l <= 1.] == l[l <= 1.]).all()
+        assert np.isinf(lc[l > 1.]).all()
+
+    def test_nearest_seeds(self):
+        """ Test the k nearest seeds against the distances to each seed
+        """
+        G = basic_graph()
+        seeds = np.array([0, 7])
+        dg = G.floyd(seeds)
+        dist, label = G.nearest_seeds(seeds, k=2)
+        assert np.absolute(dist - np.sort(dg.T, 1)[:, :2]).max() < 1.e-12
+        assert (label[:, 0] == G.voronoi_labelling(seeds)).all()
+        assert (label[:, 0] == np.argmin(dg, 0)).all()
+        dist, label = G.nearest_seeds(seeds, k=2, cutoff=1.)
+        assert (label[dist > 1.] == -1).all()
+
+    def test_geodesic_ball(self):
+        """ Test the geodesic balls against the full distance matrix
+        """
+        G = basic_graph()
+        seeds = np.array([0, 7, 12])
+        radius = 1.5
+        dg = G.floyd(seeds)
+        seed, vertex, dist = G.geodesic_ball(seeds, radius)
+        assert (dist <= radius).all()
+        assert np.absolute(dist - dg[seed, vertex]).max() < 1.e-12
+        assert len(dist) == np.sum(dg <= radius)
+        seed, vertex, dist = G.geodesic_ball(3, 0.)
+        assert (seed == 0).all() and (vertex == 3).all() and (dist == 0).all()
+
     def test_compact_representation(self):
         """ Test that the compact representation of the graph is indeed correct
         """
@@ -405,6 +441,19 @@ class test_Graph(TestCase):
         g = G.subgraph(valid)
         self.assert_(g.edges.max() < n / 2)
 
+    def test_subgraph_cc(self):
+        xyz = np.array(np.where(np.ones((6, 6, 6)))).T
+        G = wgraph_from_3d_grid(xyz, 6)
+        idx, neighb, _ = G.compact_neighb()
+        for p in [0.2, 0.5, 0.8]:
+            valid = nr.rand(G.V) < p
+            label = subgraph_cc(idx, neighb, valid)
+            self.assert_((label[valid == 0] == -1).all())
+            self.assert_((label[valid] == G.subgraph(valid).cc()).all())
+        label = subgraph_cc(idx, neighb, np.zeros(G.V))
+        self.assert_((label == -1).all())
+        self.assert_((subgraph_cc(idx, neighb, np.ones(G.V)) == 0).all())
+
     def test_graph_create_from_array(self):
         """
         Test the creation of a graph from a sparse coo_matrix 
@@ -3,19 +3,129 @@
 """ Image interpolators using ndimage.
 """
 
-import os
-import tempfile
+import threading
+import weakref
 
 import numpy as np
 
 from scipy import ndimage
 
+# Maximum number of spline coefficient arrays kept in memory
+CACHE_SIZE = 4
+# Number of points interpolated at a time
+CHUNK_SIZE = 2 ** 16
+
+_cache = {}
+_cache_order = []
+_cache_lock = threading.Lock()
+# Entries whose image was collected while the cache was locked
+_dead_keys = []
+
+
+def _drop(key, ref):
+    """ Remove the entry `key` if it still holds `ref`; the cache
+    must be locked.
+    """
+    entry = _cache.get(key)
+    if entry is not None and entry[0] is ref:
+        del _cache[key]
+        _cache_order.remove(key)
+
+
+def _purge():
+    """ Remove the entries of the collected images; the cache must be
+    locked.
+    """
+    while _dead_keys:
+        _drop(*_dead_keys.pop())
+
+
+def _evict(key):
+    """ Return the weakref callback that removes the entry `key` once
+    its image is collected.
+    """
+    def callback(ref):
+        # The image may be collected in a thread holding the lock, in
+        # which case the entry is removed at the next cache access
+        if not _cache_lock.acquire(False):
+            _dead_keys.append((key, ref))
+            return
+        try:
+            _drop(key, ref)
+            _purge()
+        finally:
+            _cache_lock.release()
+    return callback
+
+
+def _cached_knots(image, order):
+    """ Return the cached spline coefficients of `image` at the given
+    order, or None.
+
+    Entries are keyed on the identity of the image, and hold a weak
+    reference to it so that a recycled id is never mistaken for the
+    original image. Entries are removed when their image is collected.
+    """
+    key = (id(image), order)
+    _cache_lock.acquire()
+    try:
+        _purge()
+        if not key in _cache:
+            return None
+        ref, data = _cache[key]
+        if ref() is not image:
+            _drop(key, ref)
+            return None
+        _cache_order.remove(key)
+        _cache_order.append(key)
+        return data
+    finally:
+        _cache_lock.release()
+
+
+def _cache_knots(image, order, data):
+    key = (id(image), order)
+    try:
+        ref = weakref.ref(image, _evict(key))
+    except TypeError:
+        # Objects that cannot be weakly referenced are not cached
+        return
+    _cache_lock.acquire()
+    try:
+        _purge()
+        if key in _cache:
+            _cache_order.remove(key)
+        _cache[key] = (ref, data)
+        _cache_order.append(key)
+        while len(_cache_order) > CACHE_SIZE:
+            del _cache[_cache_order.pop(0)]
+    finally:
+        _cache_lock.release()
+
+
+def clear_cache():
+    """ Empty the cache of spline coefficients
+    """
+    _cache_lock.acquire()
+    try:
+        _cache.clear()
+        del _cache_order[:]
+        del _dead_keys[:]
+    finally:
+        _cache_lock.release()
+
+
 class ImageInterpolator(object):
     """ Interpolate Image instance at arbitrary points in world space
-    
+
     The resampling is done with scipy.ndimage.
+
+    The spline coefficients are kept in memory, in a cache shared by
+    all interpolators of the same image and order, so that resampling
+    an image several times only prefilters it once. Note that the
+    cache assumes that the image data are not modified in place.
     """
-    def __init__(self, image, order=3):
+    def __init__(self, image, order=3, memmap=None, cache=True):
         """
         Parameters
         ----------
@@ -24,50 +134,58 @@ class ImageInterpolator(object):
         order : int, optional
            order of spline interpolation as used in scipy.ndimage.
            Default is 3.
+        memmap : None or str, optional
+           If not None, name of a file in which the spline
+           coefficients are stored and memory-mapped, for instance to
+           share them with other processes.
+        cache : bool, optional
+           Whether to look up and store the spline coefficients in
+           the module cache.
         """
         self.image = image
         self.order = order
-        self._datafile = None
+        self.memmap = memmap
+        self.cache = cache
         self._buildknots()
 
     def _buildknots(self):
-        if self.order > 1:
-            data = ndimage.spline_filter(
-                np.nan_to_num(np.asarray(self.image)),
-                self.order)
-        else:
-            data = np.nan_to_num(np.asarray(self.image))
-        if self._datafile is None:
-            _, fname = tempfile.mkstemp()
-            self._datafile = file(fname, mode='wb')
-        else:
-            self._datafile = file(self._datafile.name, 'wb')
-        data = np.nan_to_num(data.astype(np.float64))
-        data.tofile(self._datafile)
-        datashape = data.shape
-        dtype = data.dtype
-        del(data)
-        self._datafile.close()
-        self._datafile = file(self._datafile.name)
-        self.data = np.memmap(self._datafile.name, dtype=dtype,
-                              mode='r+', shape=datashape)
-
-    def __del__(self):
-        if self._datafile:
-            self._datafile.close()
-            try:
-                os.remove(self._datafile.name)
-            except:
-                pass
-
-    def evaluate(self, points):
+        data = None
+        if self.cache:
+            data = _cached_knots(self.image, self.order)
+        if data is None:
+            if self.order > 1:
+                data = ndimage.spline_filter(
+                    np.nan_to_num(np.asarray(self.image)),
+                    self.order)
+            else:
+                data = np.nan_to_num(np.asarray(self.image))
+            data = np.nan_to_num(data.astype(np.float64))
+            # Shared coefficients must not be modified
+            data.flags.writeable = False
+            if self.cache:
+                _cache_knots(self.image, self.order, data)
+        if self.memmap is not None:
+            mdata = np.memmap(self.memmap, dtype=data.dtype, mode='w+',
+                              shape=data.shape)
+            mdata[:] = data
+            mdata.flush()
+            del mdata
+            data = np.memmap(self.memmap, dtype=data.dtype, mode='r',
+                             shape=data.shape)
+        self.data = data
+
+    def evaluate(self, points, chunk_size=CHUNK_SIZE):
         """ Resample image at points in world space
-        
+
         Parameters
         ----------
         points : array
            values in self.image.coordmap.output_coords.  Each row is a
-	   point. 
+	   point.
+        chunk_size : int, optional
+           number of points mapped and interpolated at a time, which
+           bounds the memory used by the intermediate voxel
+           coordinates.
 
         Returns
         -------
@@ -78,11 +196,15 @@ class ImageInterpolator(object):
         output_shape = points.shape[1:]
         points.shape = (points.shape[0], np.product(output_shape))
         cmapi = self.image.coordmap.inverse()
-        voxels = cmapi(points.T).T
-        V = ndimage.map_coordinates(self.data, 
-                                     voxels,
-                                     order=self.order,
-                                     prefilter=False)
+        npts = points.shape[1]
+        V = np.zeros(npts)
+        for start in range(0, npts, chunk_size):
+            sl = slice(start, start + chunk_size)
+            voxels = cmapi(points[:, sl].T).T
+            V[sl] = ndimage.map_coordinates(self.data,
+                                            voxels,
+                                            order=self.order,
+                                            prefilter=False)
         # ndimage.map_coordinates returns a flat array,
         # it needs to be reshaped to the original shape
         V.shape = output_shape
@@ -12,15 +12,19 @@ __version__ = '0.3'
 # Includes
 from numpy cimport (import_array, ndarray, flatiter, broadcast, 
                     PyArray_MultiIterNew, PyArray_MultiIter_DATA, 
-                    PyArray_MultiIter_NEXT)
+                    PyArray_MultiIter_NEXT, PyArray_MultiIter_NOTDONE)
 
 
 # Externals
 cdef extern from "joint_histogram.h":
     void joint_histogram_import_array()
-    int joint_histogram(ndarray H, unsigned int clampI, unsigned int clampJ,  
-                        flatiter iterI, ndarray imJ_padded, 
-                        ndarray Tvox, int interp)
+    int joint_histogram(void* H, unsigned int clampI, unsigned int clampJ,
+                        void* iterI, void* imJ_padded,
+                        void* Tvox, int affine, long interp) nogil
+    int joint_histogram_gradient(ndarray H, ndarray dH,
+                                 unsigned int clampI, unsigned int clampJ,
+                                 flatiter iterI, ndarray imJ_padded,
+                                 ndarray Tvox)
     int L1_moments(double* n, double* median, double* dev, ndarray H)
 
 cdef extern from "cubic_spline.h":
@@ -30,10 +34,10 @@ cdef extern from "cubic_spline.h":
                                  int mode) 
     double cubic_spline_sample2d(double x, double y, ndarray coef, 
                                  int mode_x, int mode_y) 
-    double cubic_spline_sample3d(double x, double y, double z, ndarray coef,
-                                 int mode_x, int mode_y, int mode_z) 
-    double cubic_spline_sample4d(double x, double y, double z, double t, ndarray coef, 
-                                 int mode_x, int mode_y, int mode_z, int mode_t)
+    double cubic_spline_sample3d(double x, double y, double z, void* coef,
+                                 int mode_x, int mode_y, int mode_z) nogil
+    double cubic_spline_sample4d(double x, double y, double z, double t, void* coef,
+                                 int mode_x, int mode_y, int mode_z, int mode_t) nogil
     void cubic_spline_resample3d(ndarray im_resampled, ndarray im, 
                                  double* Tvox, int cast_integer,
                                  int mode_x, int mode_y, int mode_z)
@@ -57,24 +61,65 @@ modes = {'zero': 0, 'nearest': 1, 'reflect': 2}
 def _joint_histogram(ndarray H, flatiter iterI, ndarray imJ, ndarray Tvox, long interp):
     """
     Compute the joint histogram given a transformation trial. 
+
+    `Tvox` is either an array of transformed voxel coordinates with
+    last dimension 3, or a 3x4 affine voxel-to-voxel transformation
+    which is then applied on the fly. The GIL is released during the
+    computation, hence different threads may compute joint histograms
+    concurrently provided that they use distinct `H` and `iterI`
+    objects.
     """
     cdef:
-        double *h, *tvox
         unsigned int clampI, clampJ
-        int ret
+        int affine, ret
+        void *h, *itI, *imj, *tvox
 
     # Views
     clampI = <unsigned int>H.shape[0]
     clampJ = <unsigned int>H.shape[1]    
+    affine = Tvox.shape[Tvox.ndim - 1] == 4
+    if affine and not Tvox.size == 12:
+        raise ValueError('Affine transformation should be a 3x4 array')
+    h = <void*>H
+    itI = <void*>iterI
+    imj = <void*>imJ
+    tvox = <void*>Tvox
 
     # Compute joint histogram 
-    ret = joint_histogram(H, clampI, clampJ, iterI, imJ, Tvox, interp)
+    with nogil:
+        ret = joint_histogram(h, clampI, clampJ, itI, imj, tvox, affine, interp)
     if not ret == 0:
         raise RuntimeError('Joint histogram failed because of incorrect input arrays.')
 
     return 
 
 
+def _joint_histogram_gradient(ndarray H, ndarray dH, flatiter iterI,
+                              ndarray imJ, ndarray Tvox):
+    """
+    Compute the joint histogram using partial volume interpolation
+    and its derivative with respect to the entries of the 3x4 affine
+    voxel-to-voxel transformation `Tvox`.
+    """
+    cdef:
+        unsigned int clampI, clampJ
+        int ret
+
+    clampI = <unsigned int>H.shape[0]
+    clampJ = <unsigned int>H.shape[1]
+    if not (dH.ndim == 3 and dH.shape[0] == clampI
+            and dH.shape[1] == clampJ and dH.shape[2] == 12):
+        raise ValueError('dH should have shape H.shape + (12,)')
+    if not Tvox.size == 12:
+        raise ValueError('Tvox should be a 3x4 array')
+
+    ret = joint_histogram_gradient(H, dH, clampI, clampJ, iterI, imJ, Tvox)
+    if not ret == 0:
+        raise RuntimeError('Joint histogram failed because of incorrect input arrays.')
+
+    return
+
+
 def _L1_moments(ndarray H):
     """
     Compute L1 moments of order 0, 1 and 2 of a one-dimensional
@@ -91,8 +136,15 @@ def _L1_moments(ndarray H):
     return n[0], median[0], dev[0]
 
 
-def _cspline_transform(ndarray x):
-    c = np.zeros([x.shape[i] for i in range(x.ndim)], dtype=np.double)
+def _cspline_transform(ndarray x, dtype=np.double):
+    """
+    Cubic spline coefficients of `x`, stored in either double or
+    single precision depending on `dtype`.
+    """
+    dtype = np.dtype(dtype)
+    if not dtype in (np.dtype(np.double), np.dtype(np.float32)):
+        raise ValueError('spline coefficients must be double or float32')
+    c = np.zeros([x.shape[i] for i in range(x.ndim)], dtype=dtype)
     cubic_spline_transform(c, x)
     return c
 
@@ -129,42 +181,55 @@ def _cspline_sample2d(ndarray R, ndarray C, X=0, Y=0,
 
 def _cspline_sample3d(ndarray R, ndarray C, X=0, Y=0, Z=0, 
                       mx='zero', my='zero', mz='zero'):
+    """
+    In-place cubic spline sampling. R.dtype must be 'double', and
+    C.dtype either 'double' or 'float32'. The GIL is released during
+    sampling.
+    """
     cdef double *r, *x, *y, *z
     cdef broadcast multi
+    cdef void *c = <void*>C
+    cdef int mx_ = modes[mx], my_ = modes[my], mz_ = modes[mz]
     Xa = _reshaped_double(X, R)
     Ya = _reshaped_double(Y, R)
     Za = _reshaped_double(Z, R)
     multi = PyArray_MultiIterNew(4, <void*>R, <void*>Xa, <void*>Ya, <void*>Za)
-    while(multi.index < multi.size):
-        r = <double*>PyArray_MultiIter_DATA(multi, 0)
-        x = <double*>PyArray_MultiIter_DATA(multi, 1)
-        y = <double*>PyArray_MultiIter_DATA(multi, 2)
-        z = <double*>PyArray_MultiIter_DATA(multi, 3)
-        r[0] = cubic_spline_sample3d(x[0], y[0], z[0], C, modes[mx], modes[my], modes[mz])
-        PyArray_MultiIter_NEXT(multi)
+    with nogil:
+        while PyArray_MultiIter_NOTDONE(multi):
+            r = <double*>PyArray_MultiIter_DATA(multi, 0)
+            x = <double*>PyArray_MultiIter_DATA(multi, 1)
+            y = <double*>PyArray_MultiIter_DATA(multi, 2)
+            z = <double*>PyArray_MultiIter_DATA(multi, 3)
+            r[0] = cubic_spline_sample3d(x[0], y[0], z[0], c, mx_, my_, mz_)
+            PyArray_MultiIter_NEXT(multi)
     return R
 
 
 def _cspline_sample4d(ndarray R, ndarray C, X=0, Y=0, Z=0, T=0, 
                       mx='zero', my='zero', mz='zero', mt='zero'):
     """
-    In-place cubic spline sampling. R.dtype must be 'double'. 
+    In-place cubic spline sampling. R.dtype must be 'double', and
+    C.dtype either 'double' or 'float32'. The GIL is released during
+    sampling.
     """
     cdef double *r, *x, *y, *z, *t
     cdef broadcast multi
+    cdef void *c = <void*>C
+    cdef int mx_ = modes[mx], my_ = modes[my], mz_ = modes[mz], mt_ = modes[mt]
     Xa = _reshaped_double(X, R)
     Ya = _reshaped_double(Y, R)
     Za = _reshaped_double(Z, R)
     Ta = _reshaped_double(T, R)
     multi = PyArray_MultiIterNew(5, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta)
-    while(multi.index < multi.size):
-        r = <double*>PyArray_MultiIter_DATA(multi, 0)
-        x = <double*>PyArray_MultiIter_DATA(multi, 1)
-        y = <double*>PyArray_MultiIter_DATA(multi, 2)
-        z = <double*>PyArray_MultiIter_DATA(multi, 3)
-        t = <double*>PyArray_MultiIter_DATA(multi, 4)
-        r[0] = cubic_spline_sample4d(x[0], y[0], z[0], t[0], C, modes[mx], modes[my], modes[mz], modes[mt])
-        PyArray_MultiIter_NEXT(multi)
+    with nogil:
+        while PyArray_MultiIter_NOTDONE(multi):
+            r = <double*>PyArray_MultiIter_DATA(multi, 0)
+            x = <double*>PyArray_MultiIter_DATA(multi, 1)
+            y = <double*>PyArray_MultiIter_DATA(multi, 2)
+            z = <double*>PyArray_MultiIter_DATA(multi, 3)
+            t = <double*>PyArray_MultiIter_DATA(multi, 4)
+            r[0] = cubic_spline_sample4d(x[0], y[0], z[0], t[0], c, mx_, my_, mz_, mt_)
+            PyArray_MultiIter_NEXT(multi)
     return R
 
 
@@ -39,12 +39,24 @@
 #define UPDATE_ITERATOR_COORDS(iter)		\
   iter->contiguous = 0;
 
+/*
+  Spline coefficients may be stored in either single or double
+  precision. Read the coefficient at position pos (in items) as a
+  double.
+*/
+#define COEF_VALUE(coef, pos, is_float)					\
+  ((is_float) ? (double)((float*)(coef))[pos] : ((double*)(coef))[pos])
+
 
 static void _cubic_spline_transform1d(double* res, double* src, unsigned int dim, 
 				      unsigned int res_stride, unsigned int src_stride); 
 static void _cubic_spline_transform(PyArrayObject* res, int axis, double* work); 
 static inline void _copy_double_buffer(double* res, double* src, unsigned int dim,
 				       unsigned int src_stride);
+static inline void _copy_float_buffer(double* res, float* src, unsigned int dim,
+				      unsigned int src_stride);
+static inline void _store_float_buffer(float* res, double* src, unsigned int dim,
+				       unsigned int res_stride);
 static inline int _mirrored_position(int x, unsigned int ddim);
 static inline int _apply_boundary_conditions(int mode, unsigned int ddim, 
 					     double* x, double* w);
@@ -170,26 +182,61 @@ static inline void _copy_double_buffer(double* res, double* src, unsigned int di
   return; 
 }
 
+static inline void _copy_float_buffer(double* res, float* src, unsigned int dim, unsigned int src_stride)
+{
+  unsigned int i; 
+  double *buf_res=res;
+  float *buf_src=src; 
+
+  for (i=0; i<dim; i++, buf_res++, buf_src+=src_stride)
+    *buf_res = (double)*buf_src; 
+
+  return; 
+}
+
+static inline void _store_float_buffer(float* res, double* src, unsigned int dim, unsigned int res_stride)
+{
+  unsigned int i; 
+  float *buf_res=res;
+  double *buf_src=src; 
+
+  for (i=0; i<dim; i++, buf_res+=res_stride, buf_src++)
+    *buf_res = (float)*buf_src; 
+
+  return; 
+}
+
 /*
-  res array must be double. 
+  res array must be double or float. 
   res and src must be of the same size. 
-  work needs be 1d C-style contiguous double with size (at least) equal to res in the axis direction
+  work needs be 1d C-style contiguous double with size (at least)
+  equal to twice the size of res in the axis direction. In single
+  precision, the recursion is computed in double precision and the
+  result is cast when stored.
 */
 
 static void _cubic_spline_transform(PyArrayObject* res, int axis, double* work)
 {
   PyArrayIterObject* iter;
   unsigned int dim, stride;
+  int is_float = (PyArray_TYPE(res) == NPY_FLOAT); 
 
   /* Instantiate iterator and views */ 
   iter = (PyArrayIterObject*)PyArray_IterAllButAxis((PyObject*)res, &axis);
   dim = PyArray_DIM((PyArrayObject*)iter->ao, axis); 
-  stride = PyArray_STRIDE((PyArrayObject*)iter->ao, axis)/sizeof(double); 
+  stride = PyArray_STRIDE((PyArrayObject*)iter->ao, axis)/PyArray_ITEMSIZE(res); 
 
   /* Apply the cubic spline transform along given axis */ 
   while(iter->index < iter->size) {
-    _copy_double_buffer(work, PyArray_ITER_DATA(iter), dim, stride); 
-    _cubic_spline_transform1d(PyArray_ITER_DATA(iter), work, dim, stride, 1); 
+    if (is_float) {
+      _copy_float_buffer(work, PyArray_ITER_DATA(iter), dim, stride); 
+      _cubic_spline_transform1d(work + dim, work, dim, 1, 1); 
+      _store_float_buffer(PyArray_ITER_DATA(iter), work + dim, dim, stride); 
+    }
+    else {
+      _copy_double_buffer(work, PyArray_ITER_DATA(iter), dim, stride); 
+      _cubic_spline_transform1d(PyArray_ITER_DATA(iter), work, dim, stride, 1); 
+    }
     PyArray_ITER_NEXT(iter); 
   }
 
@@ -216,7 +263,7 @@ void cubic_spline_transform(PyArrayObject* res, const PyArrayObject* src)
   }
 
   /* Allocate auxiliary buffer */ 
-  work = (double*)malloc(sizeof(double)*dimmax); 
+  work = (double*)malloc(2*sizeof(double)*dimmax); 
 
   /* Apply separable cubic spline transforms */ 
   for(axis=0; axis<res->nd; axis++) 
@@ -233,9 +280,10 @@ double cubic_spline_sample1d (double x, const PyArrayObject* Coef, int mode)
 {
 
   unsigned int ddim = PyArray_DIM(Coef, 0) - 1; 
-  unsigned int offset = PyArray_STRIDE(Coef, 0)/sizeof(double); 
-  double *coef = PyArray_DATA(Coef); 
-  double *buf;
+  unsigned int offset = PyArray_STRIDE(Coef, 0)/PyArray_ITEMSIZE(Coef); 
+  void *coef = PyArray_DATA(Coef); 
+  int is_float = (PyArray_TYPE(Coef) == NPY_FLOAT); 
+  size_t pos;
   int nx, px, xx;
   double s;
   double bspx[4];
@@ -264,10 +312,10 @@ double cubic_spline_sample1d (double x, const PyArrayObject* Coef, int mode)
   for (xx = nx; xx <= px; xx ++, buf_bspx ++, buf_posx ++) {
     
     /* Point towards the coefficient value at position xx */
-    buf = coef + (*buf_posx)*offset;
+    pos = (*buf_posx)*offset;
     
     /* Update signal value */
-    s += (*buf) * (*buf_bspx);
+    s += COEF_VALUE(coef, pos, is_float) * (*buf_bspx);
     
   }
     
@@ -283,10 +331,11 @@ double cubic_spline_sample2d (double x, double y, const PyArrayObject* Coef,
 
   unsigned int ddimX = PyArray_DIM(Coef, 0) - 1;
   unsigned int ddimY = PyArray_DIM(Coef, 1) - 1;
-  unsigned int offX = PyArray_STRIDE(Coef, 0)/sizeof(double); 
-  unsigned int offY = PyArray_STRIDE(Coef, 1)/sizeof(double); 
-  double *coef = PyArray_DATA(Coef); 
-  double *buf;
+  unsigned int offX = PyArray_STRIDE(Coef, 0)/PyArray_ITEMSIZE(Coef); 
+  unsigned int offY = PyArray_STRIDE(Coef, 1)/PyArray_ITEMSIZE(Coef); 
+  void *coef = PyArray_DATA(Coef); 
+  int is_float = (PyArray_TYPE(Coef) == NPY_FLOAT); 
+  size_t pos;
   int nx, ny, px, py, xx, yy;
   double s, aux;
   double bspx[4], bspy[4];
@@ -333,10 +382,10 @@ double cubic_spline_sample2d (double x, double y, const PyArrayObject* Coef,
     for (xx = nx; xx <= px; xx ++, buf_bspx ++, buf_posx ++) {
     
       /* Point towards the coefficient value at position (xx, yy, zz) */
-      buf = coef + offX*(*buf_posx) + shfty;
+      pos = offX*(*buf_posx) + shfty;
 
       /* Update signal value */
-      aux += (*buf) * (*buf_bspx);
+      aux += COEF_VALUE(coef, pos, is_float) * (*buf_bspx);
     
     }
     
@@ -355,11 +404,12 @@ double cubic_spline_sample3d (double x, double y, double z, const PyArrayObject*
   unsigned int ddimX = PyArray_DIM(Coef, 0) - 1;
   unsigned int ddimY = PyArray_DIM(Coef, 1) - 1;
   unsigned int ddimZ = PyArray_DIM(Coef, 2) - 1;
-  unsigned int offX = PyArray_STRIDE(Coef, 0)/sizeof(double); 
-  unsigned int offY = PyArray_STRIDE(Coef, 1)/sizeof(double); 
-  unsigned int offZ = PyArray_STRIDE(Coef, 2)/sizeof(double); 
-  double *coef = PyArray_DATA(Coef); 
-  double *buf;
+  unsigned int offX = PyArray_STRIDE(Coef, 0)/PyArray_ITEMSIZE(Coef); 
+  unsigned int offY = PyArray_STRIDE(Coef, 1)/PyArray_ITEMSIZE(Coef); 
+  unsigned int offZ = PyArray_STRIDE(Coef, 2)/PyArray_ITEMSIZE(Coef); 
+  void *coef = PyArray_DATA(Coef); 
+  int is_float = (PyArray_TYPE(Coef) == NPY_FLOAT); 
+  size_t pos;
   int nx, ny, nz, px, py, pz;
   int xx, yy, zz;
   double s, aux, aux2;
@@ -422,10 +472,10 @@ double cubic_spline_sample3d (double x, double y, double z, const PyArrayObject*
       for (xx = nx; xx <= px; xx ++, buf_bspx ++, buf_posx ++) {
 	
 	/* Point towards the coefficient value at position (xx, yy, zz) */
-	buf = coef + offX*(*buf_posx) + shftyz;
+	pos = offX*(*buf_posx) + shftyz;
 	
 	/* Update signal value */
-	aux += (*buf) * (*buf_bspx);
+	aux += COEF_VALUE(coef, pos, is_float) * (*buf_bspx);
 	
       } /* end loop on x */
       aux2 += aux * (*buf_bspy); 
@@ -449,12 +499,13 @@ double cubic_spline_sample4d (double x, double y, double z, double t, const PyAr
   unsigned int ddimY = PyArray_DIM(Coef, 1) - 1;
   unsigned int ddimZ = PyArray_DIM(Coef, 2) - 1;
   unsigned int ddimT = PyArray_DIM(Coef, 3) - 1;
-  unsigned int offX = PyArray_STRIDE(Coef, 0)/sizeof(double); 
-  unsigned int offY = PyArray_STRIDE(Coef, 1)/sizeof(double); 
-  unsigned int offZ = PyArray_STRIDE(Coef, 2)/sizeof(double); 
-  unsigned int offT = PyArray_STRIDE(Coef, 3)/sizeof(double); 
-  double *coef = PyArray_DATA(Coef); 
-  double *buf;
+  unsigned int offX = PyArray_STRIDE(Coef, 0)/PyArray_ITEMSIZE(Coef); 
+  unsigned int offY = PyArray_STRIDE(Coef, 1)/PyArray_ITEMSIZE(Coef); 
+  unsigned int offZ = PyArray_STRIDE(Coef, 2)/PyArray_ITEMSIZE(Coef); 
+  unsigned int offT = PyArray_STRIDE(Coef, 3)/PyArray_ITEMSIZE(Coef); 
+  void *coef = PyArray_DATA(Coef); 
+  int is_float = (PyArray_TYPE(Coef) == NPY_FLOAT); 
+  size_t pos;
   int nx, ny, nz, nt, px, py, pz, pt;
   int xx, yy, zz, tt;
   double s, aux, aux2, aux3;
@@ -534,10 +585,10 @@ double cubic_spline_sample4d (double x, double y, double z, double t, const PyAr
 	for (xx = nx; xx <= px; xx ++, buf_bspx ++, buf_posx ++) {
 	  
 	  /* Point towards the coefficient value at position (xx, yy, zz, tt) */
-	  buf = coef + offX*(*buf_posx) + shftyzt;
+	  pos = offX*(*buf_posx) + shftyzt;
 	  
 	  /* Update signal value */
-	  aux += (*buf) * (*buf_bspx);
+	  aux += COEF_VALUE(coef, pos, is_float) * (*buf_bspx);
 	  
 	} /* end loop on x */
 	aux2 += aux * (*buf_bspy); 
@@ -38,7 +38,7 @@ extern "C" {
   /*! 
     \brief Cubic spline transform of a one-dimensional signal 
     \param src input signal 
-    \param res output signal (same size)
+    \param res output signal (same size), either double or float
   */
   extern void cubic_spline_transform(PyArrayObject* res, const PyArrayObject* src);
 
@@ -1,12 +1,15 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 
+import copy
 import gc
+import threading
 import warnings
 import numpy as np
 from nibabel import io_orientation
 
 from ...core.image.affine_image import AffineImage
+from ...utils.parallel import parallel_map, parallel_imap, effective_n_jobs
 from ..utils.affines import apply_affine
 from .image_utils import get_affine
 from .optimizer import configure_optimizer, use_derivatives
@@ -35,6 +38,9 @@ BORDERS = 1, 1, 1
 REFSCAN = 0
 EXTRAPOLATE_SPACE = 'reflect'
 EXTRAPOLATE_TIME = 'reflect'
+TIME_CHUNK = None  # number of frames per spline window, None means all
+TIME_MARGIN = 24  # extra frames used to compute the spline windows
+SPLINE_DTYPE = 'double'
 
 
 def interp_slice_order(Z, slice_order):
@@ -175,6 +181,152 @@ class Image4d(object):
         gc.enable()
         gc.collect()
 
+    def __getstate__(self):
+        # Data proxies (typically bound methods) cannot be pickled, so
+        # ship the array itself when the image is sent to a worker
+        # process. The data are not cached in the original object.
+        state = self.__dict__.copy()
+        if self._data is None:
+            state['_data'] = self._get_data()
+        state['_get_data'] = None
+        return state
+
+
+class ChunkedSpline4d(object):
+    """
+    Cubic spline coefficients of a 4d image, computed on demand over
+    temporal windows so that only a few windows need be held in
+    memory at a time.
+
+    The 4d spline transform is a recursive filter along time, so the
+    coefficients of a window are computed from the data extended by
+    `margin` frames on each side, and truncated. Since the filter
+    pole is about 0.268 in magnitude, the truncation error decays
+    like 0.268 ** margin relative to the data. If the window extends
+    to the whole run, the coefficients are exactly those of the
+    full 4d transform.
+
+    Parameters
+    ----------
+    data : 4d array
+    time_interp : bool
+      If False, each frame is transformed independently as a 3d
+      image.
+    chunk : int or None
+      Number of frames per window; None means the whole run.
+    dtype : {'double', 'float32'}
+      Storage type of the coefficients.
+    margin : int
+      Number of extra frames used to compute each window.
+    max_windows : int
+      Maximum number of windows kept in memory.
+    """
+    _pad = 3
+
+    def __init__(self, data, time_interp=True, chunk=TIME_CHUNK,
+                 dtype=SPLINE_DTYPE, margin=TIME_MARGIN, max_windows=2):
+        self.data = data
+        self.nscans = data.shape[3]
+        self.time_interp = time_interp
+        if chunk is None:
+            chunk = self.nscans
+        self.chunk = max(int(chunk), 1)
+        self.dtype = np.dtype(dtype)
+        self.margin = int(margin)
+        self.max_windows = max(int(max_windows), 1)
+        self._windows = {}
+        self._order = []
+        self._lock = threading.Lock()
+
+    def _compute(self, lo, hi):
+        """
+        Return the coefficients of frames lo to hi (inclusive).
+        """
+        if not self.time_interp:
+            coef = np.zeros(self.data.shape[0:3] + (hi + 1 - lo,),
+                            dtype=self.dtype)
+            for t in range(lo, hi + 1):
+                coef[:, :, :, t - lo] =\
+                    _cspline_transform(self.data[:, :, :, t], self.dtype)
+            return coef
+        a = max(lo - self.margin, 0)
+        b = min(hi + self.margin, self.nscans - 1)
+        coef = _cspline_transform(self.data[:, :, :, a:(b + 1)], self.dtype)
+        if a == lo and b == hi:
+            return coef
+        return coef[:, :, :, (lo - a):(hi + 1 - a)].copy()
+
+    def _chunk_window(self, k):
+        """
+        Return the window (first frame, coefficients) of chunk k,
+        padded with a few frames on each side.
+        """
+        self._lock.acquire()
+        try:
+            if k in self._windows:
+                return self._windows[k]
+            if self.time_interp:
+                pad = self._pad
+            else:
+                pad = 0
+            lo = max(k * self.chunk - pad, 0)
+            hi = min((k + 1) * self.chunk - 1 + pad, self.nscans - 1)
+            self._windows[k] = lo, self._compute(lo, hi)
+            self._order.append(k)
+            while len(self._order) > self.max_windows:
+                del self._windows[self._order.pop(0)]
+            return self._windows[k]
+        finally:
+            self._lock.release()
+
+    def frame(self, t):
+        """
+        Return the 3d coefficients of frame t, assuming no time
+        interpolation.
+        """
+        lo, coef = self._chunk_window(t / self.chunk)
+        return coef[:, :, :, t - lo]
+
+    def _covers(self, lo, hi, tmin, tmax):
+        """
+        Check whether sampling window [lo, hi] at shifted times is
+        equivalent to sampling the whole run at times within [tmin,
+        tmax], including mirror conditions at the run boundaries.
+        """
+        last = self.nscans - 1
+        nmin = int(np.floor(tmin)) - 1
+        nmax = int(np.floor(tmax)) + 2
+        if nmin < lo and (lo > 0 or -nmin > hi):
+            return False
+        if nmax > hi and (hi < last or 2 * last - nmax < lo):
+            return False
+        return True
+
+    def window(self, t, T):
+        """
+        Return coefficients and a time offset t0 such that sampling
+        the coefficients at times T - t0 is equivalent to sampling
+        the full 4d spline at times T, for times T acquired around
+        frame t.
+        """
+        lo, coef = self._chunk_window(t / self.chunk)
+        hi = lo + coef.shape[3] - 1
+        if np.size(T) == 0:
+            return coef, lo
+        tmin, tmax = np.min(T), np.max(T)
+        if self._covers(lo, hi, tmin, tmax):
+            return coef, lo
+        # Unusual timing: compute an ad hoc window
+        lo = int(np.floor(tmin)) - self._pad
+        hi = int(np.floor(tmax)) + self._pad
+        if lo < 0:
+            hi = max(hi, -lo)
+        if hi > self.nscans - 1:
+            lo = min(lo, 2 * (self.nscans - 1) - hi)
+        lo = max(lo, 0)
+        hi = min(hi, self.nscans - 1)
+        return self._compute(lo, hi), lo
+
 
 class Realign4dAlgorithm(object):
 
@@ -193,7 +345,10 @@ class Realign4dAlgorithm(object):
                  stepsize=STEPSIZE,
                  maxiter=MAXITER,
                  maxfun=MAXFUN,
-                 refscan=REFSCAN):
+                 refscan=REFSCAN,
+                 n_jobs=1,
+                 time_chunk=TIME_CHUNK,
+                 spline_dtype=SPLINE_DTYPE):
 
         self.dims = im4d.get_data().shape
         self.nscans = self.dims[3]
@@ -211,15 +366,15 @@ class Realign4dAlgorithm(object):
         self.scanner_time = im4d.scanner_time
         self.timestamps = im4d.tr * np.arange(self.nscans)
 
-        # Compute the 4d cubic spline transform
+        # Cubic spline coefficients, computed on demand over
+        # temporal windows of `time_chunk` frames (one window per
+        # concurrent worker is kept in memory)
         self.time_interp = time_interp
-        if time_interp:
-            self.cbspline = _cspline_transform(im4d.get_data())
-        else:
-            self.cbspline = np.zeros(self.dims, dtype='double')
-            for t in range(self.dims[3]):
-                self.cbspline[:, :, :, t] =\
-                    _cspline_transform(im4d.get_data()[:, :, :, t])
+        self.spline = ChunkedSpline4d(im4d.get_data(),
+                                      time_interp=time_interp,
+                                      chunk=time_chunk,
+                                      dtype=spline_dtype,
+                                      max_windows=effective_n_jobs(n_jobs) + 1)
 
         # The reference scan conventionally defines the head
         # coordinate system
@@ -237,7 +392,14 @@ class Realign4dAlgorithm(object):
                       maxiter=maxiter,
                       maxfun=maxfun)
 
+        # Number of time frames estimated concurrently
+        self.n_jobs = n_jobs
+
         # Auxiliary array for realignment estimation
+        self._init_work_arrays()
+
+    def _init_work_arrays(self):
+        masksize = self.xyz.shape[0]
         self._res = np.zeros(masksize, dtype='double')
         self._res0 = np.zeros(masksize, dtype='double')
         self._aux = np.zeros(masksize, dtype='double')
@@ -257,21 +419,41 @@ class Realign4dAlgorithm(object):
                                  self.inv_affine, self.affine)
         if self.time_interp:
             T = self.scanner_time(Z, self.timestamps[t])
+            coef, t0 = self.spline.window(t, T)
             _cspline_sample4d(self.data[:, t],
-                              self.cbspline,
-                              X, Y, Z, T,
+                              coef,
+                              X, Y, Z, T - t0,
                               mx=EXTRAPOLATE_SPACE,
                               my=EXTRAPOLATE_SPACE,
                               mz=EXTRAPOLATE_SPACE,
                               mt=EXTRAPOLATE_TIME)
         else:
             _cspline_sample3d(self.data[:, t],
-                              self.cbspline[:, :, :, t],
+                              self.spline.frame(t),
                               X, Y, Z,
                               mx=EXTRAPOLATE_SPACE,
                               my=EXTRAPOLATE_SPACE,
                               mz=EXTRAPOLATE_SPACE)
 
+    def _resample_scan(self, xyz, t, out):
+        """
+        Resample time frame `t` on the full grid `xyz` into the 3d
+        array `out`.
+        """
+        X, Y, Z = scanner_coords(xyz, self.transforms[t].as_affine(),
+                                 self.inv_affine, self.affine)
+        if self.time_interp:
+            T = self.scanner_time(Z, self.timestamps[t])
+            coef, t0 = self.spline.window(t, T)
+            _cspline_sample4d(out,
+                              coef,
+                              X, Y, Z, T - t0,
+                              mt='nearest')
+        else:
+            _cspline_sample3d(out,
+                              self.spline.frame(t),
+                              X, Y, Z)
+
     def resample_full_data(self):
         if VERBOSE:
             print('Gridding...')
@@ -280,18 +462,26 @@ class Realign4dAlgorithm(object):
         for t in range(self.nscans):
             if VERBOSE:
                 print('Fully resampling scan %d/%d' % (t + 1, self.nscans))
-            X, Y, Z = scanner_coords(xyz, self.transforms[t].as_affine(),
-                                     self.inv_affine, self.affine)
-            if self.time_interp:
-                T = self.scanner_time(Z, self.timestamps[t])
-                _cspline_sample4d(res[:, :, :, t],
-                                  self.cbspline,
-                                  X, Y, Z, T,
-                                  mt='nearest')
-            else:
-                _cspline_sample3d(res[:, :, :, t],
-                                  self.cbspline[:, :, :, t],
-                                  X, Y, Z)
+            self._resample_scan(xyz, t, res[:, :, :, t])
+        return res
+
+    def resample_mean_data(self):
+        """
+        Return the temporal mean of the fully resampled data, computed
+        one scan at a time so that the resampled 4d array is never
+        held in memory.
+        """
+        if VERBOSE:
+            print('Gridding...')
+        xyz = make_grid(self.dims[0:3])
+        res = np.zeros(self.dims[0:3])
+        buf = np.zeros(self.dims[0:3])
+        for t in range(self.nscans):
+            if VERBOSE:
+                print('Resampling scan %d/%d' % (t + 1, self.nscans))
+            self._resample_scan(xyz, t, buf)
+            res += buf
+        res /= self.nscans
         return res
 
     def set_fmin(self, optimizer, stepsize, **kwargs):
@@ -325,18 +515,36 @@ class Realign4dAlgorithm(object):
         with:
 
         V/V0 = [nV* + (x-m*)^2] / [nV0* + (x-m0*)^2]
+
+        The statistics of the fixed volumes are obtained by removing
+        volume t from the running sums maintained by `_init_stats`.
         """
-        fixed = range(self.nscans)
-        fixed.remove(t)
-        aux = self.data[:, fixed]
+        x = self.data[:, t]
+        m = self.nscans - 1
+        npts = m * self.data.shape[0]
+        self._sum_fixed = self._sum - x
+        self._sumsq_fixed = self._sumsq - x ** 2
         if self.optimize_template:
-            self.mu = np.mean(aux, 1)
-        self.offset = self.nscans * np.mean((aux.T - self.mu) ** 2)
-        self.mu0 = np.mean(aux)
-        self.offset0 = self.nscans * np.mean((aux - self.mu0) ** 2)
+            self.mu = self._sum_fixed / m
+            ssd = self._sumsq_fixed - m * self.mu ** 2
+        else:
+            ssd = self._sumsq_fixed - 2 * self.mu * self._sum_fixed\
+                + m * self.mu ** 2
+        self.offset = self.nscans * np.sum(ssd) / npts
+        self.mu0 = np.sum(self._sum_fixed) / npts
+        self.offset0 = self.nscans *\
+            (np.sum(self._sumsq_fixed) / npts - self.mu0 ** 2)
         self._t = t
         self._pc = None
 
+    def _init_stats(self):
+        """
+        Initialize the running voxelwise sum and sum of squares of the
+        resampled volumes.
+        """
+        self._sum = self.data.sum(1)
+        self._sumsq = (self.data ** 2).sum(1)
+
     def set_transform(self, t, pc):
         self.transforms[t].param = pc
         self.resample(t)
@@ -426,26 +634,52 @@ class Realign4dAlgorithm(object):
         except:
             warnings.warn('Minimization failed')
 
+        # Update the running statistics with the resampled volume
+        self._sum = self._sum_fixed + self.data[:, t]
+        self._sumsq = self._sumsq_fixed + self.data[:, t] ** 2
+
+    def _estimate_frozen_motion(self, t):
+        """
+        Estimate motion at time frame t against the template and
+        statistics frozen at the beginning of the sweep. Work is done
+        on a shallow copy with private work arrays, which shares the
+        data array (each frame only writes its own column) and the
+        transforms with the original object.
+        """
+        worker = copy.copy(self)
+        worker._init_work_arrays()
+        worker.estimate_instant_motion(t)
+
     def estimate_motion(self):
         """
         Optimize motion parameters for the whole sequence. All the
         time frames are initially resampled according to the current
         space/time transformation, the parameters of which are further
         optimized sequentially.
+
+        If `n_jobs` is not 1, the time frames are instead optimized
+        concurrently in a pool of threads, each against the template
+        computed from the volumes resampled at the beginning of the
+        sweep.
         """
         for t in range(self.nscans):
             if VERBOSE:
                 print('Resampling scan %d/%d' % (t + 1, self.nscans))
             self.resample(t)
+        self._init_stats()
 
         # Set the template as the reference scan (will be overwritten
         # if template is to be optimized)
         if not hasattr(self, 'template'):
             self.mu = self.data[:, self.refscan].copy()
-        for t in range(self.nscans):
-            self.estimate_instant_motion(t)
-            if VERBOSE:
-                print(self.transforms[t])
+        if self.n_jobs == 1:
+            for t in range(self.nscans):
+                self.estimate_instant_motion(t)
+                if VERBOSE:
+                    print(self.transforms[t])
+        else:
+            parallel_map(self._estimate_frozen_motion, range(self.nscans),
+                         n_jobs=self.n_jobs)
 
     def align_to_refscan(self):
         """
@@ -463,19 +697,38 @@ class Realign4dAlgorithm(object):
             self.transforms[t] = (self.transforms[t]).compose(Tref_inv)
 
 
-def resample4d(im4d, transforms, time_interp=True):
+def resample4d(im4d, transforms, time_interp=True, time_chunk=TIME_CHUNK,
+               spline_dtype=SPLINE_DTYPE):
     """
     Resample a 4D image according to the specified sequence of spatial
     transforms, using either 4D interpolation if `time_interp` is True
-    and 3D interpolation otherwise.
+    and 3D interpolation otherwise. See `ChunkedSpline4d` for the
+    meaning of `time_chunk` and `spline_dtype`.
     """
     r = Realign4dAlgorithm(im4d, transforms=transforms,
-                           time_interp=time_interp)
+                           time_interp=time_interp,
+                           time_chunk=time_chunk,
+                           spline_dtype=spline_dtype)
     res = r.resample_full_data()
     im4d.free_data()
     return res
 
 
+def resample4d_mean(im4d, transforms, time_interp=True,
+                    time_chunk=TIME_CHUNK, spline_dtype=SPLINE_DTYPE):
+    """
+    Same as `resample4d`, but only return the temporal mean of the
+    resampled 4D image, which is accumulated scan by scan.
+    """
+    r = Realign4dAlgorithm(im4d, transforms=transforms,
+                           time_interp=time_interp,
+                           time_chunk=time_chunk,
+                           spline_dtype=spline_dtype)
+    res = r.resample_mean_data()
+    im4d.free_data()
+    return res
+
+
 def adjust_subsampling(speedup, dims):
     dims = np.array(dims)
     aux = np.maximum(speedup * dims / np.prod(dims) ** (1 / 3.), [1, 1, 1])
@@ -495,7 +748,10 @@ def single_run_realign4d(im4d,
                          stepsize=STEPSIZE,
                          maxiter=MAXITER,
                          maxfun=MAXFUN,
-                         refscan=REFSCAN):
+                         refscan=REFSCAN,
+                         n_jobs=1,
+                         time_chunk=TIME_CHUNK,
+                         spline_dtype=SPLINE_DTYPE):
     """
     Realign a single run in space and time.
 
@@ -506,6 +762,18 @@ def single_run_realign4d(im4d,
     speedup : int or sequence
       If a sequence, implement a multi-scale
 
+    n_jobs : int
+      Number of time frames to estimate concurrently, see
+      `Realign4dAlgorithm.estimate_motion`
+
+    time_chunk : int or None
+      Number of time frames per window of spline coefficients, see
+      `ChunkedSpline4d`. If None, the coefficients of the whole run
+      are held in memory.
+
+    spline_dtype : {'double', 'float32'}
+      Storage type of the spline coefficients
+
     """
     if not hasattr(loops, '__iter__'):
         loops = [loops]
@@ -549,7 +817,10 @@ def single_run_realign4d(im4d,
                                gtol=gtol_,
                                stepsize=stepsize_,
                                maxiter=maxiter_,
-                               maxfun=maxfun_)
+                               maxfun=maxfun_,
+                               n_jobs=n_jobs,
+                               time_chunk=time_chunk,
+                               spline_dtype=spline_dtype)
 
         for loop in range(loops_):
             r.estimate_motion()
@@ -561,6 +832,23 @@ def single_run_realign4d(im4d,
     return transforms
 
 
+def _realign_run(args):
+    """
+    Realign a single run and, if required, compute its corrected mean
+    image. Defined at module level so that it can be sent to worker
+    processes.
+    """
+    run, align_runs, kwargs = args
+    transforms = single_run_realign4d(run, **kwargs)
+    mean_img = None
+    if align_runs:
+        mean_img = resample4d_mean(run, transforms=transforms,
+                                   time_interp=kwargs['time_interp'],
+                                   time_chunk=kwargs['time_chunk'],
+                                   spline_dtype=kwargs['spline_dtype'])
+    return transforms, mean_img
+
+
 def realign4d(runs,
               affine_class=Rigid,
               time_interp=True,
@@ -576,13 +864,32 @@ def realign4d(runs,
               stepsize=STEPSIZE,
               maxiter=MAXITER,
               maxfun=MAXFUN,
-              refscan=REFSCAN):
+              refscan=REFSCAN,
+              n_jobs=1,
+              run_jobs=1,
+              time_chunk=TIME_CHUNK,
+              spline_dtype=SPLINE_DTYPE):
     """
     Parameters
     ----------
 
     runs : list of Image4d objects
 
+    n_jobs : int
+      Number of time frames to estimate concurrently within each run
+
+    run_jobs : int
+      Number of runs to realign concurrently, each in a separate
+      process. The mean image of each corrected run is computed in
+      the same process, so that only 3d arrays are sent back.
+
+    time_chunk : int or None
+      Number of time frames per window of spline coefficients, see
+      `single_run_realign4d`
+
+    spline_dtype : {'double', 'float32'}
+      Storage type of the spline coefficients
+
     Returns
     -------
     transforms : list
@@ -601,21 +908,39 @@ def realign4d(runs,
     if nruns == 1:
         align_runs = False
 
-    # Correct motion and slice timing in each sequence separately
-    transforms = [single_run_realign4d(run,
-                                       affine_class=affine_class,
-                                       time_interp=time_interp,
-                                       loops=loops,
-                                       speedup=speedup,
-                                       borders=borders,
-                                       optimizer=optimizer,
-                                       xtol=xtol,
-                                       ftol=ftol,
-                                       gtol=gtol,
-                                       stepsize=stepsize,
-                                       maxiter=maxiter,
-                                       maxfun=maxfun,
-                                       refscan=refscan) for run in runs]
+    # Correct motion and slice timing in each sequence separately,
+    # computing the mean image of each corrected run on the fly
+    kwargs = dict(affine_class=affine_class,
+                  time_interp=time_interp,
+                  loops=loops,
+                  speedup=speedup,
+                  borders=borders,
+                  optimizer=optimizer,
+                  xtol=xtol,
+                  ftol=ftol,
+                  gtol=gtol,
+                  stepsize=stepsize,
+                  maxiter=maxiter,
+                  maxfun=maxfun,
+                  refscan=refscan,
+                  n_jobs=n_jobs,
+                  time_chunk=time_chunk,
+                  spline_dtype=spline_dtype)
+    transforms = []
+    mean_img_data = None
+    results = parallel_imap(_realign_run,
+                            [(run, align_runs, kwargs) for run in runs],
+                            n_jobs=run_jobs, backend='process')
+    for i, (run_transforms, run_mean) in enumerate(results):
+        transforms.append(run_transforms)
+        if run_mean is None:
+            continue
+        if mean_img_data is None:
+            mean_img_data = np.zeros(list(run_mean.shape) + [nruns])
+        mean_img_data[..., i] = run_mean
+        del run_mean
+        gc.enable()
+        gc.collect()
     if not align_runs:
         return transforms, transforms, None
 
@@ -623,15 +948,6 @@ def realign4d(runs,
     # corrected run, and creating a fake time series with no temporal
     # smoothness
     ## FIXME: check that all runs have the same to-world transform
-    mean_img_shape = list(runs[0].get_data().shape[0:3]) + [nruns]
-    mean_img_data = np.zeros(mean_img_shape)
-
-    for i in range(nruns):
-        corr_run = resample4d(runs[i], transforms=transforms[i],
-                              time_interp=time_interp)
-        mean_img_data[..., i] = corr_run.mean(3)
-        gc.enable()
-        gc.collect()
 
     mean_img = Image4d(mean_img_data, affine=runs[0].affine,
                        tr=1.0, tr_slices=0.0)
@@ -647,7 +963,9 @@ def realign4d(runs,
                                         gtol=gtol,
                                         stepsize=stepsize,
                                         maxiter=maxiter,
-                                        maxfun=maxfun)
+                                        maxfun=maxfun,
+                                        n_jobs=n_jobs,
+                                        spline_dtype=spline_dtype)
 
     # Compose transformations for each run
     ctransforms = [None for i in range(nruns)]
@@ -693,7 +1011,11 @@ class Realign4d(object):
                  stepsize=STEPSIZE,
                  maxiter=MAXITER,
                  maxfun=MAXFUN,
-                 refscan=REFSCAN):
+                 refscan=REFSCAN,
+                 n_jobs=1,
+                 run_jobs=1,
+                 time_chunk=TIME_CHUNK,
+                 spline_dtype=SPLINE_DTYPE):
         if between_loops == None:
             between_loops = loops
         t = realign4d(self._runs,
@@ -711,7 +1033,11 @@ class Realign4d(object):
                       stepsize=stepsize,
                       maxiter=maxiter,
                       maxfun=maxfun,
-                      refscan=refscan)
+                      refscan=refscan,
+                      n_jobs=n_jobs,
+                      run_jobs=run_jobs,
+                      time_chunk=time_chunk,
+                      spline_dtype=spline_dtype)
         self._transforms, self._within_run_transforms,\
             self._mean_transforms = t
 
@@ -9,12 +9,13 @@ from sys import maxint
 import numpy as np
 
 from ...core.image.affine_image import AffineImage
+from ...utils.parallel import parallel_imap
 from .image_utils import get_affine
 from .optimizer import configure_optimizer
 from .affine import inverse_affine, subgrid_affine, affine_transforms
 from .chain_transform import ChainTransform
 from .similarity_measures import similarity_measures as _sms
-from ._registration import _joint_histogram
+from ._registration import _joint_histogram, _joint_histogram_gradient
 
 
 # Module globals
@@ -30,6 +31,9 @@ BINS = 256
 SIMILARITY = 'crl1'
 INTERP = 'pv'
 NPOINTS = 64 ** 3
+PYRAMID = ((16 ** 3, 64), (32 ** 3, 128), (64 ** 3, 256))
+GRADIENT_OPTIMIZERS = ('steepest', 'cg', 'bfgs', 'ncg')
+PARAM_STEP = 1e-4
 
 # Dictionary of interpolation methods (partial volume, trilinear,
 # random)
@@ -104,6 +108,10 @@ class HistogramRegistration(object):
         # passed to C routines which assume so
         self._joint_hist = np.zeros([from_bins, to_bins], dtype='double')
 
+        # Cache of coarse-to-fine optimization levels
+        self._levels = {}
+        self._to_levels = {}
+
         # Set default registration parameters
         self._set_interp(interp)
         self._set_similarity(similarity, **kwargs)
@@ -153,6 +161,7 @@ class HistogramRegistration(object):
             fov_data = self._from_img.get_data()[slicer()]
         self._from_data = fov_data
         self._from_npoints = (fov_data >= 0).sum()
+        self._from_fov = (tuple(corner), tuple(size))
         self._from_affine = subgrid_affine(get_affine(self._from_img),
                                            slicer())
         # We cache the voxel coordinates of the clamped image
@@ -162,6 +171,7 @@ class HistogramRegistration(object):
     def _set_similarity(self, similarity='cr', **kwargs):
         if similarity in _sms:
             self._similarity = similarity
+            self._similarity_kwargs = kwargs
             self._similarity_call =\
                 _sms[similarity](self._joint_hist.shape, **kwargs)
         else:
@@ -197,8 +207,13 @@ class HistogramRegistration(object):
              Transform object implementing ``apply`` method
              Should map voxel space to voxel space
         """
-        # trans_vox_coords needs be C-contiguous
-        trans_vox_coords = Tv.apply(self._vox_coords)
+        # For a chain of affine transforms, pass the voxel-to-voxel
+        # matrix so that transformed coordinates are computed on the
+        # fly. Otherwise, trans_vox_coords needs be C-contiguous
+        if _is_affine_chain(Tv):
+            trans_vox_coords = np.ascontiguousarray(_chain_affine(Tv)[0:3])
+        else:
+            trans_vox_coords = Tv.apply(self._vox_coords)
         interp = self._interp
         if self._interp < 0:
             interp = - np.random.randint(maxint)
@@ -209,7 +224,106 @@ class HistogramRegistration(object):
                          interp)
         return self._similarity_call(self._joint_hist)
 
-    def optimize(self, T, optimizer=OPTIMIZER, **kwargs):
+    def _eval_gradient(self, Tv):
+        """
+        Evaluate the similarity function and its gradient with respect
+        to the parameters of an affine voxel-to-voxel transform, using
+        partial volume interpolation.
+
+        Parameters
+        ----------
+        Tv : ChainTransform
+             Chain of affine transforms mapping voxel space to voxel
+             space
+
+        Returns
+        -------
+        s : float
+          Similarity value
+        ds : ndarray
+          Derivative of the similarity wrt `Tv.param`
+        """
+        # Derivative of the 3x4 voxel-to-voxel matrix wrt the
+        # transform parameters, computed by central differences
+        param = Tv.param
+        dA = np.zeros((param.size, 12))
+        for k in range(param.size):
+            dp = np.zeros(param.size)
+            dp[k] = PARAM_STEP
+            Tv.param = param + dp
+            dA[k] = _chain_affine(Tv)[0:3].ravel()
+            Tv.param = param - dp
+            dA[k] -= _chain_affine(Tv)[0:3].ravel()
+        dA /= 2 * PARAM_STEP
+        Tv.param = param
+
+        # Joint histogram and its derivative wrt the matrix entries
+        dH = np.zeros(self._joint_hist.shape + (12,), dtype='double')
+        A = np.ascontiguousarray(_chain_affine(Tv)[0:3])
+        _joint_histogram_gradient(self._joint_hist, dH,
+                                  self._from_data.flat,  # array iterator
+                                  self._to_data, A)
+        s = self._similarity_call(self._joint_hist)
+        G = self._similarity_call.gradient(self._joint_hist)
+        return s, np.dot(dA, np.dot(G.ravel(), dH.reshape((-1, 12))))
+
+    def _use_gradient(self, optimizer, T):
+        """
+        Check whether the analytic similarity gradient can be used,
+        i.e. for a derivative-based optimizer, an affine transform,
+        partial volume interpolation and a similarity measure
+        implementing a `gradient` method.
+        """
+        return optimizer in GRADIENT_OPTIMIZERS\
+            and hasattr(T, 'as_affine')\
+            and self._interp == interp_methods['pv']\
+            and hasattr(self._similarity_call, 'gradient')
+
+    def _get_state(self):
+        return dict([(key, getattr(self, key)) for key in
+                     ('_from_data', '_from_npoints', '_from_fov',
+                      '_from_affine', '_vox_coords', '_to_data',
+                      '_joint_hist', '_similarity_call')])
+
+    def _set_state(self, state):
+        for key in state:
+            setattr(self, key, state[key])
+
+    def _set_level(self, npoints, bins, state):
+        """
+        Switch to a cached pyramid level, i.e. a subsampling of the
+        `from` image field of view with roughly `npoints` voxels and a
+        joint histogram with at most `bins` bins along each axis.
+        Levels are derived from the full resolution `state`, and keep
+        its field of view.
+        """
+        from_bins, to_bins = state['_joint_hist'].shape
+        if not bins == None:
+            from_bins = min(from_bins, bins)
+            to_bins = min(to_bins, bins)
+        corner, size = state['_from_fov']
+        key = (corner, size, npoints, from_bins, to_bins)
+        if not key in self._levels:
+            self.subsample(corner=corner, size=size, npoints=npoints)
+            self._levels[key] = {
+                '_from_data': rebin(self._from_data,
+                                    state['_joint_hist'].shape[0],
+                                    from_bins),
+                '_from_npoints': self._from_npoints,
+                '_from_affine': self._from_affine,
+                '_vox_coords': self._vox_coords}
+        if not to_bins in self._to_levels:
+            self._to_levels[to_bins] = rebin(state['_to_data'],
+                                             state['_joint_hist'].shape[1],
+                                             to_bins)
+        self._set_state(self._levels[key])
+        self._to_data = self._to_levels[to_bins]
+        self._joint_hist = np.zeros([from_bins, to_bins], dtype='double')
+        if self._similarity in _sms:
+            self._similarity_call = _sms[self._similarity](
+                self._joint_hist.shape, **self._similarity_kwargs)
+
+    def optimize(self, T, optimizer=OPTIMIZER, pyramid=None, **kwargs):
         """ Optimize transform `T` with respect to similarity measure.
 
         The input object `T` will change as a result of the optimization.
@@ -224,7 +338,17 @@ class HistogramRegistration(object):
           initialized by default.
         optimizer : str
           Name of optimization function (one of 'powell', 'steepest',
-          'cg', 'bfgs', 'simplex')
+          'cg', 'bfgs', 'simplex'). With a derivative-based optimizer
+          and an affine transform, the analytic similarity gradient
+          is used for 'mi', 'nmi', 'cr' and 'crl1' provided that
+          interpolation is 'pv'.
+        pyramid : None, True or sequence of (npoints, bins) pairs
+          If not None, optimize in a coarse-to-fine manner, each level
+          being initialized with the transform found at the previous
+          one. A level subsamples the field of view set by
+          `subsample` to roughly `npoints` voxels and reduces the joint
+          histogram to at most `bins` bins (None meaning no reduction). True uses the
+          default schedule `PYRAMID`. Levels are cached across calls.
         **kwargs : dict
           keyword arguments to pass to optimizer
         """
@@ -232,6 +356,24 @@ class HistogramRegistration(object):
         if T in affine_transforms:
             T = affine_transforms[T]()
 
+        # Coarse-to-fine optimization, restoring the current
+        # subsampling and binning on exit
+        if pyramid:
+            if pyramid is True:
+                pyramid = PYRAMID
+            state = self._get_state()
+            try:
+                for npoints, bins in pyramid:
+                    self._set_level(npoints, bins, state)
+                    if VERBOSE:
+                        print('Pyramid level: npoints=%d, bins=%s'
+                              % (self._from_npoints,
+                                 self._joint_hist.shape))
+                    T = self.optimize(T, optimizer, **kwargs.copy())
+            finally:
+                self._set_state(state)
+            return T
+
         # Pull callback out of keyword arguments, if present
         callback = kwargs.pop('callback', None)
 
@@ -245,6 +387,26 @@ class HistogramRegistration(object):
             Tv.param = tc
             return -self._eval(Tv)
 
+        # If possible, compute the similarity along with its gradient
+        # in a single pass and cache both for the optimizer's next
+        # function or gradient call
+        fprime = None
+        if self._use_gradient(optimizer, T):
+            last = [None, None, None]
+
+            def eval_gradient(tc):
+                if last[0] is None or not np.all(last[0] == tc):
+                    Tv.param = tc
+                    s, ds = self._eval_gradient(Tv)
+                    last[:] = [np.array(tc), -s, -ds]
+                return last[1], last[2]
+
+            def cost(tc):
+                return eval_gradient(tc)[0]
+
+            def fprime(tc):
+                return eval_gradient(tc)[1]
+
         # Callback during optimization
         if callback == None and VERBOSE:
 
@@ -266,7 +428,7 @@ class HistogramRegistration(object):
         kwargs.setdefault('maxfun', MAXFUN)
 
         fmin, args, kwargs = configure_optimizer(optimizer,
-                                                 fprime=None,
+                                                 fprime=fprime,
                                                  fhess=None,
                                                  **kwargs)
 
@@ -276,7 +438,71 @@ class HistogramRegistration(object):
         Tv.param = fmin(cost, tc0, *args, callback=callback, **kwargs)
         return Tv.optimizable
 
-    def explore(self, T0, *args):
+    def eval_batch(self, T, params, n_jobs=1):
+        """
+        Evaluate the similarity function at a batch of transform
+        parameters.
+
+        For affine transforms, the joint histograms are computed
+        concurrently in `n_jobs` threads, each voxel-to-voxel
+        transformation being applied on the fly to the voxel
+        coordinates. Other transforms are evaluated serially.
+
+        Parameters
+        ----------
+        T : Transform
+          Transform object implementing ``apply`` method and ``param``
+          attribute or property. Its parameters are left unchanged.
+        params : ndarray (ntrials, nparams)
+          Parameter values to assign to `T`
+        n_jobs : int
+          Number of worker threads; negative values count backwards
+          from the number of CPUs
+
+        Returns
+        -------
+        simis : ndarray (ntrials,)
+          Similarity values
+        """
+        params = np.atleast_2d(params)
+        ntrials = params.shape[0]
+        simis = np.zeros(ntrials)
+        Tv = ChainTransform(T, pre=self._from_affine,
+                            post=self._to_inv_affine)
+        param0 = Tv.param
+
+        if not _is_affine_chain(Tv):
+            for i in range(ntrials):
+                Tv.param = params[i]
+                simis[i] = self._eval(Tv)
+            Tv.param = param0
+            return simis
+
+        # Voxel-to-voxel matrices and interpolation seeds are set up
+        # beforehand in the calling thread
+        trials = []
+        for i in range(ntrials):
+            Tv.param = params[i]
+            interp = self._interp
+            if self._interp < 0:
+                interp = - np.random.randint(maxint)
+            trials.append((np.ascontiguousarray(_chain_affine(Tv)[0:3]),
+                           interp))
+        Tv.param = param0
+
+        def histogram(trial):
+            H = np.zeros(self._joint_hist.shape, dtype='double')
+            _joint_histogram(H, self._from_data.flat, self._to_data,
+                             trial[0], trial[1])
+            return H
+
+        # Similarity measures may hold state, hence they are
+        # evaluated in the calling thread as histograms come in
+        for i, H in enumerate(parallel_imap(histogram, trials, n_jobs)):
+            simis[i] = self._similarity_call(H)
+        return simis
+
+    def explore(self, T0, *args, **kwargs):
         """
         Evaluate the similarity at the transformations specified by
         sequences of parameter values.
@@ -284,28 +510,42 @@ class HistogramRegistration(object):
         For instance:
 
         explore(T0, (0, [-1,0,1]), (4, [-2.,2]))
+
+        The keyword argument `n_jobs` sets the number of threads used
+        to evaluate the trials, see `eval_batch`.
         """
+        n_jobs = kwargs.pop('n_jobs', 1)
+        if kwargs:
+            raise TypeError('unexpected keyword argument(s): %s'
+                            % ', '.join(kwargs.keys()))
         nparams = T0.param.size
         deltas = [[0] for i in range(nparams)]
         for a in args:
             deltas[a[0]] = a[1]
         grids = np.mgrid[[slice(0, len(d)) for d in deltas]]
-        ntrials = np.prod(grids.shape[1:])
         Deltas = [np.asarray(deltas[i])[grids[i, :]].ravel()\
                       for i in range(nparams)]
-        simis = np.zeros(ntrials)
-        params = np.zeros([nparams, ntrials])
+        params = T0.param[:, np.newaxis] + np.array(Deltas)
+        simis = self.eval_batch(T0, params.T, n_jobs=n_jobs)
+        return simis, params
 
-        Tv = ChainTransform(T0, pre=self._from_affine,
-                            post=self._to_inv_affine)
-        param0 = Tv.param
-        for i in range(ntrials):
-            param = param0 + np.array([D[i] for D in Deltas])
-            Tv.param = param
-            simis[i] = self._eval(Tv)
-            params[:, i] = param
 
-        return simis, params
+def _is_affine_chain(Tv):
+    """
+    Check whether a transform is a chain of affine transforms.
+    """
+    return isinstance(Tv, ChainTransform)\
+        and hasattr(Tv.optimizable, 'as_affine')\
+        and hasattr(Tv.pre, 'as_affine')\
+        and hasattr(Tv.post, 'as_affine')
+
+
+def _chain_affine(Tv):
+    """
+    4x4 matrix of a chain of affine transforms.
+    """
+    return np.dot(Tv.post.as_affine(),
+                  np.dot(Tv.optimizable.as_affine(), Tv.pre.as_affine()))
 
 
 def _clamp(x, y, bins=BINS, mask=None):
@@ -373,6 +613,34 @@ def clamp(x, bins=BINS, mask=None):
     return y, bins
 
 
+def rebin(x, bins, new_bins):
+    """
+    Reduce the number of bins of a clamped array, leaving masked
+    values (-1) unchanged.
+
+    Parameters
+    ----------
+    x : ndarray
+      Clamped array with values in [0..bins-1] or -1
+
+    bins : number
+      Number of bins of the input array
+
+    new_bins : number
+      Desired number of bins, ignored if not smaller than `bins`
+
+    Returns
+    -------
+    y : ndarray
+      Clamped array with values in [0..new_bins-1] or -1
+    """
+    if new_bins >= bins:
+        return x
+    y = ((x.astype('int') * new_bins) // bins).astype(CLAMP_DTYPE)
+    y[x < 0] = -1
+    return y
+
+
 def ideal_spacing(data, npoints):
     """
     Tune spacing factors so that the number of voxels in the
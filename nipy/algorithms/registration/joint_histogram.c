@@ -15,6 +15,8 @@
 #define inline __inline
 #endif
 
+static inline void _next_coordinates(npy_intp* x, npy_intp* y, npy_intp* z,
+				     npy_intp dimY, npy_intp dimZ);
 static inline void _pv_interpolation(unsigned int i, 
 				     double* H, unsigned int clampJ, 
 				     const signed short* J, 
@@ -56,13 +58,19 @@ H : assumed C-contiguous.
 
 Tvox : assumed C-contiguous: 
 
-  either a 3x4=12-sized array (or bigger) for an affine transformation
+  either a 3x4=12-sized array for an affine transformation (affine
+  non-zero), which is then applied on the fly to the voxel
+  coordinates of the source image
 
   or a 3xN array for a pre-computed transformation, with N equal to
   the size of the array corresponding to iterI (no checking done)
 
 Negative intensities are ignored.  
 
+No Python object is created or reference counted, so that the
+function may be called without holding the GIL provided that each
+thread uses its own source iterator and joint histogram.
+
 */
 
 #define APPEND_NEIGHBOR(q, w)			\
@@ -79,6 +87,7 @@ int joint_histogram(PyArrayObject* JH,
 		    PyArrayIterObject* iterI,
 		    const PyArrayObject* imJ_padded, 
 		    const PyArrayObject* Tvox, 
+		    int affine,
 		    long interp)
 {
   const signed short* J=(signed short*)imJ_padded->data; 
@@ -103,6 +112,7 @@ int joint_histogram(PyArrayObject* JH,
   double *H = (double*)PyArray_DATA(JH);  
   double Tx, Ty, Tz; 
   double *tvox = (double*)PyArray_DATA(Tvox); 
+  npy_intp x=0, y=0, z=0, dimY=0, dimZ=0;
   void (*interpolate)(unsigned int, double*, unsigned int, const signed short*, const double*, int, void*); 
   void* interp_params = NULL; 
   prng_state rng; 
@@ -133,6 +143,14 @@ int joint_histogram(PyArrayObject* JH,
     fprintf(stderr, "Invalid type for the array iterator\n");
     return -1; 
   }
+  if (affine) {
+    if (PyArray_NDIM(iterI->ao) != 3) {
+      fprintf(stderr, "Source image should be three-dimensional\n");
+      return -1;
+    }
+    dimY = PyArray_DIM(iterI->ao, 1);
+    dimZ = PyArray_DIM(iterI->ao, 2);
+  }
   if ( (!PyArray_ISCONTIGUOUS(imJ_padded)) || 
        (!PyArray_ISCONTIGUOUS(JH)) ||
        (!PyArray_ISCONTIGUOUS(Tvox)) ) {
@@ -165,9 +183,17 @@ int joint_histogram(PyArrayObject* JH,
     i = bufI[0];
 
     /* Compute the transformed grid coordinates of current voxel */ 
-    Tx = *tvox; tvox++;
-    Ty = *tvox; tvox++;
-    Tz = *tvox; tvox++; 
+    if (affine) {
+      Tx = tvox[0]*x + tvox[1]*y + tvox[2]*z + tvox[3];
+      Ty = tvox[4]*x + tvox[5]*y + tvox[6]*z + tvox[7];
+      Tz = tvox[8]*x + tvox[9]*y + tvox[10]*z + tvox[11];
+      _next_coordinates(&x, &y, &z, dimY, dimZ);
+    }
+    else {
+      Tx = *tvox; tvox++;
+      Ty = *tvox; tvox++;
+      Tz = *tvox; tvox++; 
+    }
 
     /* Test whether the current voxel is below the intensity
        threshold, or the transformed point is completly outside
@@ -261,6 +287,148 @@ int joint_histogram(PyArrayObject* JH,
 }
 
 
+/*
+
+JOINT HISTOGRAM AND DERIVATIVE COMPUTATION, PV INTERPOLATION.
+
+Tvox : assumed to be a C-contiguous 3x4 array representing an affine
+transformation, which is applied on the fly to the source voxel
+coordinates.
+
+dH : assumed C-contiguous with shape (clampI, clampJ, 12). dH[i,j,k]
+is the derivative of H[i,j] with respect to the k-th entry of Tvox
+(row-major order).
+
+The PV weight of a neighbor with offset (dx, dy, dz) is the product
+fx*fy*fz, where fx=wx if dx==0 and fx=1-wx otherwise, and wx=nx-Tx.
+Its derivative wrt Tx is thus -fy*fz if dx==0 and fy*fz otherwise.
+
+*/
+
+int joint_histogram_gradient(PyArrayObject* JH,
+			     PyArrayObject* dJH,
+			     unsigned int clampI,
+			     unsigned int clampJ,
+			     PyArrayIterObject* iterI,
+			     const PyArrayObject* imJ_padded,
+			     const PyArrayObject* Tvox)
+{
+  const signed short* J=(signed short*)imJ_padded->data;
+  size_t dimJX=imJ_padded->dimensions[0]-2;
+  size_t dimJY=imJ_padded->dimensions[1]-2;
+  size_t dimJZ=imJ_padded->dimensions[2]-2;
+  size_t u2 = imJ_padded->dimensions[2];
+  size_t u4 = imJ_padded->dimensions[1]*u2;
+  size_t off, offn;
+  double *H = (double*)PyArray_DATA(JH);
+  double *dH = (double*)PyArray_DATA(dJH);
+  const double *A = (const double*)PyArray_DATA(Tvox);
+  double *h, *dh;
+  signed short *bufI;
+  signed short i, j;
+  int nx, ny, nz, dx, dy, dz, a;
+  npy_intp x=0, y=0, z=0, dimY, dimZ;
+  double Tx, Ty, Tz;
+  double f[3][2], w, g[3];
+
+  if (PyArray_TYPE(iterI->ao) != NPY_SHORT) {
+    fprintf(stderr, "Invalid type for the array iterator\n");
+    return -1;
+  }
+  if ( (!PyArray_ISCONTIGUOUS(imJ_padded)) ||
+       (!PyArray_ISCONTIGUOUS(JH)) ||
+       (!PyArray_ISCONTIGUOUS(dJH)) ||
+       (!PyArray_ISCONTIGUOUS(Tvox)) ) {
+    fprintf(stderr, "Some non-contiguous arrays\n");
+    return -1;
+  }
+
+  if (PyArray_NDIM(iterI->ao) != 3) {
+    fprintf(stderr, "Source image should be three-dimensional\n");
+    return -1;
+  }
+  dimY = PyArray_DIM(iterI->ao, 1);
+  dimZ = PyArray_DIM(iterI->ao, 2);
+
+  PyArray_ITER_RESET(iterI);
+  memset((void*)H, 0, clampI*clampJ*sizeof(double));
+  memset((void*)dH, 0, 12*clampI*clampJ*sizeof(double));
+
+  while(iterI->index < iterI->size) {
+
+    bufI = (signed short*)PyArray_ITER_DATA(iterI);
+    i = bufI[0];
+
+    /* Transform the source voxel coordinates */
+    Tx = A[0]*x + A[1]*y + A[2]*z + A[3];
+    Ty = A[4]*x + A[5]*y + A[6]*z + A[7];
+    Tz = A[8]*x + A[9]*y + A[10]*z + A[11];
+
+    if ((i>=0) &&
+	(Tx>-1) && (Tx<dimJX) &&
+	(Ty>-1) && (Ty<dimJY) &&
+	(Tz>-1) && (Tz<dimJZ)) {
+
+      nx = FLOOR(Tx) + 1;
+      ny = FLOOR(Ty) + 1;
+      nz = FLOOR(Tz) + 1;
+      f[0][0] = nx - Tx; f[0][1] = 1 - f[0][0];
+      f[1][0] = ny - Ty; f[1][1] = 1 - f[1][0];
+      f[2][0] = nz - Tz; f[2][1] = 1 - f[2][0];
+      off = nx*u4 + ny*u2 + nz;
+
+      for (dx=0; dx<2; dx++)
+	for (dy=0; dy<2; dy++)
+	  for (dz=0; dz<2; dz++) {
+	    offn = off + dx*u4 + dy*u2 + dz;
+	    j = J[offn];
+	    if (j<0)
+	      continue;
+	    w = f[0][dx]*f[1][dy]*f[2][dz];
+	    g[0] = (2*dx-1)*f[1][dy]*f[2][dz];
+	    g[1] = (2*dy-1)*f[0][dx]*f[2][dz];
+	    g[2] = (2*dz-1)*f[0][dx]*f[1][dy];
+	    h = H + i*clampJ + j;
+	    *h += w;
+	    dh = dH + 12*(i*clampJ + j);
+	    for (a=0; a<3; a++, dh+=4) {
+	      dh[0] += g[a]*x;
+	      dh[1] += g[a]*y;
+	      dh[2] += g[a]*z;
+	      dh[3] += g[a];
+	    }
+	  }
+    }
+
+    _next_coordinates(&x, &y, &z, dimY, dimZ);
+    PyArray_ITER_NEXT(iterI);
+  }
+
+  return 0;
+}
+
+
+/*
+   Move to the next voxel coordinates in C order. The iterator
+   coordinates are not maintained for contiguous arrays, hence we keep
+   track of them ourselves.
+*/
+static inline void _next_coordinates(npy_intp* x, npy_intp* y, npy_intp* z,
+				     npy_intp dimY, npy_intp dimZ)
+{
+  (*z) ++;
+  if (*z == dimZ) {
+    *z = 0;
+    (*y) ++;
+    if (*y == dimY) {
+      *y = 0;
+      (*x) ++;
+    }
+  }
+  return;
+}
+
+
 /* Partial Volume interpolation. See Maes et al, IEEE TMI, 2007. */ 
 static inline void _pv_interpolation(unsigned int i, 
 				     double* H, unsigned int clampJ, 
@@ -34,6 +34,10 @@ extern "C" {
      i (source intensities) are row indices 
      j (target intensities) are column indices
 
+     affine: if non-zero, Tvox is a 3x4 affine voxel-to-voxel
+     transformation, otherwise an array of transformed voxel
+     coordinates.
+
      interp: 
        0 - PV interpolation
        1 - TRILINEAR interpolation 
@@ -45,8 +49,24 @@ extern "C" {
 			     PyArrayIterObject* iterI,
 			     const PyArrayObject* imJ_padded, 
 			     const PyArrayObject* Tvox, 
+			     int affine,
 			     long interp); 
 
+  /*
+     Same as joint_histogram using PV interpolation, but for an
+     affine voxel-to-voxel transformation Tvox (3x4 C-contiguous
+     matrix). Also computes the derivative dH of the joint histogram
+     with respect to the 12 entries of Tvox. dH is assumed
+     C-contiguous with shape (clampI, clampJ, 12).
+  */
+  extern int joint_histogram_gradient(PyArrayObject* H,
+				      PyArrayObject* dH,
+				      unsigned int clampI,
+				      unsigned int clampJ,
+				      PyArrayIterObject* iterI,
+				      const PyArrayObject* imJ_padded,
+				      const PyArrayObject* Tvox);
+
   extern int L1_moments(double* n_, double* median_, double* dev_, 
 			const PyArrayObject* H);
 
@@ -14,6 +14,13 @@ def nonzero(x):
     return np.maximum(x, TINY)
 
 
+def nonzero_log(x):
+    """
+    Logarithm of x where x is strictly positive, zero elsewhere.
+    """
+    return np.log(nonzero(x)) * (x > 0)
+
+
 def dist2loss(dist, margI=None, margJ=None):
     L = dist
     LT = L.T
@@ -63,6 +70,16 @@ class MutualInformation(SimilarityMeasure):
     def loss(self, H):
         return dist2loss(H / nonzero(self.npoints(H)))
 
+    def gradient(self, H):
+        """
+        dMI/dH = [log p(i,j)/p(i)p(j) - MI] / n. Empty bins are
+        assumed not to contribute to the log term.
+        """
+        npts = nonzero(self.npoints(H))
+        mi = self(H)
+        G = -self.loss(H) * (H > 0) - mi
+        return G / npts
+
 
 class ParzenMutualInformation(SimilarityMeasure):
 
@@ -104,6 +121,21 @@ class NormalizedMutualInformation(SimilarityMeasure):
         HJ = -np.sum(self.hJ * np.log(nonzero(self.hJ)))
         return 2 * (1 - HIJ / nonzero(HI + HJ))
 
+    def gradient(self, H):
+        """
+        Use dE/dH = -[log p + E] / n for the joint and marginal
+        entropies.
+        """
+        npts = nonzero(self.npoints(H))
+        HIJ = self.averaged_loss(H)
+        HI = -np.sum(self.hI * np.log(nonzero(self.hI)))
+        HJ = -np.sum(self.hJ * np.log(nonzero(self.hJ)))
+        M = nonzero(HI + HJ)
+        dHIJ = -nonzero_log(H / npts) - HIJ
+        dM = -nonzero_log(self.hJ)[:, np.newaxis] - nonzero_log(self.hI)\
+            - (HI + HJ)
+        return -2 * (dHIJ - (HIJ / M) * dM) / (M * npts)
+
 
 class CorrelationCoefficient(SimilarityMeasure):
 
@@ -154,6 +186,16 @@ class CorrelationRatio(SimilarityMeasure):
         mean_vI_J = np.sum(hJ * self.vI_J) / tmp
         return 1. - mean_vI_J / nonzero(self.vI)
 
+    def gradient(self, H):
+        """
+        Writing CR = 1 - W/T with W the sum of conditional squared
+        deviations and T the total sum of squared deviations.
+        """
+        cr = self(H)
+        dW = (self.I - self.mI_J[:, np.newaxis]) ** 2
+        dT = (self.I - self.mI) ** 2
+        return -(dW - (1. - cr) * dT) / nonzero(self.npts * self.vI)
+
 
 class CorrelationRatioL1(SimilarityMeasure):     
 
@@ -173,6 +215,16 @@ class CorrelationRatioL1(SimilarityMeasure):
         mean_sI_J = np.sum(hJ * self.sI_J) / nonzero(self.npts)
         return 1. - mean_sI_J / nonzero(self.sI)
 
+    def gradient(self, H):
+        """
+        Same as for the correlation ratio using absolute deviations
+        from the medians, which are locally constant.
+        """
+        cr = self(H)
+        dW = np.abs(self.I - self.mI_J[:, np.newaxis])
+        dT = np.abs(self.I - self.mI)
+        return -(dW - (1. - cr) * dT) / nonzero(self.npts * self.sI)
+
 
 similarity_measures = {
     'slr': SupervisedLikelihoodRatio,
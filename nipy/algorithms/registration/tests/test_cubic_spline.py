@@ -34,3 +34,15 @@ def test_sample4d():
     args = list(x) + ['nearest' for i in range(4)]
     b = _cspline_sample4d(b, c, *args)
     assert_array_almost_equal(a, b)
+
+
+def test_sample4d_float32():
+    a = np.random.rand(4, 5, 6, 7)
+    c = _cspline_transform(a, dtype='float32')
+    assert_equal(c.dtype, np.float32)
+    assert_array_almost_equal(c, _cspline_transform(a), decimal=5)
+    x = np.mgrid[0:4, 0:5, 0:6, 0:7]
+    b = np.zeros(a.shape)
+    b = _cspline_sample4d(b, c, *list(x))
+    assert_array_almost_equal(a, b, decimal=5)
+    assert_raises(ValueError, _cspline_transform, a, 'int16')
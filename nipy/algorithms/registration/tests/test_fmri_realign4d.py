@@ -9,7 +9,10 @@ import numpy as np
 from .... import load_image
 from ....testing import funcfile
 
-from ..groupwise_registration import Image4d, resample4d, FmriRealign4d
+from ..groupwise_registration import (Image4d, resample4d, resample4d_mean,
+                                     realign4d, FmriRealign4d,
+                                     Realign4dAlgorithm, ChunkedSpline4d)
+from .._registration import _cspline_transform, _cspline_sample4d
 from ..affine import Rigid
 
 im = load_image(funcfile)
@@ -42,3 +45,101 @@ def test_realign4d():
     runs = [im, im]
     R = FmriRealign4d(runs, tr=2., slice_order='ascending', interleaved=False)
     R.estimate(refscan=None, loops=(1, 0), between_loops=(1, 0))
+
+
+def _make_im4d():
+    affine = np.eye(4)
+    affine[0:3, 0:3] = im.affine[0:3, 0:3]
+    return Image4d(im.get_data(), affine, tr=2.)
+
+
+def _test_instant_motion_stats(optimize_template):
+    im4d = _make_im4d()
+    r = Realign4dAlgorithm(im4d, subsampling=(4, 4, 4),
+                           optimize_template=optimize_template)
+    for t in range(r.nscans):
+        r.resample(t)
+    r._init_stats()
+    r.mu = r.data[:, 0].copy()
+    t = 3
+    r.init_instant_motion(t)
+    # Compare with explicit leave-one-out statistics
+    fixed = range(r.nscans)
+    fixed.remove(t)
+    aux = r.data[:, fixed]
+    if optimize_template:
+        assert_array_almost_equal(r.mu, np.mean(aux, 1))
+    offset = r.nscans * np.mean((aux.T - r.mu) ** 2)
+    offset0 = r.nscans * np.mean((aux - np.mean(aux)) ** 2)
+    assert_array_almost_equal(r.mu0, np.mean(aux))
+    assert_array_almost_equal(r.offset / offset, 1)
+    assert_array_almost_equal(r.offset0 / offset0, 1)
+
+
+def test_instant_motion_stats():
+    _test_instant_motion_stats(True)
+    _test_instant_motion_stats(False)
+
+
+def test_estimate_motion_parallel():
+    im4d = _make_im4d()
+    r = Realign4dAlgorithm(im4d, subsampling=(4, 4, 4), n_jobs=2)
+    r.estimate_motion()
+    r1 = Realign4dAlgorithm(im4d, subsampling=(4, 4, 4))
+    r1.estimate_motion()
+    for t in range(r.nscans):
+        assert np.all(np.isfinite(r.transforms[t].param))
+    # Frame 0 is estimated against the same template in both modes
+    assert_array_almost_equal(r.transforms[0].param,
+                              r1.transforms[0].param)
+
+
+def test_resample4d_mean():
+    im4d = _make_im4d()
+    transforms = []
+    for i in range(im.shape[3]):
+        T = Rigid()
+        T.param = .1 * np.random.rand(6)
+        transforms.append(T)
+    x = resample4d(im4d, transforms)
+    m = resample4d_mean(im4d, transforms)
+    assert_array_almost_equal(m, x.mean(3))
+
+
+def test_realign4d_parallel_runs():
+    runs = [_make_im4d(), _make_im4d()]
+    kwargs = dict(loops=(1, 0), between_loops=(1, 0), speedup=(5, 2))
+    t, t0, tm = realign4d(runs, **kwargs)
+    tp, tp0, tpm = realign4d(runs, run_jobs=2, **kwargs)
+    for r in range(len(runs)):
+        assert_array_almost_equal(tpm[r].param, tm[r].param)
+        for i in range(len(t[r])):
+            assert_array_almost_equal(tp[r][i].param, t[r][i].param)
+
+
+def test_chunked_spline():
+    data = np.random.rand(5, 6, 4, 40)
+    full = _cspline_transform(data)
+    spline = ChunkedSpline4d(data, chunk=7)
+    X, Y, Z = [np.random.rand(50) * (d - 1) for d in data.shape[0:3]]
+    a = np.zeros(50)
+    b = np.zeros(50)
+    for t in range(data.shape[3]):
+        # times before and past the frame, the latter requiring an
+        # ad hoc window
+        for shift in (-1, 3.5):
+            T = t + shift * np.random.rand(50)
+            coef, t0 = spline.window(t, T)
+            for mt in ('reflect', 'nearest'):
+                _cspline_sample4d(a, full, X, Y, Z, T, mt=mt)
+                _cspline_sample4d(b, coef, X, Y, Z, T - t0, mt=mt)
+                assert_array_almost_equal(a, b)
+    assert len(spline._windows) <= spline.max_windows
+
+
+def test_resample4d_chunked():
+    im4d = _make_im4d()
+    transforms = [Rigid() for i in range(im.shape[3])]
+    x = resample4d(im4d, transforms)
+    y = resample4d(im4d, transforms, time_chunk=3, spline_dtype='float32')
+    assert_array_almost_equal(y / abs(x).max(), x / abs(x).max())
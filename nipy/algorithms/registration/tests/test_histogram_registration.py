@@ -4,7 +4,9 @@ import numpy as np
 
 from ....core.image.affine_image import AffineImage
 from ..affine import Affine
-from ..histogram_registration import HistogramRegistration
+from ..chain_transform import ChainTransform
+from ..histogram_registration import HistogramRegistration, rebin
+from ..similarity_measures import similarity_measures
 from .._registration import _joint_histogram
 
 from numpy.testing import assert_array_equal
@@ -128,12 +130,123 @@ def test_joint_hist_raw():
     assert_almost_equal(np.diag(np.diag(jh_arr)), jh_arr)
 
 
+def test_similarity_gradient():
+    H = 10 * np.random.rand(7, 9)
+    H[2, 3] = 0
+    for simi in ('mi', 'nmi', 'cr', 'crl1'):
+        S = similarity_measures[simi](H.shape)
+        G = S.gradient(H)
+        for idx in ((0, 0), (4, 8), (6, 2)):
+            dH = np.zeros(H.shape)
+            dH[idx] = 1e-6
+            assert_almost_equal((S(H + dH) - S(H - dH)) / 2e-6, G[idx])
+
+
+def test_eval_gradient():
+    I = AffineImage(make_data_int16(20, 20, 10), dummy_affine, 'ijk')
+    R = HistogramRegistration(I, I, similarity='cr')
+    T = Affine()
+    T.translation = [.3, -.2, .4]
+    T.rotation = [.01, -.02, .01]
+    Tv = ChainTransform(T, pre=R._from_affine, post=R._to_inv_affine)
+    s, ds = R._eval_gradient(Tv)
+    # The joint histogram matches the standard PV computation
+    H = R._joint_hist.copy()
+    assert_almost_equal(s, R._eval(Tv))
+    assert_almost_equal(H, R._joint_hist)
+    # Compare the gradient with finite differences
+    p = Tv.param.copy()
+    for k in range(6):
+        dp = np.zeros(p.size)
+        dp[k] = 1e-5
+        Tv.param = p + dp
+        sp = R._eval(Tv)
+        Tv.param = p - dp
+        sm = R._eval(Tv)
+        assert_almost_equal((sp - sm) / 2e-5, ds[k], decimal=4)
+
+
+def test_eval_affine_chain():
+    # The on-the-fly affine path matches precomputed coordinates
+    I = AffineImage(make_data_int16(), dummy_affine, 'ijk')
+    J = AffineImage(make_data_int16(), dummy_affine, 'ijk')
+    R = HistogramRegistration(I, J)
+    R.subsample(spacing=[2, 1, 3])
+    T = Affine(np.random.rand(12))
+    Tv = ChainTransform(T, pre=R._from_affine, post=R._to_inv_affine)
+    R._eval(Tv)
+    H = np.zeros(R._joint_hist.shape)
+    _joint_histogram(H, R._from_data.flat, R._to_data,
+                     Tv.apply(R._vox_coords), 0)
+    assert_almost_equal(R._joint_hist, H)
+
+
 def test_explore():
     I = AffineImage(make_data_int16(), dummy_affine, 'ijk')
     J = AffineImage(make_data_int16(), dummy_affine, 'ijk')
     R = HistogramRegistration(I, J)
     T = Affine()
     simi, params = R.explore(T, (0, [-1, 0, 1]), (1, [-1, 0, 1]))
+    assert_equal(simi.shape, (9,))
+    assert_equal(params.shape, (12, 9))
+
+
+def test_eval_batch():
+    I = AffineImage(make_data_int16(), dummy_affine, 'ijk')
+    J = AffineImage(make_data_int16(), dummy_affine, 'ijk')
+    R = HistogramRegistration(I, J)
+    T = Affine()
+    params = np.random.rand(5, 12)
+    simis = R.eval_batch(T, params, n_jobs=2)
+    assert_array_equal(T.param, np.zeros(12))
+    Tv = ChainTransform(T, pre=R._from_affine, post=R._to_inv_affine)
+    for i in range(5):
+        Tv.param = params[i]
+        assert_almost_equal(simis[i], R._eval(Tv))
+
+
+def test_rebin():
+    x = np.array([-1, 0, 1, 127, 128, 255], dtype='short')
+    assert_array_equal(rebin(x, 256, 64), [-1, 0, 0, 31, 32, 63])
+    assert rebin(x, 256, 256) is x
+
+
+def test_pyramid():
+    I = AffineImage(make_data_int16(), dummy_affine, 'ijk')
+    J = AffineImage(I.get_data().copy(), dummy_affine, 'ijk')
+    R = HistogramRegistration(I, J, similarity='cc')
+    R.subsample(spacing=[2, 2, 2])
+    from_data, joint_hist = R._from_data, R._joint_hist
+    T = Affine()
+    T.translation = [1, 0, 0]
+    T = R.optimize(T, pyramid=((8 ** 3, 32), (16 ** 3, None)))
+    # Levels are cached and the original subsampling is restored
+    assert_equal(len(R._levels), 2)
+    assert_equal(sorted(R._to_levels.keys()), [32, 256])
+    assert R._from_data is from_data
+    assert R._joint_hist is joint_hist
+    assert_equal(R._similarity_call.shape, joint_hist.shape)
+    R.optimize(T.copy(), pyramid=((8 ** 3, 32),))
+    assert_equal(len(R._levels), 2)
+
+
+
+def test_pyramid_fov():
+    I = AffineImage(make_data_int16(), dummy_affine, 'ijk')
+    J = AffineImage(I.get_data().copy(), dummy_affine, 'ijk')
+    R = HistogramRegistration(I, J, similarity='cc')
+    corner, size = [10, 20, 5], [40, 30, 20]
+    R.subsample(corner=corner, size=size, spacing=[1, 1, 1])
+    R.optimize(Affine(), pyramid=((8 ** 3, 32),))
+    # The level subsamples the field of view set by the caller
+    level, = R._levels.values()
+    assert_array_equal(level['_from_affine'][0:3, 3], corner)
+    assert np.all(np.array(level['_from_data'].shape) <= size)
+    assert_equal(R._from_fov, (tuple(corner), tuple(size)))
+    # Another field of view does not reuse the cached level
+    R.subsample(spacing=[2, 2, 2])
+    R.optimize(Affine(), pyramid=((8 ** 3, 32),))
+    assert_equal(len(R._levels), 2)
 
 
 def test_histogram_registration():
@@ -650,7 +650,15 @@ class Formula(object):
         at a given set of parameter values to be specified by
         a recarray and observed Term values, also specified
         by a recarray.
+
+        The callable only depends on the terms of the Formula, so that
+        it is only rebuilt when these change.
         """
+        # Renaming and lambdifying the design expression is costly,
+        # reuse the callable as long as the terms are unchanged.
+        key = tuple(self.terms)
+        if getattr(self, '_design_key', None) == key:
+            return
         # the design expression is the differentiation of the expression
         # for the mean.  It is a list
         d = self.design_expr
@@ -737,6 +745,8 @@ class Formula(object):
                         'preterm':np.dtype([(n, np.float) for n in preterm])}
 
         self.__terms = terms
+        self._design_key = key
+        self._last_design = None
 
     def design(self,
                input,
@@ -786,12 +796,27 @@ class Formula(object):
                 raise ValueError("for param, expecting a recarray with "
                                  "dtype having the following names: %s"
                                  % `self._dtypes['param'].names`)
+        # Float designs are typically evaluated over and over at the same
+        # input, e.g. once per data slice in fmristat; keep the last one.
+        cache_key = None
+        if return_float and not contrasts \
+                and not preterm_recarray.dtype.hasobject:
+            cache_key = (preterm_recarray.dtype.descr,
+                         preterm_recarray.tostring())
+            if param_recarray is not None:
+                cache_key += (param_recarray.dtype.descr,
+                              param_recarray.tostring())
+            if self._last_design is not None \
+                    and self._last_design[0] == cache_key:
+                return self._last_design[1].copy()
         # If the only term is an intercept,
         # the return value is a matrix of 1's.
         if list(self.terms) == [sympy.Number(1)]:
             a = np.ones(preterm_recarray.shape[0], np.float)
             if not return_float:
                 a = a.view(np.dtype([('intercept', np.float)]))
+            elif cache_key is not None:
+                self._last_design = (cache_key, a.copy())
             return a
         elif not self._dtypes['term']:
             raise ValueError("none of the expresssions are self.terms "
@@ -862,6 +887,8 @@ class Formula(object):
                 else:
                     _D = D
                 pinvD = np.linalg.pinv(_D)
+            elif cache_key is not None:
+                self._last_design = (cache_key, D.copy())
         else:
             # Correct the dtype.
             # XXX There seems to be a lot of messing around with the dtype.
@@ -233,6 +233,31 @@ def test_design():
     yield assert_almost_equal, ff.design(n)['1'], 1
 
 
+def test_design_cache():
+    # Check that repeated designs reuse the compiled and float designs
+    t1 = F.Term("x")
+    t2 = F.Term('y')
+    f = t1.formula + t2.formula + F.I
+    n = F.make_recarray([(2,3),(4,5),(5,6)], 'xy')
+    d1 = f.design(n, return_float=True)
+    func = f._f
+    d2 = f.design(n, return_float=True)
+    yield assert_true, f._f is func
+    yield assert_almost_equal, d1, d2
+    # modifying the returned design does not affect the cache
+    d2[:] = 0
+    yield assert_almost_equal, f.design(n, return_float=True), d1
+    # a different input gives a different design
+    n2 = F.make_recarray([(2,3),(4,5),(5,7)], 'xy')
+    d3 = f.design(n2, return_float=True)
+    yield assert_true, f._f is func
+    yield assert_almost_equal, d3[:, list(f.dtype.names).index('y')], \
+        [3, 5, 7]
+    # changing the terms rebuilds the compiled design
+    f._terms = f._terms[:-1]
+    yield assert_equal, f.design(n, return_float=True).shape, (3, 2)
+
+
 def test_alias():
     x = F.Term('x')
     f = implemented_function('f', lambda x: 2*x)
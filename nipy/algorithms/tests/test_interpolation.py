@@ -0,0 +1,76 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+""" Testing image interpolator
+"""
+
+from __future__ import with_statement
+
+import numpy as np
+
+from nibabel.tmpdirs import InTemporaryDirectory
+
+from nipy.core.api import AffineTransform, Image
+from nipy.algorithms.interpolation import ImageInterpolator, clear_cache
+
+from nose.tools import assert_true, assert_false
+
+from numpy.testing import assert_array_almost_equal
+
+
+def _make_image():
+    cmap = AffineTransform.from_params('ijk', 'xyz', np.diag([2, 3, 4, 1]))
+    return Image(np.random.standard_normal((10, 11, 12)), cmap)
+
+
+def test_interpolator_cache():
+    clear_cache()
+    img = _make_image()
+    interp = ImageInterpolator(img)
+    # Coefficients are shared by interpolators of the same image and
+    # order, and read-only
+    yield assert_true, ImageInterpolator(img).data is interp.data
+    yield assert_false, ImageInterpolator(img, order=1).data is interp.data
+    yield assert_false, ImageInterpolator(_make_image()).data is interp.data
+    yield (assert_false,
+           ImageInterpolator(img, cache=False).data is interp.data)
+    yield assert_false, interp.data.flags.writeable
+    clear_cache()
+    yield assert_false, ImageInterpolator(img).data is interp.data
+
+
+def test_interpolator_cache_eviction():
+    # Coefficients are dropped from the cache with their image
+    from nipy.algorithms import interpolation
+    clear_cache()
+    img = _make_image()
+    interp = ImageInterpolator(img)
+    ImageInterpolator(_make_image(), order=1)
+    yield assert_true, len(interpolation._cache) == 1
+    del img, interp
+    yield assert_true, len(interpolation._cache) == 0
+    yield assert_true, len(interpolation._cache_order) == 0
+
+
+def test_evaluate_chunks():
+    img = _make_image()
+    interp = ImageInterpolator(img)
+    points = np.random.uniform(0, 20, size=(3, 5, 7))
+    v = interp.evaluate(points)
+    yield assert_true, v.shape == (5, 7)
+    yield assert_array_almost_equal, interp.evaluate(points, chunk_size=4), v
+    # Values at grid points are interpolated exactly
+    ijk = np.array([[1, 2, 3], [4, 5, 6]]).T
+    xyz = ijk * np.array([[2, 3, 4]]).T
+    yield (assert_array_almost_equal, interp.evaluate(xyz),
+           np.asarray(img)[tuple(ijk)])
+
+
+def test_interpolator_memmap():
+    img = _make_image()
+    points = np.random.uniform(0, 20, size=(3, 10))
+    with InTemporaryDirectory():
+        interp = ImageInterpolator(img, memmap='knots.dat')
+        assert_true(isinstance(interp.data, np.memmap))
+        assert_array_almost_equal(interp.evaluate(points),
+                                  ImageInterpolator(img).evaluate(points))
+        del interp
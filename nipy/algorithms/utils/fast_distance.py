@@ -1,14 +1,68 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 """
-this module contains a function to perform fast distance computation on arrays
+this module contains functions to perform fast distance computation on arrays,
+working on blocks of rows to bound the memory load
+
 
 Author : Bertrand Thirion, 2008-2011
 """
 import numpy as np
 
+# default memory budget (in bytes) of the blocks of the distance matrix
+MAX_MEMORY = 2 ** 26
+
+
+def _check_features(X, Y=None):
+    """ Reshape 1D arrays to column arrays and check the consistency of
+    the dimensions of X and Y
+    """
+    if np.size(X) == X.shape[0]:
+        X = np.reshape(X, (np.size(X), 1))
+    if Y is None:
+        return X, X
+    if np.size(Y) == Y.shape[0]:
+        Y = np.reshape(Y, (np.size(Y), 1))
+    if X.shape[1] != Y.shape[1]:
+        raise ValueError("incompatible dimension for X and Y matrices")
+    return X, Y
+
+
+def distance_blocks(X, Y=None, max_memory=MAX_MEMORY):
+    """
+    Iterate over blocks of rows of the euclidean distance matrix between
+    the rows of X and Y, so that the full matrix is never held in memory
+
+    Parameters
+    ----------
+    X, array of shape (n1,p)
+    Y=None, array of shape (n2,p)
+            if Y==None, then Y=X is used instead
+    max_memory: int, optional,
+                the maximal size (in bytes) of each block
+
+    Returns
+    -------
+    an iterator of (start, block) pairs, where block is the array of
+    shape (n, n2) of the distances between X[start:start + n] and Y
+    """
+    X, Y = _check_features(X, Y)
+    n1, n2 = X.shape[0], Y.shape[0]
+    NX = np.sum(X * X, 1)
+    NY = np.sum(Y * Y, 1)
+    step = max(1, int(max_memory // (8 * max(n2, 1))))
+    for start in range(0, n1, step):
+        stop = min(start + step, n1)
+        block = np.dot(X[start:stop], Y.T)
+        block *= - 2
+        block += NX[start:stop, np.newaxis]
+        block += NY
+        np.maximum(block, 0, block)
+        np.sqrt(block, block)
+        yield start, block
+
 
-def euclidean_distance(X, Y=None):
+def euclidean_distance(X, Y=None, max_memory=MAX_MEMORY):
     """
     Considering the rows of X (and Y=X) as vectors, compute the
     distance matrix between each pair of vectors
@@ -18,23 +72,107 @@ def euclidean_distance(X, Y=None):
     X, array of shape (n1,p)
     Y=None, array of shape (n2,p)
             if Y==None, then Y=X is used instead
+    max_memory: int, optional,
+                the maximal size (in bytes) of the temporary blocks
 
     Returns
     -------
     ED, array fo shape(n1, n2) with all the pairwise distance
     """
-    if Y == None:
-        Y = X
-    if X.shape[1] != Y.shape[1]:
-        raise ValueError("incompatible dimension for X and Y matrices")
-
-    n1 = X.shape[0]
-    n2 = Y.shape[0]
-    NX = np.reshape(np.sum(X * X, 1), (n1, 1))
-    NY = np.reshape(np.sum(Y * Y, 1), (1, n2))
-    ED = np.repeat(NX, n2, 1)
-    ED += np.repeat(NY, n1, 0)
-    ED -= 2 * np.dot(X, Y.T)
-    ED = np.maximum(ED, 0)
-    ED = np.sqrt(ED)
+    X, Y = _check_features(X, Y)
+    ED = np.empty((X.shape[0], Y.shape[0]))
+    for start, block in distance_blocks(X, Y, max_memory):
+        ED[start:start + block.shape[0]] = block
     return ED
+
+
+def euclidean_argmin(X, Y=None, max_memory=MAX_MEMORY):
+    """
+    Find the nearest row of Y for each row of X
+
+    Parameters
+    ----------
+    X, array of shape (n1,p)
+    Y=None, array of shape (n2,p)
+            if Y==None, then Y=X is used instead
+    max_memory: int, optional,
+                the maximal size (in bytes) of the temporary blocks
+
+    Returns
+    -------
+    idx, array of shape(n1), the index of the nearest row of Y
+    dist, array of shape(n1), the corresponding distance
+    """
+    return [x[:, 0] for x in euclidean_knn(X, Y, 1, max_memory)]
+
+
+def euclidean_knn(X, Y=None, k=1, max_memory=MAX_MEMORY):
+    """
+    Find the k nearest rows of Y for each row of X
+
+    Parameters
+    ----------
+    X, array of shape (n1,p)
+    Y=None, array of shape (n2,p)
+            if Y==None, then Y=X is used instead
+    k: int, optional,
+       the number of neighbours, at most n2
+    max_memory: int, optional,
+                the maximal size (in bytes) of the temporary blocks
+
+    Returns
+    -------
+    idx, array of shape(n1, k), the indexes of the k nearest rows of Y
+    dist, array of shape(n1, k), the corresponding distances,
+          in increasing order
+    """
+    X, Y = _check_features(X, Y)
+    k = min(int(k), Y.shape[0])
+    idx = np.zeros((X.shape[0], k), np.int)
+    dist = np.zeros((X.shape[0], k))
+    for start, block in distance_blocks(X, Y, max_memory):
+        rows = np.arange(block.shape[0])[:, np.newaxis]
+        if k < block.shape[1] and hasattr(np, 'argpartition'):
+            bidx = np.argpartition(block, k - 1, 1)[:, :k]
+        else:
+            bidx = np.argsort(block, 1)[:, :k]
+        bdist = block[rows, bidx]
+        order = np.argsort(bdist, 1, kind='mergesort')
+        stop = start + block.shape[0]
+        idx[start:stop] = bidx[rows, order]
+        dist[start:stop] = bdist[rows, order]
+    return idx, dist
+
+
+def euclidean_eps(X, Y=None, eps=1., max_memory=MAX_MEMORY):
+    """
+    Find the pairs of rows of X and Y that are closer than eps
+
+    Parameters
+    ----------
+    X, array of shape (n1,p)
+    Y=None, array of shape (n2,p)
+            if Y==None, then Y=X is used instead
+    eps: float, optional,
+         the neighbourhood size
+    max_memory: int, optional,
+                the maximal size (in bytes) of the temporary blocks
+
+    Returns
+    -------
+    i, array of shape(n), the indexes of the rows of X
+    j, array of shape(n), the indexes of the rows of Y
+    dist, array of shape(n), the corresponding distances, all < eps
+
+    The pairs are sorted by i, then j.
+    """
+    li, lj, ldist = [], [], []
+    for start, block in distance_blocks(X, Y, max_memory):
+        i, j = np.nonzero(block < eps)
+        li.append(i + start)
+        lj.append(j)
+        ldist.append(block[i, j])
+    if len(li) == 0:
+        return np.array([], np.int), np.array([], np.int), np.array([])
+    return (np.concatenate(li).astype(np.int),
+            np.concatenate(lj).astype(np.int), np.concatenate(ldist))
@@ -7,6 +7,7 @@ import numpy as np
 from numpy.testing import assert_almost_equal
 
 from ..fast_distance import euclidean_distance as ed 
+from ..fast_distance import euclidean_argmin, euclidean_knn, euclidean_eps
 
 def test_euclidean_1():
     """ test that the euclidean distance is as expected
@@ -34,6 +35,33 @@ def test_euclidean_2():
 	
     assert_almost_equal(ED, ref) 
 
+
+def test_euclidean_blocks():
+    """ test that the distances do not depend on the block size
+    """
+    X = np.random.randn(50, 3)
+    Y = np.random.randn(40, 3)
+    assert_almost_equal(ed(X, Y, max_memory=1000), ed(X, Y))
+    assert_almost_equal(ed(X, max_memory=1), ed(X))
+
+
+def test_euclidean_reductions():
+    """ test the argmin, knn and eps reductions against the full matrix
+    """
+    X = np.random.randn(50, 3)
+    Y = np.random.randn(40, 3)
+    ref = ed(X, Y)
+    idx, dist = euclidean_argmin(X, Y, max_memory=1000)
+    assert (idx == ref.argmin(1)).all()
+    assert_almost_equal(dist, ref.min(1))
+    idx, dist = euclidean_knn(X, Y, 5, max_memory=1000)
+    assert_almost_equal(dist, np.sort(ref, 1)[:, :5])
+    assert_almost_equal(dist, ref[np.arange(50)[:, np.newaxis], idx])
+    i, j, dist = euclidean_eps(X, Y, 1., max_memory=1000)
+    assert len(dist) == np.sum(ref < 1.)
+    assert (dist < 1.).all()
+    assert_almost_equal(dist, ref[i, j])
+
   
 if __name__ == "__main__":
     import nose
@@ -266,9 +266,12 @@ class Image(object):
             order = [self.axes.index(s) for s in order]
         new_cmap = self.coordmap.reordered_domain(order)
         # Only transpose if we have to so as to avoid calling
-        # self.get_data
+        # self.get_data; array proxies may also transpose lazily
         if order != range(self.ndim):
-            new_data = np.transpose(self.get_data(), order)
+            if hasattr(self._data, 'transpose'):
+                new_data = self._data.transpose(order)
+            else:
+                new_data = np.transpose(self.get_data(), order)
         else:
             new_data = self._data
         return self.__class__(new_data, new_cmap,
@@ -369,7 +372,11 @@ class Image(object):
         >>> np.allclose(frame3.get_data(), im.get_data()[:,:,:,3])
         True
         """
-        data = self.get_data()[slice_object]
+        if hasattr(self._data, '__getitem__'):
+            # Only read the data needed by array proxies
+            data = self._data[slice_object]
+        else:
+            data = self.get_data()[slice_object]
         g = ArrayCoordMap(self.coordmap, self.shape)[slice_object]
         coordmap = g.coordmap
         if coordmap.function_domain.ndim > 0:
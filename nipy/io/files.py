@@ -26,6 +26,139 @@ from nipy.core.api import Image, is_image
 from .nifti_ref import (ni_affine_pixdim_from_affine, affine_transform_from_array)
 
 
+class ImageDataProxy(object):
+    """ Array-like object reading the data of a nibabel image on demand
+
+    The data are only read when the proxy is converted to an array, or
+    sliced. Until nibabel has read the data, slices of uncompressed
+    nifti files are read from a memory map, so that a slice only reads
+    the part of the file it needs; other formats are read (and cached
+    by nibabel) in full on first access. Once the data have been read,
+    for instance by ``get_data``, slicing and setting values use the
+    array cached by nibabel, which may have been modified in memory.
+
+    Parameters
+    ----------
+    img : nibabel image
+    order : None or sequence of int, optional
+        permutation of the axes of the data in the image, as in
+        ``np.transpose``
+    """
+    def __init__(self, img, order=None):
+        self._img = img
+        shape = img.get_header().get_data_shape()
+        if order is None:
+            order = range(len(shape))
+        self._order = list(order)
+        self.shape = tuple([shape[i] for i in self._order])
+        self.ndim = len(self.shape)
+
+    def _cached_data(self):
+        """ Return the data array held by nibabel, or None if the data
+        have not been read yet.
+        """
+        data = getattr(self._img, '_data', None)
+        if not isinstance(data, np.ndarray):
+            # Array proxies cache the data they read
+            data = getattr(data, '_data', None)
+        if isinstance(data, np.ndarray):
+            return data
+        return None
+
+    def _memmap(self):
+        """ Return a (memmap, slope, inter) tuple on the file data, or
+        None if the data cannot be mapped.
+        """
+        try:
+            filename = self._img.get_filename()
+        except AttributeError:
+            return None
+        hdr = self._img.get_header()
+        if (filename is None or not filename.lower().endswith('.nii')
+            or not hasattr(hdr, 'get_data_offset')):
+            return None
+        try:
+            data = np.memmap(filename, dtype=hdr.get_data_dtype(), mode='r',
+                             offset=hdr.get_data_offset(),
+                             shape=hdr.get_data_shape(), order='F')
+        except (IOError, ValueError):
+            return None
+        slope, inter = hdr.get_slope_inter()
+        if slope is None:
+            slope = 1.
+        if inter is None:
+            inter = 0.
+        return data, slope, inter
+
+    def _file_index(self, index):
+        """ Translate a basic index on the proxy into an index on the
+        data in the file, and the transposition to apply to the
+        result. Returns None for other kinds of indices.
+        """
+        if not isinstance(index, tuple):
+            index = (index,)
+        n_ellipsis = len([i for i in index if i is Ellipsis])
+        if n_ellipsis > 1:
+            return None
+        for i in index:
+            if not (i is Ellipsis or isinstance(i, (int, long, slice))):
+                return None
+        if n_ellipsis == 1:
+            k = list(index).index(Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(index) + 1)
+            index = index[:k] + fill + index[k + 1:]
+        if len(index) > self.ndim:
+            return None
+        index = index + (slice(None),) * (self.ndim - len(index))
+        file_index = [None] * self.ndim
+        for k, i in enumerate(index):
+            file_index[self._order[k]] = i
+        # The axes that remain, in the order of the proxy
+        kept = [self._order[k] for k in range(self.ndim)
+                if isinstance(index[k], slice)]
+        sorted_kept = sorted(kept)
+        transpose = [sorted_kept.index(a) for a in kept]
+        return tuple(file_index), transpose
+
+    def __getitem__(self, index):
+        translated = self._file_index(index)
+        if translated is None or self._cached_data() is not None:
+            return np.asarray(self)[index]
+        file_index, transpose = translated
+        mapped = self._memmap()
+        if mapped is None:
+            data = self._img.get_data()[file_index]
+        else:
+            data, slope, inter = mapped
+            data = np.array(data[file_index])
+            if slope != 1 or inter != 0:
+                data = data * slope
+                data += inter
+        if transpose != range(len(transpose)):
+            data = np.transpose(data, transpose)
+        return data
+
+    def __setitem__(self, index, value):
+        # Values are set in the data cached by nibabel, read if needed
+        np.asarray(self)[index] = value
+
+    def __array__(self):
+        data = self._img.get_data()
+        if self._order != range(self.ndim):
+            data = np.transpose(data, self._order)
+        return data
+
+    def transpose(self, *order):
+        """ Return a proxy on the data with permuted axes
+        """
+        if len(order) == 1:
+            order = order[0]
+        return self.__class__(self._img, [self._order[i] for i in order])
+
+    def __repr__(self):
+        return '%s(shape=%s)' % (self.__class__.__name__, self.shape)
+
+
 def load(filename):
     """Load an image from the given filename.
 
@@ -76,7 +209,9 @@ def load(filename):
     # affine_transform is a 3-d transform
     affine_transform3d, affine_transform = \
         affine_transform_from_array(aff, 'ijk', pixdim=zooms[3:])
-    img = Image(img.get_data(), affine_transform.renamed_domain(axis_renames),
+    # The data are read on demand
+    img = Image(ImageDataProxy(img),
+                affine_transform.renamed_domain(axis_renames),
                 metadata={'header': hdr})
     return img
 
@@ -1,12 +1,15 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 
+import warnings
+
 import numpy as np
 
 from nibabel.spatialimages import ImageFileError
 
 from ..api import load_image, save_image, as_image
-from nipy.core.api import fromarray
+from ..files import ImageDataProxy
+from nipy.core.api import fromarray, iter_axis
 
 from nipy.testing import (assert_true, assert_equal, assert_raises,
                           assert_array_equal, assert_array_almost_equal,
@@ -162,3 +165,52 @@ def test_as_image():
     assert_equal(img.affine, img1.affine)
     assert_array_equal(img.get_data(), img1.get_data())
     assert_true(img is img2)
+
+
+def test_lazy_load():
+    # Data are read on demand, and slices of uncompressed files are read
+    # from a memory map
+    data = 100 * np.random.standard_normal((5, 6, 7, 3))
+    img = fromarray(data, 'ijkl', 'xyzt')
+    with InTemporaryDirectory():
+        for fname in ('img.nii', 'img.nii.gz'):
+            save_image(img, fname, dtype=np.int16)
+            img2 = load_image(fname)
+            yield assert_true, isinstance(img2._data, ImageDataProxy)
+            yield assert_equal, img2.shape, data.shape
+            expected = np.asarray(load_image(fname).get_data())
+            yield assert_almost_equal, expected, data, 1
+            for index in ((slice(None), 2), (Ellipsis, 1), 3,
+                          (1, slice(1, 4), Ellipsis, 0)):
+                yield (assert_array_equal, img2[index].get_data(),
+                       expected[index])
+            # Slicing an uncompressed file did not read the whole data
+            yield (assert_equal, img2._data._cached_data() is None,
+                   fname == 'img.nii')
+            frames = list(iter_axis(img2, 't', asarray=True))
+            for t, frame in enumerate(frames):
+                yield assert_array_equal, frame, expected[..., t]
+            # Transposed images slice the transposed data
+            rimg = img2.reordered_axes([3, 0, 2, 1])
+            yield assert_true, isinstance(rimg._data, ImageDataProxy)
+            yield (assert_array_equal, rimg[1, :, 2].get_data(),
+                   expected[:, :, 2, 1])
+            yield (assert_array_equal, rimg.get_data(),
+                   np.transpose(expected, [3, 0, 2, 1]))
+            del img2, rimg
+            # Once read, the data may be modified in memory, and slices
+            # see the modified values
+            img2 = load_image(fname)
+            img2.get_data()[:] = 0
+            yield assert_equal, img2[0].get_data().sum(), 0
+            yield (assert_equal,
+                   img2.reordered_axes([3, 0, 2, 1])[1].get_data().sum(), 0)
+            # Deprecated value setting goes to the loaded data
+            img2 = load_image(fname)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                img2[1] = 3
+            yield assert_array_equal, img2.get_data()[1], 3
+            yield assert_array_equal, img2[1].get_data(), 3
+            yield assert_array_equal, img2.get_data()[0], expected[0]
+            del img2
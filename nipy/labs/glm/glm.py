@@ -1,31 +1,38 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
+import os
+import json
+
 import numpy as np
 import scipy.stats as sps
 
 import kalman
 from ..utils import mahalanobis
+from ...utils.parallel import effective_n_jobs, parallel_map
 from ..utils.zscore import zscore
 
 
 DEF_TINY = 1e-50
 DEF_DOFMAX = 1e10
+DEF_BLOCKSIZE = 2 ** 14
 models = {'spherical': ['ols', 'kalman'], 'ar1': ['kalman']}
+# Arrays of a fit, saved as .npy files by glm.save
+FIT_ARRAYS = ('beta', 'nvbeta', 's2', 'dof', 'a')
 
 
 class glm(object):
 
     def __init__(self, Y=None, X=None, formula=None, axis=0,
-             model='spherical', method=None, niter=2):
+             model='spherical', method=None, niter=2, n_jobs=1):
 
         # Check dimensions
         if Y == None:
             return
         else:
-            self.fit(Y, X, formula, axis, model, method, niter)
+            self.fit(Y, X, formula, axis, model, method, niter, n_jobs)
 
     def fit(self, Y, X, formula=None, axis=0, model='spherical', method=None,
-            niter=2):
+            niter=2, n_jobs=1):
 
         if Y.shape[axis] != X.shape[0]:
             raise ValueError('Response and predictors are inconsistent')
@@ -55,10 +62,14 @@ class glm(object):
             if self.method == 'ols':
                 out = ols(Y, X, axis=axis)
             elif self.method == 'kalman':
-                out = kalman.ols(Y, X, axis=axis)
+                # The Kalman filter gives the OLS estimates, with the
+                # maximum likelihood variance; these are obtained by
+                # blocks rather than by filtering each voxel in turn
+                beta, nvbeta, s2, dof = ols(Y, X, axis=axis)
+                out = beta, nvbeta, s2 * (dof / X.shape[0]), dof
         elif self.model == 'ar1':
             constants = ['a']
-            out = kalman.ar1(Y, X, axis=axis, niter=niter)
+            out = ar1(Y, X, axis=axis, niter=niter, n_jobs=n_jobs)
             a = out[4]
             out = out[0: 4]
 
@@ -70,6 +81,8 @@ class glm(object):
 
     def save(self, file):
         """ Save fit into a .npz file
+
+        See `save_store` for a format that can be memory-mapped.
         """
         np.savez(file,
              beta=self.beta,
@@ -82,7 +95,30 @@ class glm(object):
              axis=self._axis,
              constants=self._constants)
 
-    def contrast(self, c, type='t', tiny=DEF_TINY, dofmax=DEF_DOFMAX):
+    def save_store(self, file):
+        """ Save fit into a directory
+
+        Each array of the fit is saved as a .npy file of the directory
+        (beta.npy, nvbeta.npy, s2.npy, dof.npy, a.npy), and the model
+        description in glm.json, so that the fit can be reloaded with
+        memory-mapped arrays, see `load`.
+        """
+        if not os.path.isdir(file):
+            os.makedirs(file)
+        for name in FIT_ARRAYS:
+            np.save(os.path.join(file, name + '.npy'), getattr(self, name))
+        meta = {'model': self.model,
+                'method': self.method,
+                'axis': self._axis,
+                'constants': list(self._constants)}
+        f = open(os.path.join(file, 'glm.json'), 'w')
+        try:
+            json.dump(meta, f)
+        finally:
+            f.close()
+
+    def contrast(self, c, type='t', tiny=DEF_TINY, dofmax=DEF_DOFMAX,
+                 blocksize=None):
         """ Specify and estimate a constrast
 
         c must be a numpy.ndarray (or anything that numpy.asarray
@@ -90,49 +126,171 @@ class glm(object):
         For a F contrast, c must be q x p
         where q is the number of contrast vectors and
         p is the total number of regressors.
+
+        See `contrasts` for blocksize.
+        """
+        return self.contrasts([c], type, tiny, dofmax, blocksize)[0]
+
+    def contrasts(self, cs, type='t', tiny=DEF_TINY, dofmax=DEF_DOFMAX,
+                  blocksize=None):
+        """ Specify and estimate several contrasts at once
+
+        cs is a sequence of contrasts, each of which is specified as
+        in `contrast`, and type is either a single contrast type, or a
+        sequence of types, one per contrast.
+
+        The rows of all contrasts are stacked, so that the effects are
+        computed with a single product with the parameter estimates,
+        and the variances share the products with nvbeta. This is much
+        cheaper than calling `contrast` for each contrast in turn.
+
+        If blocksize is not None, the contrasts are computed over
+        blocks of about blocksize voxels, so that only a block of the
+        fit is read at a time. This is the default, with
+        DEF_BLOCKSIZE, for fits memory-mapped by `load`.
+
+        Returns a list of contrast instances.
         """
-        c = np.asarray(c)
-        #dim = len(c.shape)
-        if c.ndim == 1:
-            dim = 1
+        if blocksize is None and isinstance(self.beta, np.memmap):
+            blocksize = DEF_BLOCKSIZE
+        blocks = self._voxel_blocks(blocksize)
+        if blocks is None:
+            return self._contrasts(cs, type, tiny, dofmax)
+        split, bounds = blocks
+        parts = [self._voxel_block(split, start, stop)._contrasts(
+                cs, type, tiny, dofmax)
+                 for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        # Stitch the blocks back together. Effects have the voxel
+        # dimensions of beta, and variances those of s2, which lacks
+        # the singleton dimensions
+        vaxes = [i for i in range(self.beta.ndim) if i != self._axis]
+        bpos = vaxes.index(split)
+        spos = len([i for i in vaxes[:bpos] if self.beta.shape[i] != 1])
+        nbvox = len(vaxes)
+        nsvox = self.s2.squeeze().ndim
+        out = parts[0]
+        for k, con in enumerate(out):
+            e = [p[k].effect for p in parts]
+            v = [p[k].variance for p in parts]
+            con.effect = np.concatenate(e, e[0].ndim - nbvox + bpos)
+            con.variance = np.concatenate(v, v[0].ndim - nsvox + spos)
+        return out
+
+    def _voxel_blocks(self, blocksize):
+        """ Return the voxel axis of beta along which to split the fit
+        in blocks of about blocksize voxels, and the block bounds, or
+        None if the fit need not be split.
+        """
+        if blocksize is None:
+            return None
+        vaxes = [i for i in range(self.beta.ndim) if i != self._axis]
+        if len(vaxes) == 0:
+            return None
+        split = max(vaxes, key=lambda i: self.beta.shape[i])
+        n = self.beta.shape[split]
+        slab = int(np.prod([self.beta.shape[i] for i in vaxes
+                            if i != split]))
+        # Blocks of a single voxel along the split axis would be
+        # squeezed away
+        step = max(2, blocksize // max(slab, 1))
+        if step >= n:
+            return None
+        bounds = range(0, n, step) + [n]
+        if bounds[-1] - bounds[-2] == 1:
+            del bounds[-2]
+        return split, bounds
+
+    def _voxel_block(self, split, start, stop):
+        """ Return a view of the fit restricted to the voxels from
+        start to stop along axis split of beta
+        """
+        block = glm()
+        block.__dict__.update(self.__dict__)
+        sl = [slice(None)] * self.beta.ndim
+        sl[split] = slice(start, stop)
+        block.beta = self.beta[tuple(sl)]
+        vaxes = [i for i in range(self.beta.ndim) if i != self._axis]
+        s2 = self.s2.squeeze()
+        sl = [slice(None)] * s2.ndim
+        sl[len([i for i in vaxes if i < split
+                and self.beta.shape[i] != 1])] = slice(start, stop)
+        block.s2 = s2[tuple(sl)]
+        if not 'nvbeta' in self._constants:
+            # Voxel-wise variance matrices have an extra dimension
+            # right after the regressor axis
+            sl = [slice(None)] * self.nvbeta.ndim
+            sl[split + int(split > self._axis)] = slice(start, stop)
+            block.nvbeta = self.nvbeta[tuple(sl)]
+        return block
+
+    def _contrasts(self, cs, type, tiny, dofmax):
+        cs = [np.asarray(c) for c in cs]
+        if isinstance(type, basestring):
+            types = [type] * len(cs)
         else:
-            dim = c.shape[0]
+            types = list(type)
+            if len(types) != len(cs):
+                raise ValueError('There should be one type per contrast')
+        # Rows of each contrast in the stacked contrast matrix
+        rows = []
+        start = 0
+        for c in cs:
+            if c.ndim == 1:
+                dim = 1
+            else:
+                dim = c.shape[0]
+            rows.append(slice(start, start + dim))
+            start += dim
+        C = np.vstack([np.atleast_2d(c) for c in cs]) # shape = R, p
         axis = self._axis
         ndims = len(self.beta.shape)
 
-        # Compute the contrast estimate: c*B
+        # Compute the contrast estimates: C*B
         B = np.rollaxis(self.beta, axis, ndims)
-        con = np.inner(c, B) # shape = q, X
+        con = np.inner(C, B) # shape = R, X
 
-        # Compute the variance of the contrast estimate: s2 * (c' * nvbeta * c)
-        # Two cases are considered: either the input effect variance
-        # is position-dependent (output by RKF_fit), or it is a global
-        # one (output by KF_fit)
+        # Compute the variance of the contrast estimates:
+        # s2 * (c' * nvbeta * c). Two cases are considered: either
+        # the input effect variance is position-dependent (output by
+        # RKF_fit), or it is a global one (output by KF_fit)
         s2 = self.s2.squeeze()
-        nvbeta = self.nvbeta
-        if not 'nvbeta' in self._constants:
-            nvbeta = np.rollaxis(nvbeta, axis, ndims + 1)
-            nvbeta = np.rollaxis(nvbeta, axis, ndims + 1) # shape = X, p, p
-        if dim == 1:
-            vcon = np.inner(c, np.inner(c, nvbeta))
-            vcon = vcon.squeeze() * s2
+        const = 'nvbeta' in self._constants
+        if const:
+            V = np.dot(C, np.dot(self.nvbeta, C.T)) # shape = R, R
         else:
-            vcon = np.dot(c, np.inner(nvbeta, c)) # q, X, q or q, q
-            if not 'nvbeta' in self._constants:
-                vcon = np.rollaxis(vcon, ndims, 1) * s2 # q, q, X
+            nvbeta = np.rollaxis(self.nvbeta, axis, ndims + 1)
+            nvbeta = np.rollaxis(nvbeta, axis, ndims + 1) # shape = X, p, p
+            nvC = np.inner(nvbeta, C) # shape = X, p, R
+
+        out = []
+        for c, sl, t in zip(cs, rows, types):
+            dim = sl.stop - sl.start
+            if dim == 1:
+                if c.ndim == 1:
+                    effect = con[sl.start]
+                else:
+                    effect = con[sl]
+                if const:
+                    vcon = V[sl.start, sl.start] * s2
+                else:
+                    vcon = np.inner(c, nvC[..., sl.start]).squeeze() * s2
             else:
-                aux = vcon.shape # q, q
-                vcon = np.resize(vcon, s2.shape + aux) # X, q, q
-                vcon = vcon.T.reshape(aux + (s2.size,)) * \
-                    s2.reshape((s2.size,)) # q, q, Xflat
-                vcon = vcon.reshape(aux + s2.shape) # q, q, X
-
-        # Create contrast instance
-        c = contrast(dim, type, tiny, dofmax)
-        c.effect = con
-        c.variance = vcon
-        c.dof = self.dof
-        return c
+                effect = con[sl] # q, X
+                if const:
+                    vcon = V[sl, sl].reshape((dim, dim) + (1,) * s2.ndim) \
+                        * s2 # q, q, X
+                else:
+                    vcon = np.dot(c, nvC[..., sl]) # q, X, q
+                    vcon = np.rollaxis(vcon, ndims, 1) * s2 # q, q, X
+
+            # Create contrast instance
+            con_obj = contrast(dim, t, tiny, dofmax)
+            con_obj.effect = effect
+            con_obj.variance = vcon
+            con_obj.dof = self.dof
+            out.append(con_obj)
+        return out
 
 
 class contrast(object):
@@ -252,25 +410,106 @@ class contrast(object):
         return self.__rmul__(1 / float(other))
 
 
-def ols(Y, X, axis=0):
+def ols(Y, X, axis=0, blocksize=DEF_BLOCKSIZE):
     """Essentially, compute pinv(X)*Y
+
+    The design is factored only once; voxels are then fitted by blocks
+    of about `blocksize` time series, each block being solved with a
+    single matrix product, so that memory use stays bounded and the
+    work is carried out by BLAS.
     """
-    ndims = len(Y.shape)
+    n, p = X.shape
     pX = np.linalg.pinv(X)
-    beta = np.rollaxis(np.inner(pX, np.rollaxis(Y, axis, ndims)), 0, axis + 1)
     nvbeta = np.inner(pX, pX)
-    res = Y - np.rollaxis(
-        np.inner(X, np.rollaxis(beta, axis, ndims)), 0, axis + 1)
-    n = res.shape[axis]
-    s2 = (res ** 2).sum(axis) / float(n - X.shape[1])
-    dof = float(X.shape[0] - X.shape[1])
+    dof = float(n - p)
+
+    # View on the data with time as the first axis
+    Yt = np.rollaxis(np.asarray(Y), axis)
+    vshape = Yt.shape[1:]
+    if Yt.ndim == 1:
+        Yt = Yt[:, np.newaxis]
+    beta = np.zeros((p,) + Yt.shape[1:])
+    s2 = np.zeros(Yt.shape[1:])
+
+    # Loop over blocks of the first voxel dimension
+    slab = int(np.prod(Yt.shape[2:]))
+    step = max(1, blocksize // max(slab, 1))
+    for i in range(0, Yt.shape[1], step):
+        Yb = Yt[:, i:i + step]
+        bshape = Yb.shape[1:]
+        Yb = Yb.reshape((n, -1))
+        bb = np.dot(pX, Yb)
+        res = Yb - np.dot(X, bb)
+        beta[:, i:i + step] = bb.reshape((p,) + bshape)
+        s2[i:i + step] = (res ** 2).sum(0).reshape(bshape)
+    s2 /= dof
+
+    beta = np.rollaxis(beta.reshape((p,) + vshape), 0, axis + 1)
+    s2 = s2.reshape(vshape)
     return beta, nvbeta, s2, dof
 
 
-def load(file):
+def ar1(Y, X, axis=0, niter=2, n_jobs=1):
+    """AR(1) regression using the refined Kalman filter, see `kalman.ar1`
+
+    With `n_jobs` > 1, voxels are split into blocks that are fitted
+    concurrently by a pool of threads. Each voxel being fitted
+    independently, the result is the same as that of a serial fit.
+    """
+    vaxes = [i for i in range(Y.ndim) if i != axis]
+    if len(vaxes) == 0:
+        return kalman.ar1(Y, X, niter=niter, axis=axis)
+    split = max(vaxes, key=lambda i: Y.shape[i])
+    nblocks = min(effective_n_jobs(n_jobs), Y.shape[split])
+    if nblocks < 2:
+        return kalman.ar1(Y, X, niter=niter, axis=axis)
+
+    def fit_block(y):
+        # The filter loop only releases the GIL on double data
+        y = np.asarray(y, dtype=np.double)
+        return kalman.ar1(y, X, niter=niter, axis=axis)
+
+    fits = parallel_map(fit_block, np.array_split(Y, nblocks, axis=split),
+                        n_jobs=nblocks)
+
+    # Stitch the blocks back together; variance matrices have an
+    # extra dimension right after the time axis
+    vsplit = split + int(split > axis)
+    beta = np.concatenate([f[0] for f in fits], split)
+    nvbeta = np.concatenate([f[1] for f in fits], vsplit)
+    s2 = np.concatenate([f[2] for f in fits], split)
+    a = np.concatenate([f[4] for f in fits], split)
+    return beta, nvbeta, s2, fits[0][3], a
+
+
+def load(file, mmap_mode='r'):
     """Load a fitted glm
+
+    file is either a directory written by `glm.save_store`, whose
+    arrays are memory-mapped with mode mmap_mode (None to read them in
+    memory), or a .npz file written by `glm.save`.
+    Contrasts of memory-mapped fits are computed by blocks of voxels,
+    see `glm.contrasts`.
     """
     from os.path import splitext
+    if os.path.isdir(file):
+        f = open(os.path.join(file, 'glm.json'))
+        try:
+            meta = json.load(f)
+        finally:
+            f.close()
+        mod = glm()
+        for name in FIT_ARRAYS:
+            x = np.load(os.path.join(file, name + '.npy'),
+                        mmap_mode=mmap_mode)
+            if x.ndim == 0:
+                x = x[()]
+            setattr(mod, name, x)
+        mod.model = str(meta['model'])
+        mod.method = str(meta['method'])
+        mod._axis = int(meta['axis'])
+        mod._constants = [str(c) for c in meta['constants']]
+        return mod
     if splitext(file)[1] == '':
         file = file + '.npz'
     fmod = np.load(file)
@@ -55,7 +55,7 @@ cdef extern from "fff_glm_kalman.h":
                              double yy, fff_vector* xx)
     void fff_glm_KF_fit(fff_glm_KF* thisone, fff_vector* y, fff_matrix* X)
     void fff_glm_RKF_fit(fff_glm_RKF* thisone, unsigned int nloop, 
-                         fff_vector* y, fff_matrix* X)
+                         fff_vector* y, fff_matrix* X) nogil
 
 
 # Initialize numpy
@@ -63,6 +63,32 @@ fffpy_import_array()
 import_array()
 import numpy as np
 
+# Refined Kalman filter loop over a multi-iterator. Python objects are
+# not touched as long as the input data is aligned double, so that the
+# loop may run without the GIL.
+cdef void _ar1_loop(fff_glm_RKF* rkfilt, fffpy_multi_iterator* multi,
+                    fff_matrix* x, int niter, size_t p2) nogil:
+    cdef fff_vector *y, *b, *vb, *s2, *a
+    cdef fff_vector Vb_flat
+
+    # Create views
+    y = multi.vector[0]
+    b = multi.vector[1]
+    vb = multi.vector[2]
+    s2 = multi.vector[3]
+    a = multi.vector[4]
+
+    # Loop 
+    while(multi.index < multi.size):
+        fff_glm_RKF_fit(rkfilt, niter, y, x)
+        fff_vector_memcpy(b, rkfilt.b)
+        Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+        fff_vector_memcpy(vb, &Vb_flat)
+        s2.data[0] = rkfilt.s2
+        a.data[0] = rkfilt.a
+        fffpy_multi_iterator_update(multi)
+
+
 # Standard Kalman filter
 
 def ols(ndarray Y, ndarray X, int axis=0): 
@@ -161,8 +187,6 @@ def ar1(ndarray Y, ndarray X, int niter=2, int axis=0):
     REFERENCE:
     Roche et al, MICCAI 2004.
     """
-    cdef fff_vector *y, *b, *vb, *s2, *a
-    cdef fff_vector Vb_flat
     cdef fff_matrix *x
     cdef fff_glm_RKF *rkfilt
     cdef size_t p, p2
@@ -196,22 +220,13 @@ def ar1(ndarray Y, ndarray X, int niter=2, int axis=0):
     # Create a new array iterator 
     multi = fffpy_multi_iterator_new(5, axis, <void*>Y, <void*>B, <void*>VB, <void*>S2, <void*>A)
 
-    # Create views
-    y = multi.vector[0]
-    b = multi.vector[1]
-    vb = multi.vector[2]
-    s2 = multi.vector[3]
-    a = multi.vector[4]
-
-    # Loop 
-    while(multi.index < multi.size):
-        fff_glm_RKF_fit(rkfilt, niter, y, x)
-        fff_vector_memcpy(b, rkfilt.b)
-        Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
-        fff_vector_memcpy(vb, &Vb_flat)
-        s2.data[0] = rkfilt.s2
-        a.data[0] = rkfilt.a
-        fffpy_multi_iterator_update(multi)
+    # Loop, releasing the GIL unless the data need be converted to
+    # double using numpy
+    if Y.dtype == np.double and Y.flags.aligned:
+        with nogil:
+            _ar1_loop(rkfilt, multi, x, niter, p2)
+    else:
+        _ar1_loop(rkfilt, multi, x, niter, p2)
 
     # Dof 
     dof = rkfilt.dof
@@ -1,8 +1,13 @@
 #!/usr/bin/env python
+from __future__ import with_statement
 
-from numpy.testing import assert_almost_equal, TestCase
+import os
+
+from nibabel.tmpdirs import InTemporaryDirectory
+from numpy.testing import assert_almost_equal, assert_array_equal, TestCase
 import numpy as np
-from ..glm import glm
+from ..glm import glm, ols, ar1, load
+from .. import kalman
 
 class TestFitting(TestCase):
 
@@ -45,6 +50,124 @@ class TestFitting(TestCase):
     def test_ols_axis3(self):
         self.make_data()
         self.ols(3)
+
+    def test_ols_blocks(self):
+        self.make_data()
+        y = np.rollaxis(self.y, 0, 2)
+        b, nvb, s2, dof = ols(y, self.X, axis=1)
+        b1, nvb1, s21, dof1 = ols(y, self.X, axis=1, blocksize=7)
+        assert_almost_equal(b, b1)
+        assert_almost_equal(s2, s21)
+        pX = np.linalg.pinv(self.X)
+        b2 = np.rollaxis(np.tensordot(pX, self.y, (1, 0)), 0, 2)
+        assert_almost_equal(b, b2)
+        res = self.y - np.tensordot(self.X, np.rollaxis(b, 1), (1, 0))
+        assert_almost_equal(s2, (res ** 2).sum(0) / dof)
+
+    def test_kalman_ols(self):
+        self.make_data()
+        y = np.rollaxis(self.y, 0, 2)
+        m = glm(y, self.X, axis=1, method='kalman')
+        b, nvb, s2, dof = kalman.ols(y, self.X, axis=1)
+        assert_almost_equal(m.beta, b)
+        assert_almost_equal(m.nvbeta, nvb)
+        assert_almost_equal(m.s2, s2.squeeze())
+        assert m.dof == dof
+
+    def test_ar1_parallel(self):
+        self.make_data()
+        for axis in (0, 2):
+            y = np.rollaxis(self.y, 0, axis + 1)
+            out = ar1(y, self.X, axis=axis)
+            out1 = ar1(y, self.X, axis=axis, n_jobs=3)
+            for x, x1 in zip(out, out1):
+                assert_array_equal(x, x1)
+        m = glm(self.y, self.X, model='ar1')
+        m1 = glm(self.y, self.X, model='ar1', n_jobs=2)
+        assert_array_equal(m.beta, m1.beta)
+        assert_array_equal(m.nvbeta, m1.nvbeta)
+        assert_array_equal(m.a, m1.a)
+
+    def test_contrasts(self):
+        self.make_data()
+        cs = [[1, 0], [0, 1], [[1, 0], [0, 1]], [[1, 0], [1, -1]]]
+        types = ['t', 't', 'F', 'tmin']
+        for model in ('spherical', 'ar1'):
+            m = glm(self.y, self.X, model=model)
+            cons = m.contrasts(cs, types)
+            for c, t, con in zip(cs, types, cons):
+                con1 = m.contrast(c, t)
+                assert con.type == con1.type
+                assert_almost_equal(con.effect, con1.effect)
+                assert_almost_equal(con.variance, con1.variance)
+                assert_almost_equal(con.zscore(), con1.zscore())
+            # t contrast variance is s2 * c' nvbeta c
+            if model == 'spherical':
+                assert_almost_equal(cons[0].variance,
+                                    m.s2 * m.nvbeta[0, 0])
+
+    def test_contrasts_blocks(self):
+        self.make_data()
+        cs = [[1, 0], [[1, 0], [0, 1]]]
+        types = ['t', 'F']
+        # Singleton voxel dimensions are dropped from the variances
+        for model, y in (('spherical', self.y), ('ar1', self.y),
+                         ('spherical', self.y[:, :, :1])):
+            m = glm(y, self.X, model=model)
+            cons = m.contrasts(cs, types)
+            for blocksize in (1, 25, 10 ** 6):
+                cons1 = m.contrasts(cs, types, blocksize=blocksize)
+                for con, con1 in zip(cons, cons1):
+                    assert_array_equal(con.effect.shape,
+                                       con1.effect.shape)
+                    assert_almost_equal(con.effect, con1.effect)
+                    assert_almost_equal(con.variance, con1.variance)
+                    assert_almost_equal(con.zscore(), con1.zscore())
+
+    def test_save_load(self):
+        self.make_data()
+        for model in ('spherical', 'ar1'):
+            m = glm(self.y, self.X, axis=0, model=model)
+            with InTemporaryDirectory():
+                m.save_store('fit')
+                assert os.path.exists(os.path.join('fit', 'beta.npy'))
+                m1 = load('fit')
+                assert isinstance(m1.beta, np.memmap)
+                for name in ('beta', 'nvbeta', 's2', 'dof', 'a'):
+                    assert_array_equal(getattr(m, name), getattr(m1, name))
+                assert m1.model == m.model
+                assert m1.method == m.method
+                assert m1._constants == m._constants
+                con = m.contrast([[1, 0], [1, -1]])
+                con1 = m1.contrast([[1, 0], [1, -1]])
+                assert_almost_equal(con.effect, con1.effect)
+                assert_almost_equal(con.variance, con1.variance)
+                m2 = load('fit', mmap_mode=None)
+                assert not isinstance(m2.beta, np.memmap)
+                del m1, m2
+
+    def test_load_npz(self):
+        self.make_data()
+        m = glm(self.y, self.X)
+        with InTemporaryDirectory():
+            for fname in ('fit.npz', 'fit'):
+                m.save(fname)
+                m1 = load(fname)
+                assert_array_equal(m.beta, m1.beta)
+                assert m1._constants == m._constants
+                os.remove('fit.npz')
+            # file objects
+            f = open('fit.npz', 'wb')
+            m.save(f)
+            f.close()
+            assert_array_equal(load('fit.npz').s2, m.s2)
+
+    def test_ols_1d(self):
+        self.make_data()
+        y = self.y[:, 0, 0, 0]
+        b, nvb, s2, dof = ols(y, self.X)
+        assert_almost_equal(b, np.linalg.lstsq(self.X, y)[0])
+        assert s2.shape == ()
     
     
 if __name__ == "__main__":
@@ -7,9 +7,11 @@ import numpy as np
 import scipy.misc as sm
 
 # Our own imports
-from nipy.algorithms.graph import wgraph_from_3d_grid
+from nipy.algorithms.graph import wgraph_from_3d_grid, subgraph_cc
 from nipy.algorithms.graph.field import Field, field_from_graph_and_data
 
+from nipy.utils.parallel import parallel_imap
+
 from ..utils import zscore 
 from .onesample import stat as os_stat, stat_mfx as os_stat_mfx
 from .twosample import stat as ts_stat, stat_mfx as ts_stat_mfx
@@ -19,6 +21,7 @@ from .twosample import stat as ts_stat, stat_mfx as ts_stat_mfx
 DEF_NDRAWS = int(1e5)
 DEF_NPERMS = int(1e4)
 DEF_NITER = 5
+DEF_PERM_BLOCK = 64
 DEF_STAT_ONESAMPLE = 'student'
 DEF_STAT_TWOSAMPLE = 'student'
 
@@ -30,7 +33,7 @@ DEF_STAT_TWOSAMPLE = 'student'
 #===========================================
 
 
-def extract_clusters_from_thresh(T,XYZ,th,k=18):
+def extract_clusters_from_thresh(T,XYZ,th,k=18,neighb=None):
     """
     Extract clusters from statistical map
     above specified threshold
@@ -38,8 +41,13 @@ def extract_clusters_from_thresh(T,XYZ,th,k=18):
          XYZ    (3,p)   voxels coordinates
          th     <float> threshold
          k      <int>   the number of neighbours considered. (6,18 or 26)
+         neighb         optional (idx, neighb) compact representation
+                        of the k-neighbours grid graph of XYZ, see
+                        grid_neighb; avoids building a graph per call
     Out: labels (p)     cluster labels
     """
+    if neighb != None:
+        return subgraph_cc(neighb[0], neighb[1], T >= th)
     labels = -np.ones(len(T),int)
     I = np.where(T >= th)[0]
     if len(I)>0:
@@ -50,6 +58,18 @@ def extract_clusters_from_thresh(T,XYZ,th,k=18):
 
 
 
+def grid_neighb(XYZ,k=18):
+    """
+    Compact neighbours representation of the grid graph of a mask,
+    to be computed once and passed to the cluster extraction functions
+    In:  XYZ    (3,p)   voxels coordinates
+         k      <int>   the number of neighbours considered. (6,18 or 26)
+    Out: (idx, neighb)  see WeightedGraph.compact_neighb
+    """
+    return wgraph_from_3d_grid(XYZ.T, k).compact_neighb()[:2]
+
+
+
 def max_dist(XYZ,I,J):
     """
     Maximum distance between two set of points
@@ -67,7 +87,7 @@ def max_dist(XYZ,I,J):
 
 
 
-def extract_clusters_from_diam(T,XYZ,th,diam,k=18):
+def extract_clusters_from_diam(T,XYZ,th,diam,k=18,neighb=None):
     """
     Extract clusters from a statistical map
     under diameter constraint
@@ -77,9 +97,11 @@ def extract_clusters_from_diam(T,XYZ,th,diam,k=18):
          th     <float> minimum threshold
          diam   <int>   maximal diameter (in voxels)
          k      <int>   the number of neighbours considered. (6,18 or 26)
+         neighb         optional compact representation of the grid
+                        graph of XYZ, see grid_neighb
     Out: labels (p)     cluster labels
     """
-    CClabels = extract_clusters_from_thresh(T,XYZ,th,k)
+    CClabels = extract_clusters_from_thresh(T,XYZ,th,k,neighb)
     nCC = CClabels.max() + 1
     labels = -np.ones(len(CClabels),int)
     clust_label = 0
@@ -146,12 +168,16 @@ def extract_clusters_from_diam(T,XYZ,th,diam,k=18):
     return labels
 
 
-def extract_clusters_from_graph(T, G, th):
+def extract_clusters_from_graph(T, G, th, neighb=None):
     """
     This returns a label vector of same size as T,
     defining connected components for subgraph of
     weighted graph G containing vertices s.t. T >= th
+
+    neighb is an optional precomputed G.compact_neighb()[:2]
     """
+    if neighb != None:
+        return subgraph_cc(neighb[0], neighb[1], T >= th)
     labels = np.zeros(len(T), int) - 1
     I = T >= th
     nlabels = I.sum()
@@ -200,6 +226,56 @@ def twosample_stat(Y1, V1, Y2, V2, stat_id, axis=0, Magics=None, niter=DEF_NITER
     else:
         return ts_stat_mfx(Y1, V1, Y2, V2, stat_id, axis, Magics, niter)
 
+
+def sign_patterns(magics, n):
+    """
+    Sign flips encoded by magic numbers, as in the C sign permutation
+    routine: the i-th subject is flipped iff the i-th bit is set.
+    In:  magics (q)     magic numbers
+         n      <int>   number of subjects
+    Out: signs  (q,n)   array of +/-1 values
+    """
+    m = np.array(magics, float)
+    signs = np.ones((m.size, n))
+    for i in xrange(n):
+        aux = m / 2
+        m = np.floor(aux)
+        signs[aux > m, i] = -1
+    return signs
+
+
+def onesample_perm_stat(Y, V, signs, stat_id, base=0.0, niter=DEF_NITER):
+    """
+    One-sample statistic under a block of sign flips
+    In:  Y      (n,p)   data array
+         V      (n,p)   variance array, or None
+         signs  (q,n)   sign flips, one permutation per row
+    Out: T      (q,p)   statistic values under each permutation
+    """
+    n = Y.shape[0]
+    if stat_id in ['mean', 'student']:
+        # Sign flips act linearly on the data and leave the sum of
+        # squares unchanged, so that a whole block of permutations
+        # amounts to a single matrix product
+        m = np.dot(signs, Y) / n
+        if stat_id == 'mean':
+            return m - base
+        ssd = np.maximum(np.sum(Y ** 2, 0) - n * m ** 2, 0)
+        T = np.sqrt(n - 1) * (m - base)
+        I = T != 0
+        with np.errstate(divide='ignore'):
+            T[I] /= np.sqrt(ssd[I] / n)
+        return T
+    if n <= 53:
+        # Magic numbers represent sign flips exactly in double precision
+        magics = np.dot(signs < 0, 2. ** np.arange(n))
+        return onesample_stat(Y, V, stat_id, base, 0, magics, niter)
+    T = np.zeros((signs.shape[0], Y.shape[1]))
+    for j in xrange(signs.shape[0]):
+        T[j] = onesample_stat(signs[j].reshape(n, 1) * Y, V, stat_id,
+                              base, 0, None, niter)
+    return T
+
 #=================================================
 #=================================================
 # Compute cluster and region summary statistics
@@ -288,7 +364,8 @@ class permutation_test(object):
     #=======================================================
     def calibrate(self, nperms=DEF_NPERMS, clusters=None, 
                   cluster_stats=["size","Fisher"], regions=None, 
-                  region_stats=["Fisher"], verbose=False):
+                  region_stats=["Fisher"], verbose=False,
+                  block_size=DEF_PERM_BLOCK, n_jobs=1):
         """
         Calibrate cluster and region summary statistics using permutation test
 
@@ -319,6 +396,16 @@ class permutation_test(object):
         verbose : boolean, optional
             "Chatterbox" mode switch
 
+        block_size : int, optional
+            Number of permutations evaluated at once. Each block is
+            reduced to the summary statistics before the next ones are
+            computed, so that memory scales with block_size * p.
+
+        n_jobs : int, optional
+            Number of blocks processed in parallel threads. Random
+            sign flips are drawn from an independently seeded stream
+            per block, so that results do not depend on n_jobs.
+
         Returns
         -------
         voxel_results : dict 
@@ -349,10 +436,8 @@ class permutation_test(object):
             n1,p = self.data1.shape[self.axis], self.data1.shape[1-self.axis]
             n2 = self.data2.shape[self.axis]
             max_nperms = sm.comb(n1+n2,n1,exact=1)
-            data = np.concatenate((self.data1,self.data2), self.axis)
-            if self.vardata1 != None:
-                vardata = np.concatenate((self.vardata1,self.vardata2), self.axis)
-        if nperms == None or nperms >= max_nperms:
+        exhaustive = nperms == None or nperms >= max_nperms
+        if exhaustive:
             magic_numbers = np.arange(max_nperms)
         else:
             #magic_numbers = np.random.randint(max_nperms,size=nperms)
@@ -361,15 +446,16 @@ class permutation_test(object):
             magic_numbers = np.random.uniform(max_nperms,size=nperms)
         # Initialize cluster_results
         cluster_results = []
+        neighb = None
         if clusters != None:
+            # The graph of the voxels is built once for all maps
+            if self.XYZ == None:
+                neighb = self.G.compact_neighb()[:2]
+            else:
+                neighb = grid_neighb(self.XYZ)
             for (thresh,diam) in clusters:
-                if diam == None:
-                    if self.XYZ == None:
-                        labels = extract_clusters_from_graph(self.Tvalues,self.G,thresh)
-                    else:
-                        labels = extract_clusters_from_thresh(self.Tvalues,self.XYZ,thresh)
-                else:
-                    labels = extract_clusters_from_diam(self.Tvalues,self.XYZ,thresh,diam)
+                labels = self._extract_clusters(self.Tvalues, thresh, diam,
+                                                neighb)
                 results = {"thresh" : thresh, "diam" : diam, "labels" : labels}
                 size_values, Fisher_values = compute_cluster_stats(self.Tvalues, labels, self.random_Tvalues, cluster_stats)
                 nclust = labels.max() + 1
@@ -401,70 +487,57 @@ class permutation_test(object):
                     results["Fisher_p_values"] = np.zeros(nregions,float)
                     results["Fisher_Corr_p_values"] = np.zeros(nregions,float)
                 region_results.append( results )
-        # Permutation test
+        # Permutation test. Permutations are evaluated by blocks,
+        # which are reduced to summary statistics as they come.
         p_values = np.zeros(p,float)
         Corr_p_values = np.zeros(p,float)
         nmagic = len(magic_numbers)
         perm_maxT_values = np.zeros(nmagic, float)
-        for j in xrange(nmagic):
-            m = magic_numbers[j]
+        starts = range(0, nmagic, block_size)
+        if self.nsamples == 1 and not exhaustive:
+            seeds = np.random.randint(np.iinfo(np.int32).max, size=len(starts))
+        else:
+            seeds = [None] * len(starts)
+        blocks = [(magic_numbers[start:start + block_size], seed) 
+                  for start, seed in zip(starts, seeds)]
+        # Observed statistic as evaluated by the permutation engine, so
+        # that ties with the identity permutation are not broken by
+        # rounding errors
+        if self.nsamples == 1:
+            Tvalues = self._perm_Tvalues(np.zeros(1))[0]
+        else:
+            Tvalues = self.Tvalues
+        calibrate_block = lambda block: self._calibrate_block(
+            Tvalues, block[0], block[1], clusters, cluster_stats, regions, 
+            region_results, region_stats, neighb)
+        summaries = parallel_imap(calibrate_block, blocks, n_jobs)
+        for start, summary in zip(starts, summaries):
+            stop = start + len(summary["perm_maxT_values"])
             if verbose:
-                print "Permutation", j+1, "out of", nmagic
-            # T values under permutation
-            if self.nsamples == 1:
-                #perm_Tvalues = onesample_stat(self.data, self.vardata, self.stat_id, self.base, self.axis, np.array([m]), self.niter).squeeze()
-                rand_sign = (np.random.randint(2,size=n)*2-1).reshape(n,1)
-                rand_data = rand_sign*self.data
-                if self.vardata == None:
-                    rand_vardata = None
-                else:
-                    rand_vardata = rand_sign*self.vardata
-                perm_Tvalues = onesample_stat(rand_data, rand_vardata, self.stat_id, self.base, self.axis, None, self.niter).squeeze()
-            elif self.nsamples == 2:
-                perm_Tvalues = twosample_stat(self.data1, self.vardata1, self.data2, self.vardata2, self.stat_id, self.axis, np.array([m]), self.niter).squeeze()
-                rand_perm = np.random.permutation(np.arange(n1+n2))
-                rand_data1 = data[:n1]
-                rand_data2 = data[n1:]
-                if self.vardata1 == None:
-                    rand_vardata1 = None
-                    rand_vardata2 = None
-                else:
-                    rand_vardata1 = vardata[:n1]
-                    rand_vardata2 = vardata[n1:]
+                print "Permutations", start+1, "to", stop, "out of", nmagic
             # update p values
-            p_values += perm_Tvalues >= self.Tvalues
-            Corr_p_values += max(perm_Tvalues) >= self.Tvalues
-            perm_maxT_values[j] = max(perm_Tvalues)
+            p_values += summary["p_values"]
+            Corr_p_values += summary["Corr_p_values"]
+            perm_maxT_values[start:stop] = summary["perm_maxT_values"]
             # Update cluster_results
             if clusters != None:
                 for i in xrange(len(clusters)):
-                    thresh, diam = clusters[i]
-                    if diam == None:
-                        if self.XYZ == None:
-                            perm_labels = extract_clusters_from_graph(perm_Tvalues,self.G,thresh)
-                        else:
-                            perm_labels = extract_clusters_from_thresh(perm_Tvalues,self.XYZ,thresh)
-                    else:
-                        perm_labels = extract_clusters_from_diam(perm_Tvalues,self.XYZ,thresh,diam)
-                    perm_size_values, perm_Fisher_values = compute_cluster_stats(perm_Tvalues, perm_labels, self.random_Tvalues, cluster_stats)
-                    perm_nclust = labels.max() + 1
-                    cluster_results[i]["expected_voxels_per_thresh"] += perm_size_values.sum()/float(nclust)
-                    cluster_results[i]["expected_number_of_clusters"] += nclust
+                    results = cluster_results[i]
+                    perm_results = summary["cluster_results"][i]
+                    nclust = results["labels"].max() + 1
                     if "size" in cluster_stats:
-                        cluster_results[i]["perm_size_values"][:0] = perm_size_values
-                        cluster_results[i]["perm_maxsize_values"][j] = max(perm_size_values)
+                        results["expected_voxels_per_thresh"] += perm_results["perm_size_values"].sum()/float(nclust)
+                        results["perm_size_values"][:0] = perm_results["perm_size_values"]
+                        results["perm_maxsize_values"][start:stop] = perm_results["perm_maxsize_values"]
+                    results["expected_number_of_clusters"] += nclust * (stop - start)
                     if "Fisher" in cluster_stats:
-                        cluster_results[i]["perm_Fisher_values"][:0] = perm_Fisher_values
-                        cluster_results[i]["perm_maxFisher_values"][j] = max(perm_Fisher_values)
+                        results["perm_Fisher_values"][:0] = perm_results["perm_Fisher_values"]
+                        results["perm_maxFisher_values"][start:stop] = perm_results["perm_maxFisher_values"]
             # Update region_results
             if regions != None:
                 for i in xrange(len(regions)):
-                    labels = regions[i]
-                    label_values = region_results[i]["label_values"]
-                    nregions = len(label_values)
                     if "Fisher" in region_stats:
-                        perm_Fisher_values = compute_region_stat(perm_Tvalues, labels, label_values, self.random_Tvalues)
-                        region_results[i]["perm_Fisher_values"][:,j] = perm_Fisher_values
+                        region_results[i]["perm_Fisher_values"][:,start:stop] = summary["region_results"][i]
         # Compute p-values for clusters summary statistics
         if clusters != None:
             for i in xrange(len(clusters)):
@@ -506,6 +579,92 @@ class permutation_test(object):
 
 
 
+    def _extract_clusters(self, Tvalues, thresh, diam, neighb=None):
+        """
+        Cluster labels of a statistical map for a given extraction
+        pair (thresh, diam), neighb being the compact neighbours
+        representation of the graph of the voxels
+        """
+        if diam == None:
+            if self.XYZ == None:
+                return extract_clusters_from_graph(Tvalues, self.G, thresh,
+                                                   neighb)
+            return extract_clusters_from_thresh(Tvalues, self.XYZ, thresh,
+                                                neighb=neighb)
+        return extract_clusters_from_diam(Tvalues, self.XYZ, thresh, diam,
+                                          neighb=neighb)
+
+
+    def _perm_Tvalues(self, magics, seed=None):
+        """
+        Statistic values under a block of permutations, of shape
+        (nperms, p). Two-sample permutations and exhaustive sign flips
+        are given by magic numbers, random sign flips are drawn from a
+        generator initialized with seed.
+        """
+        if self.nsamples == 2:
+            T = twosample_stat(self.data1, self.vardata1, self.data2, 
+                               self.vardata2, self.stat_id, self.axis, 
+                               np.asarray(magics), self.niter)
+            return np.rollaxis(T, self.axis)
+        Y, V = self.data, self.vardata
+        if self.axis == 1:
+            Y = Y.T
+            if V is not None:
+                V = V.T
+        n = Y.shape[0]
+        if seed is None:
+            signs = sign_patterns(magics, n)
+        else:
+            rng = np.random.RandomState(seed)
+            signs = rng.randint(2, size=(len(magics), n)) * 2 - 1
+        return onesample_perm_stat(Y, V, signs, self.stat_id, self.base, 
+                                   self.niter)
+
+
+    def _calibrate_block(self, Tvalues, magics, seed, clusters, cluster_stats, 
+                         regions, region_results, region_stats, neighb=None):
+        """
+        Evaluate a block of permutations and reduce it to the summary
+        statistics accumulated by calibrate
+        """
+        perm_Tvalues = self._perm_Tvalues(magics, seed)
+        nperm = perm_Tvalues.shape[0]
+        perm_maxT_values = perm_Tvalues.max(1)
+        summary = {
+            "p_values": np.sum(perm_Tvalues >= Tvalues, 0),
+            "Corr_p_values": nperm - np.searchsorted(
+                np.sort(perm_maxT_values), Tvalues),
+            "perm_maxT_values": perm_maxT_values,
+            "cluster_results": [],
+            "region_results": []}
+        if clusters != None:
+            for (thresh, diam) in clusters:
+                sizes, Fishers = [], []
+                for j in xrange(nperm):
+                    perm_labels = self._extract_clusters(perm_Tvalues[j], thresh, diam, neighb)
+                    perm_size_values, perm_Fisher_values = compute_cluster_stats(perm_Tvalues[j], perm_labels, self.random_Tvalues, cluster_stats)
+                    sizes.append(perm_size_values)
+                    Fishers.append(perm_Fisher_values)
+                results = {}
+                if "size" in cluster_stats:
+                    results["perm_size_values"] = np.concatenate(sizes)
+                    results["perm_maxsize_values"] = np.array([s.max() for s in sizes])
+                if "Fisher" in cluster_stats:
+                    results["perm_Fisher_values"] = np.concatenate(Fishers)
+                    results["perm_maxFisher_values"] = np.array([f.max() for f in Fishers])
+                summary["cluster_results"].append(results)
+        if regions != None:
+            for i in xrange(len(regions)):
+                label_values = region_results[i]["label_values"]
+                perm_Fisher_values = np.zeros((len(label_values), nperm))
+                if "Fisher" in region_stats:
+                    for j in xrange(nperm):
+                        perm_Fisher_values[:, j] = compute_region_stat(perm_Tvalues[j], regions[i], label_values, self.random_Tvalues)
+                summary["region_results"].append(perm_Fisher_values)
+        return summary
+
+
     def height_threshold(self, pval):
         """
         Return the uniform height threshold matching a given
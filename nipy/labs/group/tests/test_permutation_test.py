@@ -67,5 +67,55 @@ class test_permutation_test(unittest.TestCase):
         P = pt.permutation_test_twosample(data1, data2, XYZ, vardata1=vardata1, vardata2=vardata2, stat_id="student_mfx", ndraws=ndraws)
         p_values, cluster_results, region_results = P.calibrate(nperms=nperms, clusters=c, regions=r)
 
+    def test_extract_clusters_neighb(self):
+        data, vardata, XYZ = make_data(mask_shape=(6, 6, 6))
+        T = data[0]
+        neighb = pt.grid_neighb(XYZ)
+        for th in [-1, 0, 1]:
+            np.testing.assert_array_equal(
+                pt.extract_clusters_from_thresh(T, XYZ, th),
+                pt.extract_clusters_from_thresh(T, XYZ, th, neighb=neighb))
+            np.testing.assert_array_equal(
+                pt.extract_clusters_from_diam(T, XYZ, th, 3),
+                pt.extract_clusters_from_diam(T, XYZ, th, 3, neighb=neighb))
+        G = wgraph_from_3d_grid(XYZ.T)
+        np.testing.assert_array_equal(
+            pt.extract_clusters_from_graph(T, G, 0),
+            pt.extract_clusters_from_graph(T, G, 0, G.compact_neighb()[:2]))
+
+    def test_onesample_perm_stat(self):
+        data, vardata, XYZ = make_data(n=8, mask_shape=(5, 5, 5))
+        signs = pt.sign_patterns(np.arange(20), 8)
+        for stat_id in ['mean', 'student', 'median', 'wilcoxon']:
+            T = pt.onesample_perm_stat(data, vardata, signs, stat_id)
+            for j in range(signs.shape[0]):
+                Tj = pt.onesample_stat(signs[j].reshape(8, 1) * data, None,
+                                       stat_id).squeeze()
+                np.testing.assert_almost_equal(T[j], Tj)
+
+    def test_calibrate_blocks(self):
+        data, vardata, XYZ = make_data(n=8, mask_shape=(5, 5, 5), axis=1)
+        P = pt.permutation_test_onesample(data, XYZ, axis=1, ndraws=ndraws)
+        c = [(P.random_Tvalues[P.ndraws*(0.5)], None)]
+        r = [np.arange(data.shape[0]) % 3]
+        results = []
+        for block_size, n_jobs in [(7, 1), (7, 3)]:
+            np.random.seed(1)
+            results.append(P.calibrate(
+                    nperms=30, clusters=c, regions=r,
+                    block_size=block_size, n_jobs=n_jobs))
+        (v1, c1, r1), (v2, c2, r2) = results
+        for key in v1:
+            np.testing.assert_array_equal(v1[key], v2[key])
+        np.testing.assert_array_equal(c1[0]['perm_size_values'],
+                                      c2[0]['perm_size_values'])
+        np.testing.assert_array_equal(r1[0]['Fisher_p_values'],
+                                      r2[0]['Fisher_p_values'])
+        # exhaustive permutations
+        voxel_results = P.calibrate(nperms=None, block_size=100)[0]
+        self.assertEqual(voxel_results['perm_maxT_values'].size, 2 ** 8)
+        self.assertTrue((voxel_results['p_values'] > 0).all())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,8 @@ from scipy import ndimage
 from nibabel import load, nifti1, save
 from nibabel.loadsave import read_img_data
 
+from ..utils.parallel import parallel_map
+
 
 ################################################################################
 # Operating on connect component
@@ -353,8 +355,61 @@ def intersect_masks(input_masks, output_filename=None, threshold=0.5, cc=True):
 # Time series extraction
 ################################################################################
 
+def _memmap_volume(data_file, filename):
+    """ Return a read-only memory map on the data of an uncompressed
+        NIfTI file, and its scaling, or None if the data cannot be
+        mapped.
+    """
+    if not filename.lower().endswith('.nii'):
+        return None
+    header = data_file.get_header()
+    if not hasattr(header, 'get_data_offset'):
+        return None
+    try:
+        data = np.memmap(filename, dtype=header.get_data_dtype(), mode='r',
+                         offset=header.get_data_offset(),
+                         shape=header.get_data_shape(), order='F')
+    except (IOError, ValueError):
+        return None
+    slope, inter = header.get_slope_inter()
+    if slope is None:
+        slope = 1.
+    if inter is None:
+        inter = 0.
+    return data, slope, inter
+
+
+def _extract_volume(volume, index, mask, series, smooth_sigma,
+                    ensure_finite):
+    """ Read a volume, clean it, smooth it and store its masked values
+        into the given column of the output array.
+
+        `volume` is either an array or a (memmap, slope, inter) tuple
+        as returned by `_memmap_volume`.
+    """
+    scaled = isinstance(volume, tuple)
+    if scaled:
+        volume, slope, inter = volume
+        scaled = (slope != 1 or inter != 0)
+    if smooth_sigma is None:
+        # Only gather the voxels in the mask
+        data = np.asarray(volume)[mask]
+    else:
+        data = np.array(volume)
+    if scaled:
+        data = data * slope + inter
+    if ensure_finite:
+        # SPM tends to put NaNs in the data outside the brain
+        data[np.logical_not(np.isfinite(data))] = 0
+    data = data.astype(series.dtype)
+    if smooth_sigma is not None:
+        data = ndimage.gaussian_filter(data, smooth_sigma)[mask]
+    series[:, index] = data
+
+
 def series_from_mask(filenames, mask, dtype=np.float32,
-                     smooth=False, ensure_finite=True):
+                     smooth=False, ensure_finite=True, n_jobs=1,
+                     output=None):
     """ Read the time series from the given sessions filenames, using the mask.
 
         Parameters
@@ -369,6 +424,14 @@ def series_from_mask(filenames, mask, dtype=np.float32,
         ensure_finite: boolean
             If ensure_finite is True, the non-finite values (NaNs and infs)
             found in the images will be replaced by zeros
+        n_jobs: int, optional
+            Number of volumes read and smoothed concurrently, in a pool
+            of threads. -1 means all CPUs.
+        output: None, string or ndarray, optional
+            Where to write the time series: if None, a new array is
+            allocated; if a string, a memory-mapped array is created
+            in the file of that name; otherwise, an array of shape
+            (voxel, time), which is filled in place.
 
         Returns
         --------
@@ -381,6 +444,9 @@ def series_from_mask(filenames, mask, dtype=np.float32,
         -----
         When using smoothing, ensure_finite should be True: as elsewhere non
         finite values will spread accross the image.
+
+        Uncompressed nifti files are memory-mapped, so that, without
+        smoothing, only the voxels in the mask are read.
     """
     assert len(filenames) != 0, (
         'filenames should be a file name or a list of file names, '
@@ -389,48 +455,58 @@ def series_from_mask(filenames, mask, dtype=np.float32,
     if smooth:
         # Convert from a sigma to a FWHM:
         smooth /= np.sqrt(8 * np.log(2))
+
+    def smooth_sigma(data_file):
+        if not smooth:
+            return None
+        affine = data_file.get_affine()[:3, :3]
+        vox_size = np.sqrt(np.sum(affine ** 2, axis=0))
+        return smooth / vox_size
+
     if isinstance(filenames, basestring):
-        # We have a 4D nifti file
+        # We have a 4D nifti file: volumes are views on the (mapped)
+        # data
         data_file = load(filenames)
         header = data_file.get_header()
-        series = data_file.get_data()
-        if ensure_finite:
-            # SPM tends to put NaNs in the data outside the brain
-            series[np.logical_not(np.isfinite(series))] = 0
-        series = series.astype(dtype)
-        affine = data_file.get_affine()[:3, :3]
+        sigma = smooth_sigma(data_file)
+        mapped = _memmap_volume(data_file, filenames)
+        if mapped is None:
+            data = data_file.get_data()
+            volumes = [data[..., t] for t in range(data.shape[-1])]
+        else:
+            data, slope, inter = mapped
+            volumes = [(data[..., t], slope, inter)
+                       for t in range(data.shape[-1])]
         del data_file
-        if isinstance(series, np.memmap):
-            series = np.asarray(series).copy()
-        if smooth:
-            vox_size = np.sqrt(np.sum(affine **2, axis=0))
-            smooth_sigma = smooth / vox_size
-            for this_volume in np.rollaxis(series, -1):
-                this_volume[...] = ndimage.gaussian_filter(this_volume,
-                                                        smooth_sigma)
-        series = series[mask]
+        sigmas = [sigma for volume in volumes]
     else:
-        nb_time_points = len(list(filenames))
-        series = np.zeros((mask.sum(), nb_time_points), dtype=dtype)
-        for index, filename in enumerate(filenames):
-            data_file = load(filename)
-            data = data_file.get_data()
-            if ensure_finite:
-                # SPM tends to put NaNs in the data outside the brain
-                data[np.logical_not(np.isfinite(data))] = 0
-            data = data.astype(dtype)
-            if smooth is not False:
-                affine = data_file.get_affine()[:3, :3]
-                vox_size = np.sqrt(np.sum(affine **2, axis=0))
-                smooth_sigma = smooth / vox_size
-                data = ndimage.gaussian_filter(data, smooth_sigma)
-
-            series[:, index] = data[mask]
-            # Free memory early
-            del data
-            if index == 0:
-                header = data_file.get_header()
+        # A list of 3D files, read lazily in the workers
+        filenames = list(filenames)
+        volumes = filenames
+        header = load(filenames[0]).get_header()
+        sigmas = None
+
+    shape = (mask.sum(), len(volumes))
+    if output is None:
+        series = np.zeros(shape, dtype=dtype)
+    elif isinstance(output, basestring):
+        series = np.memmap(output, dtype=dtype, mode='w+', shape=shape)
+    else:
+        series = output
+        if not series.shape == shape:
+            raise ValueError('output should have shape %s' % (shape,))
+
+    def extract(index):
+        if sigmas is None:
+            data_file = load(volumes[index])
+            volume = _memmap_volume(data_file, volumes[index])
+            if volume is None:
+                volume = data_file.get_data()
+            sigma = smooth_sigma(data_file)
+            del data_file
+        else:
+            volume, sigma = volumes[index], sigmas[index]
+        _extract_volume(volume, index, mask, series, sigma, ensure_finite)
 
+    parallel_map(extract, range(len(volumes)), n_jobs=n_jobs)
     return series, header
-
-
@@ -6,6 +6,8 @@ This is meant to provide a unified API to deal with n-d imaged and meshes.
 
 Author: Bertrand Thirion, 2010
 """
+import itertools
+
 import numpy as np
 import scipy.sparse as sp
 
@@ -191,6 +193,52 @@ def reduce_coo_matrix(mat, mask):
 #################################################################
 # Functions to instantiate StructuredDomains
 #################################################################
+def euclidean_ball(coord, centers, radius, tree=None):
+    """Find the points of coord that lie within radius of each center
+
+    Parameters
+    ----------
+    coord: array of shape(n, dim),
+           the coordinates of the points
+    centers: array of shape(p, dim),
+             the coordinates of the centers of the balls
+    radius: float,
+            the radius of the balls
+    tree: scipy.spatial.cKDTree instance, optional,
+          a KD-tree built on coord, to be reused across calls
+
+    Returns
+    -------
+    seed: array of shape(q), type np.int
+          the positions of the centers in centers
+    vertex: array of shape(q), type np.int
+            the points within radius of the corresponding centers
+    dist: array of shape(q),
+          the corresponding euclidean distances
+
+    Note
+    ----
+    The triples are grouped by center, by increasing distance, as in
+    nipy.algorithms.graph.WeightedGraph.geodesic_ball. The KD-tree avoids
+    the computation of the full (p, n) distance matrix.
+    """
+    from scipy.spatial import cKDTree
+    coord = np.reshape(coord, (coord.shape[0], -1))
+    centers = np.reshape(centers, (-1, coord.shape[1]))
+    if tree is None:
+        tree = cKDTree(coord)
+    balls = [tree.query_ball_point(c, radius) for c in centers]
+    sizes = [len(b) for b in balls]
+    nq = sum(sizes)
+    if nq == 0:
+        return np.zeros(0, np.int), np.zeros(0, np.int), np.zeros(0)
+    seed = np.repeat(np.arange(len(balls)), sizes).astype(np.int)
+    vertex = np.fromiter(itertools.chain(*balls), np.int, nq)
+    dist = np.sqrt(np.sum((coord[vertex] - centers[seed]) ** 2, 1))
+    order = np.lexsort((dist, seed))
+    return seed[order], vertex[order], dist[order]
+
+
 def domain_from_binary_array(mask, affine=None, nn=0):
     """Return a StructuredDomain from an n-d array
 
@@ -513,6 +561,33 @@ class DiscreteDomain(object):
         """
         return self.local_volume
 
+    def euclidean_ball(self, centers, radius):
+        """Find the sites of the domain that lie within radius
+        of each center
+
+        Parameters
+        ----------
+        centers: array of shape(p, self.em_dim),
+                 the coordinates of the centers of the balls
+        radius: float,
+                the radius of the balls
+
+        Returns
+        -------
+        seed, vertex, dist: arrays of shape(q),
+                            the (center, site, distance) triples,
+                            see euclidean_ball
+
+        Note
+        ----
+        A KD-tree is built on self.coord at the first call and reused
+        """
+        from scipy.spatial import cKDTree
+        if getattr(self, '_tree_coord', None) is not self.coord:
+            self._tree = cKDTree(self.coord)
+            self._tree_coord = self.coord
+        return euclidean_ball(self.coord, centers, radius, self._tree)
+
     def connected_components(self):
         """returns a labelling of the domain into connected components
         """
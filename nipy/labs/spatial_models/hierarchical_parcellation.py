@@ -8,9 +8,11 @@ Author: Bertrand Thirion, 2008
 
 import numpy as np
 from numpy.random import rand
+from scipy.spatial import cKDTree
 
 from nipy.algorithms.clustering.clustering import kmeans, voronoi
 from .parcellation import MultiSubjectParcellation
+from .discrete_domain import euclidean_ball
 from nipy.algorithms.graph.field import Field
 from nipy.algorithms.graph.graph import wgraph_from_coo_matrix
 
@@ -272,14 +274,18 @@ def _optim_hparcel(feature, domain, graphs, nb_parcel, lamb=1., dmax=10.,
             lseeds = np.zeros(nb_parcel, np.int)
             aux = np.argsort(rand(nb_parcel))
             toto = np.zeros(lac.shape[0])
+            # b.1 speed-up :only take a small ball around each prototype
+            tree = cKDTree(lac)
+            ball_seed, ball_vertex, ball_dist = euclidean_ball(
+                lac, target, dmax, tree)
+            ball_vertex = ball_vertex[ball_dist < dmax]
+            ball_seed = ball_seed[ball_dist < dmax]
+            bounds = np.searchsorted(ball_seed, np.arange(nb_parcel + 1))
             for j in range(nb_parcel):
-                # b.1 speed-up :only take a small ball
                 i = aux[j]
-                dx = lac - target[i]
-                iz = np.nonzero(np.sum(dx ** 2, 1) < dmax ** 2)
-                iz = np.reshape(iz, np.size(iz))
+                iz = np.sort(ball_vertex[bounds[i]:bounds[i + 1]])
                 if np.size(iz) == 0:
-                    iz = np.array([np.argmin(np.sum(dx ** 2, 1))])
+                    iz = np.array([tree.query(target[i])[1]])
 
                 # b.2: anatomical constraints
                 lanat = np.reshape(lac[iz], (np.size(iz),
@@ -296,7 +302,7 @@ def _optim_hparcel(feature, domain, graphs, nb_parcel, lamb=1., dmax=10.,
 
                 # b.4: solution
                 if np.sum(np.isinf(pot)) == np.size(pot):
-                    pot = np.sum(dx[iz] ** 2, 1)
+                    pot = np.sum((lac[iz] - target[i]) ** 2, 1)
 
                 sol = iz[np.argmin(pot)]
                 target[i] = lac[sol]
@@ -11,7 +11,7 @@ import os.path
 
 from nibabel import load, save, Nifti1Image
 
-from nipy.algorithms.clustering.clustering import kmeans
+from nipy.algorithms.clustering.clustering import kmeans, minibatch_kmeans
 from .discrete_domain import grid_domain_from_image
 from .mroi import SubDomains
 from ..mask import intersect_masks
@@ -241,10 +241,13 @@ def fixed_parcellation(mask_image, betas, nbparcel, nn=6, method='ward',
     nn=6: number of nearest neighbors  to define the image topology
           (6, 18 or 26)
     method='ward': clustering method used, to be chosen among
-                   'ward', 'gkm', 'ward_and-gkm'
+                   'ward', 'gkm', 'ward_and-gkm', 'kmeans',
+                   'minibatch_kmeans'
                    'ward': Ward's clustering algorithm
                    'gkm': Geodesic k-means algorithm, random initialization
                    'gkm_and_ward': idem, initialized by Ward's clustering
+                   'kmeans': k-means on the functional and spatial features
+                   'minibatch_kmeans': idem, using mini-batch updates
     write_di: string, topional, write directory.
                     If fullpath is None too, then no file output.
     mu = 10., float: the relative weight of anatomical information
@@ -264,7 +267,8 @@ def fixed_parcellation(mask_image, betas, nbparcel, nn=6, method='ward',
     """
     from nipy.algorithms.graph.field import field_from_coo_matrix_and_data
 
-    if method not in ['ward', 'gkm', 'ward_and_gkm', 'kmeans']:
+    if method not in ['ward', 'gkm', 'ward_and_gkm', 'kmeans',
+                      'minibatch_kmeans']:
         raise ValueError('unknown method')
     if nn not in [6, 18, 26]:
         raise ValueError('nn should be 6,18 or 26')
@@ -293,12 +297,15 @@ def fixed_parcellation(mask_image, betas, nbparcel, nn=6, method='ward',
 
     #step 2: parcellate the data ---------------------------
 
-    if method is not 'kmeans':
+    if method not in ['kmeans', 'minibatch_kmeans']:
         g = field_from_coo_matrix_and_data(domain.topology, feature)
 
     if method == 'kmeans':
         _, u, _ = kmeans(feature, nbparcel)
 
+    if method == 'minibatch_kmeans':
+        _, u, _ = minibatch_kmeans(feature, nbparcel)
+
     if method == 'ward':
         u, _ = g.ward(nbparcel)
 
@@ -12,7 +12,7 @@ from numpy.testing import assert_almost_equal, assert_equal
 from ..discrete_domain import smatrix_from_nd_idx, smatrix_from_3d_array, \
     smatrix_from_nd_array, domain_from_binary_array, domain_from_image, \
     domain_from_mesh, grid_domain_from_binary_array, grid_domain_from_image, \
-    grid_domain_from_shape
+    grid_domain_from_shape, euclidean_ball
 from nibabel import Nifti1Image
 import nibabel.gifti as nbg
 
@@ -270,6 +270,28 @@ def test_integrate_2d():
     assert_almost_equal(ddom.integrate('data'), ts)
 
 
+def test_euclidean_ball():
+    """test the radius-limited euclidean queries against the full distances
+    """
+    toto = np.random.rand(*shape[:3])
+    ddom = domain_from_binary_array(toto > .5)
+    centers = np.array([[1., 2., 3.], [2.5, 0, 1.5]])
+    radius = 2.
+    dist = np.sqrt(((ddom.coord[:, np.newaxis] - centers) ** 2).sum(2)).T
+    seed, vertex, bdist = ddom.euclidean_ball(centers, radius)
+    assert_equal(len(bdist), np.sum(dist <= radius))
+    assert_almost_equal(bdist, dist[seed, vertex])
+    assert (np.diff(seed) >= 0).all()
+    seed2, vertex2, _ = euclidean_ball(ddom.coord, centers, radius)
+    assert_equal(vertex2, vertex)
+    # no point within the balls, or no ball
+    for c, r in ((centers + 100, radius), (np.zeros((0, 3)), radius)):
+        seed, vertex, bdist = euclidean_ball(ddom.coord, c, r)
+        assert_equal(len(seed), 0)
+        assert_equal(len(vertex), 0)
+        assert_equal(len(bdist), 0)
+
+
 if __name__ == "__main__":
     import nose
     nose.run(argv=['', __file__])
@@ -52,7 +52,7 @@ def test_parcel_intra_from_3d_image():
     n_parcel = 10
     nn = 6
     mu = 1.
-    for method in ['ward', 'kmeans', 'gkm']:
+    for method in ['ward', 'kmeans', 'gkm', 'minibatch_kmeans']:
         osp = fixed_parcellation(mask_image, [data_image], n_parcel, nn,
                                     method, tempdir, mu)
         result = join(tempdir, 'parcel_%s.nii' % method)
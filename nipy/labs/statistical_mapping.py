@@ -1,5 +1,7 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
+import os
+
 import numpy as np
 import scipy.stats as sp_stats
 
@@ -8,6 +10,7 @@ from ..algorithms.graph.field import field_from_graph_and_data
 from ..algorithms.graph.graph import wgraph_from_3d_grid
 from ..algorithms.statistics import empirical_pvalue
 from .glm import glm
+from ..utils.parallel import parallel_imap
 from .group.permutation_test import \
      permutation_test_onesample, permutation_test_twosample
 
@@ -15,7 +18,7 @@ from .group.permutation_test import \
 #so that name starts with upper case
 
 # Use the brifti image object
-from nibabel import Nifti1Image as Image
+from nibabel import Nifti1Image as Image, save as save_image
 
 
 ###############################################################################
@@ -363,13 +366,33 @@ def linear_model_fit(data_images, mask_images, design_matrix, vector):
     return zimg
 
 
+def _fit_session(args):
+    """Load, mask and fit the data of one session, see `LinearModel`
+    """
+    data, X, xyz, axis, formula, model, method, niter = args
+    if xyz is None:
+        Y = data.get_data()
+    else:
+        Y = data.get_data()[xyz]
+    return glm(Y, X, axis=axis, formula=formula, model=model,
+               method=method, niter=niter)
+
+
 class LinearModel(object):
+    """Fit of a GLM to one or several sessions of fMRI data.
+
+    The sessions are fitted independently, and their contrasts are
+    summed (fixed effects). With `n_jobs` > 1, the sessions are loaded,
+    masked and fitted in a pool of `n_jobs` processes, so that at most
+    `n_jobs` sessions of data are in memory at a time; images read
+    from files are loaded by the worker processes themselves.
+    """
 
     def_model = 'spherical'
     def_niter = 2
 
     def __init__(self, data, design_matrix, mask=None, formula=None,
-                 model=def_model, method=None, niter=def_niter):
+                 model=def_model, method=None, niter=def_niter, n_jobs=1):
 
         # Convert input data and design into sequences
         if not hasattr(data, '__iter__'):
@@ -392,54 +415,114 @@ class LinearModel(object):
         self.spatial_shape = data[0].get_shape()[0: - 1]
         self.affine = data[0].get_affine()
 
-        self.glm = []
+        sessions = []
         for i in range(len(data)):
             if not isinstance(design_matrix[i], np.ndarray):
                 raise ValueError('Invalid design matrix')
-            if nomask:
-                Y = data[i].get_data()
-            else:
-                Y = data[i].get_data()[self.xyz]
-            X = design_matrix[i]
-
-            self.glm.append(glm(Y, X, axis=self.axis,
-                                formula=formula, model=model,
-                                method=method, niter=niter))
+            sessions.append((data[i], design_matrix[i], self.xyz,
+                             self.axis, formula, model, method, niter))
+        self.glm = list(parallel_imap(_fit_session, sessions,
+                                      n_jobs=n_jobs, backend='process'))
 
-    def dump(self, filename):
+    def dump(self, filename, store=False):
         """Dump GLM fit as npz file.
+
+        If store is True, the fit is dumped as a directory of .npy
+        files that can be memory-mapped, see `glm.save_store`. With
+        several sessions, the fit of session i is dumped to
+        filename + str(i).
         """
         models = len(self.glm)
         if models == 1:
-            self.glm[0].save(filename)
+            fits = [(self.glm[0], filename)]
         else:
-            for i in range(models):
-                self.glm[i].save(filename + str(i))
+            fits = [(self.glm[i], filename + str(i)) for i in range(models)]
+        for g, name in fits:
+            if store:
+                g.save_store(name)
+            else:
+                g.save(name)
 
     def contrast(self, vector):
         """Compute images of contrast and contrast variance.
         """
-        # Compute the overall contrast across models
-        c = self.glm[0].contrast(vector)
+        return self.contrasts([vector])[0]
+
+    def contrasts(self, vectors, type='t', output_dir=None, names=None):
+        """Compute images of several contrasts at once.
+
+        The contrasts are estimated together in each session, see
+        `glm.contrasts`, which is much faster than calling `contrast`
+        for each of them.
+
+        Parameters
+        ----------
+        vectors : sequence
+            contrast vectors (t contrasts) or matrices (F contrasts)
+        type : string or sequence of strings, optional
+            type of each contrast, see `glm.contrast`
+        output_dir : None or string, optional
+            if not None, the images are written to this directory as
+            they are made, as '<name>_effect.nii', '<name>_variance.nii'
+            and '<name>_z_map.nii', and their filenames are returned
+            instead of images. The effects and variances of all the
+            contrasts are computed up front (in the mask), but the
+            full volume images are then made and released one at a
+            time.
+        names : None or sequence of strings, optional
+            names of the contrasts in the output filenames, one per
+            contrast, defaults to 'contrast0', 'contrast1'...
+
+        Returns
+        -------
+        results : list
+            list of (con_img, vcon_img, z_img, dof) tuples, one per
+            contrast. For F contrasts, the effect and variance images
+            have the contrast dimensions as their last axes.
+        """
+        if names is not None and len(names) != len(vectors):
+            raise ValueError('There should be one name per contrast')
+        # Compute the overall contrasts across models
+        cons = self.glm[0].contrasts(vectors, type)
         for g in self.glm[1:]:
-            c += g.contrast(vector)
-
-        def affect_inmask(dest, src, xyz):
-            if xyz == None:
-                dest = src
-            else:
-                dest[xyz] = src
-            return dest
-
-        con = np.zeros(self.spatial_shape)
-        con_img = Image(affect_inmask(con, c.effect, self.xyz), self.affine)
-        vcon = np.zeros(self.spatial_shape)
-        vcon_img = Image(affect_inmask(vcon, c.variance, self.xyz),
-                         self.affine)
-        z = np.zeros(self.spatial_shape)
-        z_img = Image(affect_inmask(z, c.zscore(), self.xyz), self.affine)
-        dof = c.dof
-        return con_img, vcon_img, z_img, dof
+            cons = [c + c1 for c, c1 in zip(cons, g.contrasts(vectors, type))]
+
+        if names is None:
+            names = ['contrast%d' % i for i in range(len(cons))]
+        results = []
+        for name in names:
+            # Release each contrast as soon as it has been output
+            c = cons.pop(0)
+            con_img = self._output(c.effect, output_dir, name, 'effect')
+            vcon_img = self._output(c.variance, output_dir, name,
+                                    'variance')
+            z_img = self._output(c.zscore(), output_dir, name, 'z_map')
+            results.append((con_img, vcon_img, z_img, c.dof))
+        return results
+
+    def _output(self, x, output_dir, name, label):
+        """Make an image of the array x, whose last axes are the
+        voxels, and save it if output_dir is not None.
+        """
+        x = np.asarray(x)
+        if self.xyz is None:
+            nvox = len(self.spatial_shape)
+        else:
+            nvox = 1
+        # Put the contrast dimensions, if any, last
+        lead = x.ndim - nvox
+        x = x.transpose(range(lead, x.ndim) + range(lead))
+        if self.xyz is None:
+            data = x
+        else:
+            data = np.zeros(self.spatial_shape + x.shape[1:])
+            data[self.xyz] = x
+        img = Image(data, self.affine)
+        if output_dir is None:
+            return img
+        filename = os.path.join(output_dir, '%s_%s.nii' % (name, label))
+        save_image(img, filename)
+        return filename
 
 
 ###############################################################################
@@ -16,7 +16,7 @@ from ..mask import largest_cc, threshold_connect_components, \
         series_from_mask
 
 from nipy.testing import assert_equal, assert_true, \
-    assert_array_equal, anatfile
+    assert_array_equal, assert_array_almost_equal, anatfile
 
 
 def test_largest_cc():
@@ -90,6 +90,47 @@ def test_series_from_mask():
         assert_true(np.all(np.isfinite(series)))
 
 
+def test_series_from_mask_sources():
+    """ Check that mapped, compressed, 3D and 4D files, read serially
+        or in parallel, give the same time series
+    """
+    # Floating point data stored as integers, so that the data are
+    # scaled
+    data = 100 * np.random.randn(10, 11, 12, 3)
+    mask = np.random.rand(10, 11, 12) > .5
+    with InTemporaryDirectory():
+        img = nib.Nifti1Image(data, np.eye(4))
+        img.get_header().set_data_dtype(np.int16)
+        nib.save(img, 'fourd.nii')
+        nib.save(img, 'fourd.nii.gz')
+        expected = {}
+        expected['4d'] = nib.load('fourd.nii.gz').get_data()[mask]
+        expected['3d'] = np.zeros(expected['4d'].shape)
+        filenames = []
+        for t in range(data.shape[3]):
+            img = nib.Nifti1Image(data[..., t], np.eye(4))
+            img.get_header().set_data_dtype(np.int16)
+            filenames.append('vol%d.nii' % t)
+            nib.save(img, filenames[-1])
+            expected['3d'][:, t] = nib.load(filenames[-1]).get_data()[mask]
+        filenames[-1] = filenames[-1] + '.gz'
+        nib.save(img, filenames[-1])
+        for source, kind in (('fourd.nii', '4d'), ('fourd.nii.gz', '4d'),
+                             (filenames, '3d')):
+            for n_jobs in (1, 2):
+                series, header = series_from_mask(source, mask,
+                                                  n_jobs=n_jobs)
+                yield assert_array_almost_equal, series, expected[kind], 4
+        series, header = series_from_mask(filenames, mask, output='out.dat')
+        yield assert_true, isinstance(series, np.memmap)
+        yield assert_array_almost_equal, series, expected['3d'], 4
+        # Smoothed series should not depend on the way data are read
+        ref, header = series_from_mask('fourd.nii.gz', mask, smooth=3)
+        series, header = series_from_mask('fourd.nii', mask, smooth=3,
+                                          n_jobs=2)
+        yield assert_array_almost_equal, series, ref, 4
+        del series
+
 
 if __name__ == "__main__":
     import nose
@@ -1,11 +1,18 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
+from __future__ import with_statement
+
+import os
+
 import numpy as np
+from numpy.testing import assert_array_almost_equal
+from nose.tools import assert_raises
 
-from nibabel import Nifti1Image
+from nibabel import Nifti1Image, load, save
+from nibabel.tmpdirs import InTemporaryDirectory
 from ..utils.simul_multisubject_fmri_dataset import \
     surrogate_2d_dataset
-from ..statistical_mapping import cluster_stats
+from ..statistical_mapping import cluster_stats, LinearModel
 
 def make_surrogate_data():
     """ Return a single deterministic 3D image 
@@ -66,6 +73,82 @@ def test_8():
     clusters, info = cluster_stats(img, img, height_th=.001, height_control='fpr', cluster_th=0, nulls={})
     nstv = sum([c['size'] for c in clusters])
     assert nstv==36
+
+
+def make_fmri_data(n_sessions=2):
+    """ Return 4D images, design matrices and a mask
+    """
+    shape = (5, 6, 4)
+    n_scans = 30
+    data, design = [], []
+    for i in range(n_sessions):
+        data.append(Nifti1Image(np.random.randn(*(shape + (n_scans,))),
+                                np.eye(4)))
+        design.append(np.c_[np.random.randn(n_scans, 2), np.ones(n_scans)])
+    mask = np.zeros(shape)
+    mask[1:4, 1:5] = 1
+    return data, design, Nifti1Image(mask, np.eye(4))
+
+
+def test_linear_model_contrasts():
+    data, design, mask = make_fmri_data()
+    vectors = [[1, 0, 0], [1, -1, 0], [[1, 0, 0], [0, 1, 0]]]
+    for m in (mask, None):
+        lm = LinearModel(data, design, mask=m)
+        results = lm.contrasts(vectors, type=['t', 't', 'F'])
+        assert len(results) == 3
+        # Same as separate contrasts
+        for vector, (con, vcon, z, dof) in zip(vectors[:2], results):
+            con1, vcon1, z1, dof1 = lm.contrast(vector)
+            assert_array_almost_equal(con.get_data(), con1.get_data())
+            assert_array_almost_equal(vcon.get_data(), vcon1.get_data())
+            assert_array_almost_equal(z.get_data(), z1.get_data())
+            assert dof == dof1
+        con, vcon, z, dof = results[2]
+        assert con.shape == (5, 6, 4, 2)
+        assert vcon.shape == (5, 6, 4, 2, 2)
+        assert z.shape == (5, 6, 4)
+        assert_array_almost_equal(con.get_data()[..., 0],
+                                  results[0][0].get_data())
+
+
+def test_linear_model_contrasts_output():
+    data, design, mask = make_fmri_data(1)
+    lm = LinearModel(data, design, mask=mask)
+    vectors = [[1, 0, 0], [0, 1, 0]]
+    with InTemporaryDirectory() as tmpdir:
+        results = lm.contrasts(vectors, output_dir=tmpdir,
+                               names=['a', 'b'])
+        con, vcon, z, dof = results[1]
+        assert con == os.path.join(tmpdir, 'b_effect.nii')
+        assert_array_almost_equal(load(z).get_data(),
+                                  lm.contrast([0, 1, 0])[2].get_data())
+        for names in (['a'], ['a', 'b', 'c']):
+            assert_raises(ValueError, lm.contrasts, vectors,
+                          output_dir=tmpdir, names=names)
+
+
+
+def test_linear_model_parallel():
+    data, design, mask = make_fmri_data(3)
+    vector = [1, -1, 0]
+    with InTemporaryDirectory():
+        # Sessions read from files, and in memory
+        for i, img in enumerate(data[:2]):
+            save(img, 'session%d.nii' % i)
+            data[i] = load('session%d.nii' % i)
+        for model in ('spherical', 'ar1'):
+            lm = LinearModel(data, design, mask=mask, model=model)
+            lm1 = LinearModel(data, design, mask=mask, model=model,
+                              n_jobs=2)
+            assert len(lm1.glm) == 3
+            for g, g1 in zip(lm.glm, lm1.glm):
+                assert_array_almost_equal(g.beta, g1.beta)
+            for x, x1 in zip(lm.contrast(vector)[:3],
+                             lm1.contrast(vector)[:3]):
+                assert_array_almost_equal(x.get_data(), x1.get_data())
+        del data
+
  
 if __name__ == "__main__":
     import nose
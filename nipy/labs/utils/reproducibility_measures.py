@@ -19,6 +19,7 @@ Bertrand Thirion, 2009-2010
 """
 
 import numpy as np
+from nipy.algorithms.graph.graph import subgraph_cc
 from nipy.labs.spatial_models.discrete_domain import \
     grid_domain_from_binary_array
 
@@ -72,20 +73,15 @@ def cluster_threshold(stat_map, domain, th, csize):
     if stat_map.shape[0] != domain.size:
         raise ValueError('incompatible dimensions')
 
-    # first build a domain of supra_threshold regions
-    thresholded_domain = domain.mask(stat_map > th)
-
-    # get the connected components
-    label = thresholded_domain.connected_components()
-
-    binary = - np.ones(domain.size)
-    binary[stat_map > th] = label
-    nbcc = len(np.unique(label))
-    for i in range(nbcc):
-        if np.sum(label == i) < csize:
-            binary[binary == i] = - 1
+    # get the connected components of the supra-threshold regions
+    # directly from the domain topology
+    topology = domain.topology.tocsr()
+    label = subgraph_cc(topology.indptr, topology.indices, stat_map > th)
 
-    binary = (binary > -1)
+    binary = label > -1
+    if binary.any():
+        size = np.bincount(label[binary])
+        binary[binary] = size[label[binary]] >= csize
     return binary
 
 
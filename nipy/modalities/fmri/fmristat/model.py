@@ -18,7 +18,9 @@ similar AR coefficients at once.
 
 import copy
 
+import os
 import os.path as path
+import tempfile
 
 import numpy as np
 import scipy.linalg as spl
@@ -28,11 +30,13 @@ from nipy.algorithms.statistics.models.regression import (
 from nipy.algorithms.statistics.formula import make_recarray
 
 # nipy core imports
-from nipy.core.api import Image, parcels, matrix_generator, AffineTransform
+from nipy.core.api import Image, matrix_generator, AffineTransform
 
 # nipy IO imports
 from nipy.io.api import save_image
 
+from nipy.utils.parallel import parallel_imap
+
 # fmri imports
 from ..api import FmriImageList, axis0_generator
 
@@ -49,16 +53,58 @@ class ModelOutputImage(object):
     The __getitem__ and __setitem__ calls are delegated to a private
     Image.  An exception is raised if trying to get/set data after the
     data has been saved to disk.
+
+    By default, the values are held in a raw memory-mapped file,
+    preallocated next to `filename`, rather than in memory, so that
+    several outputs, such as 4D residuals, can be filled at once
+    without holding them all in RAM.  The raw file is converted to an
+    image file by 'save', and removed.
     """
 
-    def __init__(self, filename, coordmap, shape, clobber=False):
+    def __init__(self, filename, coordmap, shape, clobber=False,
+                 dtype=np.float64, memmap=True):
+        """
+        Parameters
+        ----------
+        filename : str
+            name of the image file written by 'save'
+        coordmap : ``CoordinateMap``
+            coordinate map of the output image
+        shape : tuple
+            shape of the output image
+        clobber : bool, optional
+            if True, overwrite an existing `filename` when saving
+        dtype : dtype, optional
+            data type of the stored values, and of the saved image,
+            for instance np.float32 to halve the disk and memory use.
+        memmap : bool, optional
+            if True, store the values in a temporary memory-mapped file
+            in the directory of `filename`, otherwise in memory.
+        """
         self.filename = filename
-        self._im_data = np.zeros(shape)
+        self._datafile = None
+        if memmap:
+            fd, self._datafile = tempfile.mkstemp(
+                suffix='.dat', dir=path.dirname(path.abspath(filename)))
+            os.close(fd)
+            self._im_data = np.memmap(self._datafile, dtype=dtype,
+                                      mode='w+', shape=tuple(shape))
+        else:
+            self._im_data = np.zeros(shape, dtype=dtype)
         self._im = Image(self._im_data, coordmap)
         # Using a dangerous undocumented API here
         self.clobber = clobber
         self._flushed = False
 
+    def flush(self):
+        """
+        Write the values set so far to the memory-mapped file, if any
+        """
+        if self._flushed:
+            return
+        if isinstance(self._im_data, np.memmap):
+            self._im_data.flush()
+
     def save(self):
         """
         Save current Image data to disk
@@ -68,6 +114,21 @@ class ModelOutputImage(object):
         save_image(self._im, self.filename)
         self._flushed = True
         del(self._im)
+        del(self._im_data)
+        self._remove_datafile()
+
+    def _remove_datafile(self):
+        if self._datafile is not None and path.exists(self._datafile):
+            os.remove(self._datafile)
+        self._datafile = None
+
+    def __del__(self):
+        # Do not leave the raw file behind if the image is never saved
+        if getattr(self, '_datafile', None) is not None:
+            if hasattr(self, '_im'):
+                del(self._im)
+                del(self._im_data)
+            self._remove_datafile()
 
     def __getitem__(self, item):
         if self._flushed:
@@ -101,6 +162,48 @@ def model_generator(formula, data, volume_start_times, iterable=None,
         yield indexer, indexed_data, rmodel
 
 
+def rho_bins(rho, exclude=np.inf):
+    """ Group the voxels of `rho` by value
+
+    The voxels are sorted by value once, so that the cost does not
+    depend on the number of distinct values.
+
+    Parameters
+    ----------
+    rho : array
+        array of (rounded) AR coefficients
+    exclude : float, optional
+        value of the voxels to leave out, in addition to the non-finite
+        (NaN or infinite) voxels
+
+    Returns
+    -------
+    bins : list
+        list of ``(value, indexer)`` tuples, where ``indexer`` is a
+        tuple of index arrays, one per axis of `rho`, of the voxels
+        having that value, in C order.
+    """
+    rho = np.asarray(rho)
+    flat = rho.ravel()
+    voxels = np.nonzero(np.isfinite(flat) & (flat != exclude))[0]
+    voxels = voxels[np.argsort(flat[voxels], kind='mergesort')]
+    values = flat[voxels]
+    bounds = np.concatenate(([0], np.nonzero(np.diff(values))[0] + 1,
+                             [voxels.size]))
+    bins = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if stop == start:
+            continue
+        # Index arrays of the voxels along each axis
+        remainder = voxels[start:stop]
+        indexer = []
+        for dim in rho.shape[::-1]:
+            indexer.insert(0, remainder % dim)
+            remainder = remainder // dim
+        bins.append((values[start], tuple(indexer)))
+    return bins
+
+
 def results_generator(model_iterable):
     """
     Generator for results from an iterator that returns
@@ -196,10 +299,13 @@ class AR1(object):
        ``np.asarray(rho)``, and having attribute ``coordmap``
     outputs :
     volume_start_times : 
+    n_jobs : int, optional
+       number of groups of voxels fitted concurrently, in a pool of
+       threads
     """
 
     def __init__(self, fmri_image, formula, rho, outputs=[],
-                 volume_start_times=None):
+                 volume_start_times=None, n_jobs=1):
         self.fmri_image = fmri_image
         self.data = np.asarray(fmri_image)
         self.formula = formula
@@ -215,20 +321,36 @@ class AR1(object):
             self.volume_start_times = self.fmri_image.volume_start_times
         else:
             self.volume_start_times = volume_start_times
+        self.n_jobs = n_jobs
+        # AR models (whitened design and its pseudo-inverse) by rho
+        self._models = {}
+
+    def model(self, rho):
+        """ Return the (cached) AR model with coefficient `rho`
+        """
+        if not rho in self._models:
+            if not hasattr(self, '_design'):
+                vst = make_recarray(
+                    np.asarray(self.volume_start_times).astype(float), 't')
+                self._design = self.formula.design(vst, return_float=True)
+            self._models[rho] = ARModel(self._design, rho)
+        return self._models[rho]
 
     def execute(self):
+        # The voxels of each group of constant rho are gathered with a
+        # single fancy indexing, and fitted with the same model
+        bins = rho_bins(self.rho.get_data())
+        # Build the models serially, fit concurrently
+        for rho, indexer in bins:
+            self.model(rho)
 
-        iterable = parcels(self.rho, exclude=[np.inf])
-        def model_params(i):
-            return (np.asarray(self.rho)[i].mean(),)
-        # Generates indexer, data, model
-        m = model_generator(self.formula, self.data,
-                            self.volume_start_times,
-                            iterable=iterable,
-                            model_type=ARModel,
-                            model_params=model_params)
-        # Generates indexer, data, 2D results
-        r = results_generator(m)
+        def fit(bin):
+            rho, indexer = bin
+            data = self.data[(slice(None),) + indexer]
+            return indexer, self._models[rho].fit(data)
+
+        # Generates indexer, 2D results
+        r = parallel_imap(fit, bins, n_jobs=self.n_jobs)
 
         def reshape(i, x):
             """
@@ -238,7 +360,8 @@ class AR1(object):
 
             These passes are:
               i) 'slices through the z-axis'
-              ii) 'parcels of approximately constant AR1 coefficient'
+              ii) 'parcels of approximately constant AR1 coefficient',
+              indexed by tuples of index arrays
             """
             if len(x.shape) == 2: # 2D imput matrix
                 if type(i) is type(1): # integer indexing
@@ -261,7 +384,7 @@ class AR1(object):
 
 
 def output_T(outbase, contrast, fmri_image, effect=True, sd=True, t=True,
-             clobber=False):
+             clobber=False, dtype=np.float64):
     """ Return t contrast regression outputs list for `contrast`
 
     Parameters
@@ -284,6 +407,8 @@ def output_T(outbase, contrast, fmri_image, effect=True, sd=True, t=True,
         whether to write a t image
     clobber : {False, True}, optional
         whether to overwrite images that exist.
+    dtype : dtype, optional
+        data type of the output images
 
     Returns
     -------
@@ -302,25 +427,26 @@ def output_T(outbase, contrast, fmri_image, effect=True, sd=True, t=True,
     if effect:
         effectim = ModelOutputImage(build_filename('effect'),
                                     fmri_image[0].coordmap,
-                                    fmri_image[0].shape, clobber=clobber)
+                                    fmri_image[0].shape, clobber=clobber,
+                                    dtype=dtype)
     else:
         effectim = None
     if sd:
         sdim = ModelOutputImage(build_filename('sd'),
                                 fmri_image[0].coordmap, fmri_image[0].shape,
-                                clobber=clobber)
+                                clobber=clobber, dtype=dtype)
     else:
         sdim = None
     if t:
         tim = ModelOutputImage(build_filename('t'),
                                fmri_image[0].coordmap,fmri_image[0].shape,
-                               clobber=clobber)
+                               clobber=clobber, dtype=dtype)
     else:
         tim = None
     return outputters.TOutput(contrast, effect=effectim, sd=sdim, t=tim)
 
 
-def output_F(outfile, contrast, fmri_image, clobber=False):
+def output_F(outfile, contrast, fmri_image, clobber=False, dtype=np.float64):
     ''' output F statistic images
 
     Parameters
@@ -334,6 +460,8 @@ def output_F(outfile, contrast, fmri_image, clobber=False):
         ``coordmap``
     clobber : bool
         if True, overwrites previous output; if False, raises error
+    dtype : dtype, optional
+        data type of the output images
 
     Returns
     -------
@@ -343,12 +471,12 @@ def output_F(outfile, contrast, fmri_image, clobber=False):
         ``obj[slice_spec] = arr`` type slicing.
     '''
     f = ModelOutputImage(outfile, fmri_image[0].coordmap, fmri_image[0].shape,
-                         clobber=clobber)
+                         clobber=clobber, dtype=dtype)
     return outputters.RegressionOutput(f, lambda x:
                                        outputters.output_F(x, contrast))
 
 
-def output_AR1(outfile, fmri_image, clobber=False):
+def output_AR1(outfile, fmri_image, clobber=False, dtype=np.float64):
     """
     Create an output file of the AR1 parameter from the OLS pass of
     fmristat.
@@ -360,17 +488,20 @@ def output_AR1(outfile, fmri_image, clobber=False):
        object such that ``object[0]`` has attributes ``coordmap`` and ``shape``
     clobber : bool
        if True, overwrite previous output
+    dtype : dtype, optional
+       data type of the output image
 
     Returns
     -------
     regression_output : ``RegressionOutput`` instance
     """
     outim = ModelOutputImage(outfile, fmri_image[0].coordmap,
-                             fmri_image[0].shape, clobber=clobber)
+                             fmri_image[0].shape, clobber=clobber,
+                             dtype=dtype)
     return outputters.RegressionOutput(outim, outputters.output_AR1)
 
 
-def output_resid(outfile, fmri_image, clobber=False):
+def output_resid(outfile, fmri_image, clobber=False, dtype=np.float64):
     """
     Create an output file of the residuals parameter from the OLS pass of
     fmristat.
@@ -389,6 +520,8 @@ def output_resid(outfile, fmri_image, clobber=False):
        If 4D image, use the images coordmap and shape
     clobber : bool
        if True, overwrite previous output
+    dtype : dtype, optional
+       data type of the output image
 
     Returns
     -------
@@ -413,7 +546,8 @@ def output_resid(outfile, fmri_image, clobber=False):
     else:
         raise ValueError, "expecting FmriImageList or 4d Image"
 
-    outim = ModelOutputImage(outfile, cmap, shape, clobber=clobber)
+    outim = ModelOutputImage(outfile, cmap, shape, clobber=clobber,
+                             dtype=dtype)
     return outputters.RegressionOutput(outim, outputters.output_resid)
 
 
@@ -1,6 +1,8 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 
+import os
+
 import numpy as np
 
 from nipy.io.api import load_image
@@ -43,6 +45,39 @@ def test_model_out_img():
         del new_img
 
 
+def test_model_out_img_memmap():
+    # Values are held in a raw memmap until saving, in the requested type
+    cmap = load_image(anatfile).coordmap
+    shape = (2,3,4)
+    with InTemporaryDirectory():
+        moi = ModelOutputImage('myfile.nii', cmap, shape, dtype=np.float32)
+        assert_true(isinstance(moi._im_data, np.memmap))
+        assert_equal(moi._im_data.dtype, np.float32)
+        datafile = moi._datafile
+        assert_true(os.path.exists(datafile))
+        moi[0] = 1.5
+        moi.flush()
+        assert_array_equal(np.memmap(datafile, dtype=np.float32,
+                                     shape=shape)[0], 1.5)
+        moi.save()
+        assert_true(not os.path.exists(datafile))
+        new_img = load_image('myfile.nii')
+        assert_equal(new_img.get_data().dtype, np.float32)
+        assert_array_equal(new_img.get_data()[0], 1.5)
+        assert_array_equal(new_img.get_data()[1], 0)
+        del new_img
+        # The raw file is removed with an unsaved image
+        moi = ModelOutputImage('other.nii', cmap, shape)
+        datafile = moi._datafile
+        del moi
+        assert_true(not os.path.exists(datafile))
+        # In memory storage
+        moi = ModelOutputImage('mem.nii', cmap, shape, memmap=False)
+        assert_true(not isinstance(moi._im_data, np.memmap))
+        moi.save()
+        assert_array_equal(load_image('mem.nii').get_data(), 0)
+
+
 def test_run():
     ar1_fname = 'ar1_out.nii'
     funcim = load_image(funcfile)
@@ -124,3 +159,40 @@ def test_ar_modeling():
     assert_true(np.all(np.abs(rhos <= 1)))
     rhos2 = ar_bias_correct(results, 2)
     assert_array_almost_equal(rhos, rhos2, 8)
+
+
+def test_rho_bins():
+    rho = np.array([[0.1, np.inf, 0.2],
+                    [0.2, 0.1, 0.1]])
+    bins = model.rho_bins(rho)
+    assert_equal([value for value, indexer in bins], [0.1, 0.2])
+    # Voxels of each bin, in C order, as with a boolean mask
+    for value, indexer in bins:
+        for i, index in enumerate(np.nonzero(rho == value)):
+            assert_array_equal(indexer[i], index)
+    assert_equal(model.rho_bins(np.zeros((2, 2)) + np.inf), [])
+    # NaN voxels are left out too
+    rho[0, 0] = np.nan
+    rho[1, 2] = np.nan
+    bins = model.rho_bins(rho)
+    assert_equal([value for value, indexer in bins], [0.1, 0.2])
+    assert_array_equal(bins[0][1][1], [1])
+    assert_equal(model.rho_bins(np.zeros((2, 2)) + np.nan), [])
+
+
+def test_ar1_parallel():
+    funcim = load_image(funcfile)
+    fmriims = FmriImageList.from_image(funcim, volume_start_times=2.)
+    t = Term('t')
+    f = Formula([t, t**2, 1])
+    with InTemporaryDirectory():
+        ols = model.OLS(fmriims, f, [model.output_AR1('ar1.nii', fmriims)])
+        ols.execute()
+        rho = load_image('ar1.nii')
+        for n_jobs in (1, 2):
+            outputs = [model.output_resid('resid%d.nii' % n_jobs, fmriims)]
+            ar = model.AR1(fmriims, f, rho, outputs, n_jobs=n_jobs)
+            ar.execute()
+        assert_array_equal(load_image('resid1.nii').get_data(),
+                           load_image('resid2.nii').get_data())
+        del rho
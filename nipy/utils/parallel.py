@@ -0,0 +1,84 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+""" Utilities to spread independent computations over a pool of workers
+"""
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+
+def effective_n_jobs(n_jobs=1):
+    """ Return the number of workers corresponding to `n_jobs`
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        number of workers; negative values count backwards from the
+        number of CPUs, so that -1 means all CPUs, -2 all CPUs but
+        one, etc.
+
+    Returns
+    -------
+    n : int
+        number of workers, at least 1
+    """
+    if n_jobs == 0:
+        raise ValueError('n_jobs cannot be zero')
+    if n_jobs < 0:
+        n_jobs = multiprocessing.cpu_count() + 1 + n_jobs
+    return max(int(n_jobs), 1)
+
+
+def _make_pool(n_workers, backend):
+    if backend == 'thread':
+        return ThreadPool(n_workers)
+    elif backend == 'process':
+        return multiprocessing.Pool(n_workers)
+    raise ValueError('Unknown backend')
+
+
+def parallel_map(func, args, n_jobs=1, backend='thread'):
+    """ Apply `func` to each item of `args`, possibly in parallel
+
+    Parameters
+    ----------
+    func : callable
+        function of one argument
+    args : sequence
+        arguments to which `func` is applied
+    n_jobs : int, optional
+        number of workers, see `effective_n_jobs`. If 1, `func` is
+        applied serially in the calling thread.
+    backend : {'thread', 'process'}, optional
+        use a pool of threads, which is appropriate when `func` spends
+        its time in code that releases the GIL (BLAS, compiled loops),
+        or a pool of processes, in which case `func` and `args` must be
+        picklable.
+
+    Returns
+    -------
+    results : list
+        ``func(arg)`` for each item of `args`, in the same order
+    """
+    return list(parallel_imap(func, args, n_jobs, backend))
+
+
+def parallel_imap(func, args, n_jobs=1, backend='thread'):
+    """ Iterate over ``func(arg)`` for each item of `args`, in order
+
+    Same as `parallel_map`, except that results are yielded as soon as
+    they are available, so that they can be reduced on the fly rather
+    than all held in memory.
+    """
+    args = list(args)
+    n_workers = min(effective_n_jobs(n_jobs), len(args))
+    if n_workers <= 1:
+        for arg in args:
+            yield func(arg)
+        return
+    pool = _make_pool(n_workers, backend)
+    try:
+        for result in pool.imap(func, args):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,37 @@
+""" Testing parallel module
+"""
+import multiprocessing
+
+from ..parallel import effective_n_jobs, parallel_map, parallel_imap
+
+from nose.tools import assert_equal, assert_raises
+
+
+def _square(x):
+    return x ** 2
+
+
+def test_effective_n_jobs():
+    assert_equal(effective_n_jobs(1), 1)
+    assert_equal(effective_n_jobs(3), 3)
+    assert_equal(effective_n_jobs(-1), multiprocessing.cpu_count())
+    assert_raises(ValueError, effective_n_jobs, 0)
+
+
+def test_parallel_map():
+    args = range(10)
+    expected = [_square(x) for x in args]
+    for n_jobs in (1, 2, 4):
+        for backend in ('thread', 'process'):
+            assert_equal(parallel_map(_square, args, n_jobs, backend),
+                         expected)
+    assert_equal(parallel_map(_square, [], 4), [])
+    assert_raises(ValueError, parallel_map, _square, args, 2, 'mpi')
+
+
+def test_parallel_imap():
+    args = range(10)
+    for n_jobs in (1, 3):
+        it = parallel_imap(_square, args, n_jobs)
+        assert_equal(it.next(), 0)
+        assert_equal(list(it), [_square(x) for x in args[1:]])